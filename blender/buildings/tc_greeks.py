@@ -13,14 +13,28 @@ Modern:        Greek modernist — white concrete, geometric forms, open terrace
 Digital:       Futuristic Greek — floating marble columns, holographic Parthenon outline, glass cella, energy beams between pillars
 """
 
-import bpy
-import bmesh
 import math
 import sys
 import os
+import numpy as np
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from lib.geometry import bmesh_box, bmesh_prism, bmesh_cone, pyramid_roof, mesh_from_pydata
+from lib.geometry import (bmesh_box, box_factory, bmesh_prism, bmesh_cone, bmesh_cylinder, uv_sphere,
+                          pyramid_roof, pyramid_roof_arrays, mesh_instances, mesh_from_pydata,
+                          mesh_from_arrays, face_loops, frustum_arrays, ring_table, release_all,
+                          extrude_ring, rect_xy, merged_boxes, box_arrays, boxes_arrays,
+                          bevel_arrays, new_scope, set_scope)
+from lib.plan import planned
+
+
+# Face topology of the fixed-shape meshes, flattened once for mesh_from_arrays
+_TRI_FACES = face_loops([(0, 1, 2)])
+_QUAD_FACES = face_loops([(0, 1, 2, 3)])
+_CORBEL_FACES = face_loops([(0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1),
+                            (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0)])
+_BASTION_FACES = face_loops([(0, 1, 2, 3), (4, 7, 6, 5), (0, 1, 5, 4),
+                             (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)])
+_TEMPLE_ROOF_FACES = face_loops([(0, 3, 5, 4), (1, 2, 5, 4), (0, 1, 4), (2, 3, 5)])
 
 
 # ----------------------------------------------------------------
@@ -31,18 +45,12 @@ def _doric_column(name, origin, radius, height, mat, segments=12, fluting=True):
     Creates shaft + abacus (flat cap block)."""
     ox, oy, oz = origin
     # Shaft
-    bpy.ops.mesh.primitive_cylinder_add(vertices=segments, radius=radius, depth=height,
-                                        location=(ox, oy, oz + height / 2))
-    shaft = bpy.context.active_object
-    shaft.name = f"{name}_shaft"
-    shaft.data.materials.append(mat)
-    for p in shaft.data.polygons:
-        p.use_smooth = True
+    bmesh_cylinder(f"{name}_shaft", radius, height, segments, (ox, oy, oz + height / 2), mat,
+                   smooth=True)
     # Abacus (square cap)
     cap_size = radius * 2.4
     bmesh_box(f"{name}_cap", (cap_size, cap_size, radius * 0.4),
               (ox, oy, oz + height + radius * 0.2), mat)
-    return shaft
 
 
 def _ionic_column(name, origin, radius, height, mat, segments=14):
@@ -52,27 +60,16 @@ def _ionic_column(name, origin, radius, height, mat, segments=14):
     bmesh_prism(f"{name}_base", radius * 1.4, radius * 0.3, segments,
                 (ox, oy, oz), mat)
     # Shaft
-    bpy.ops.mesh.primitive_cylinder_add(vertices=segments, radius=radius, depth=height,
-                                        location=(ox, oy, oz + radius * 0.3 + height / 2))
-    shaft = bpy.context.active_object
-    shaft.name = f"{name}_shaft"
-    shaft.data.materials.append(mat)
-    for p in shaft.data.polygons:
-        p.use_smooth = True
+    bmesh_cylinder(f"{name}_shaft", radius, height, segments,
+                   (ox, oy, oz + radius * 0.3 + height / 2), mat, smooth=True)
     cap_z = oz + radius * 0.3 + height
     # Capital block
     bmesh_box(f"{name}_cap", (radius * 2.6, radius * 2.6, radius * 0.3),
               (ox, oy, cap_z + radius * 0.15), mat)
     # Volute scrolls (small cylinders on sides)
     for dy in [-radius * 1.2, radius * 1.2]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=radius * 0.35, depth=radius * 0.15,
-                                            location=(ox, oy + dy, cap_z + radius * 0.15))
-        vol = bpy.context.active_object
-        vol.name = f"{name}_volute_{dy:.2f}"
-        vol.data.materials.append(mat)
-        for p in vol.data.polygons:
-            p.use_smooth = True
-    return shaft
+        bmesh_cylinder(f"{name}_volute_{dy:.2f}", radius * 0.35, radius * 0.15, 8,
+                       (ox, oy + dy, cap_z + radius * 0.15), mat, smooth=True)
 
 
 def _pediment(name, width, height, depth, origin, mat):
@@ -117,6 +114,13 @@ def _meander_strip(name, length, origin, mat, axis='x'):
                       (ox, oy + t + step / 2, oz + h / 2), mat)
 
 
+def _rect_frame(name, w, d, hx, hy, z, thickness, mat):
+    """Rectangular outline as one mesh: bars of length w at y = +-hy, bars of length d at x = +-hx."""
+    t = thickness
+    merged_boxes(name, [(w, t, t), (w, t, t), (t, d, t), (t, d, t)],
+                 [(0, -hy, z), (0, hy, z), (-hx, 0, z), (hx, 0, z)], mat)
+
+
 def _acroterion(name, origin, height, mat):
     """Acroterion ornament — palmette-shaped finial on roof apex/corners."""
     ox, oy, oz = origin
@@ -133,56 +137,32 @@ def _acroterion(name, origin, height, mat):
         (3, 2, 4),
     ]
     mesh_from_pydata(f"{name}_ctr", verts, faces, mat)
-    # Side leaves (angled)
-    for sx in [-1, 1]:
-        lv = [
-            (ox + sx * 0.03, oy, oz),
-            (ox + sx * 0.06, oy, oz),
-            (ox + sx * 0.08, oy, oz + height * 0.7),
-            (ox + sx * 0.04, oy, oz + height * 0.8),
-        ]
-        mesh_from_pydata(f"{name}_{sx}", lv, [(0, 1, 2, 3)], mat)
+    # Side leaves (angled), both in one mesh
+    leaf = [(0.03, 0.0), (0.06, 0.0), (0.08, height * 0.7), (0.04, height * 0.8)]
+    lv = [(ox + sx * dx, oy, oz + dz) for sx in (-1, 1) for dx, dz in leaf]
+    mesh_from_pydata(f"{name}_leaves", lv, [(0, 1, 2, 3), (4, 5, 6, 7)], mat)
 
 
 def _dome(name, origin, radius, height, mat, segments=16, rings=8):
     """Half-sphere dome via mesh_from_pydata."""
     ox, oy, oz = origin
-    verts = []
-    faces = []
-    # Generate vertices ring by ring from base to apex
-    for r_idx in range(rings + 1):
-        phi = (math.pi / 2) * (r_idx / rings)  # 0 at base to pi/2 at top
-        ring_r = radius * math.cos(phi)
-        ring_z = oz + height * math.sin(phi)
-        for s_idx in range(segments):
-            theta = (2 * math.pi * s_idx) / segments
-            verts.append((ox + ring_r * math.cos(theta),
-                          oy + ring_r * math.sin(theta),
-                          ring_z))
+    cos_t, sin_t = ring_table(segments)
+    cos_t, sin_t = cos_t.tolist(), sin_t.tolist()
+    # (ring radius, ring z) from base to apex -- phi runs 0 at base to pi/2 at top
+    ring_rz = [(radius * math.cos(math.pi / 2 * r / rings), oz + height * math.sin(math.pi / 2 * r / rings))
+               for r in range(rings + 1)]
+    verts = [(ox + rr * c, oy + rr * s, rz) for rr, rz in ring_rz for c, s in zip(cos_t, sin_t)]
     # Apex vertex
     apex_idx = len(verts)
     verts.append((ox, oy, oz + height))
-    # Quad faces for rings
-    for r_idx in range(rings - 1):
-        for s_idx in range(segments):
-            s_next = (s_idx + 1) % segments
-            a = r_idx * segments + s_idx
-            b = r_idx * segments + s_next
-            c = (r_idx + 1) * segments + s_next
-            d = (r_idx + 1) * segments + s_idx
-            faces.append((a, b, c, d))
-    # Top cap triangles
+    # Quad faces for rings, top cap triangles, then the base ring closing the bottom
     last_ring = (rings - 1) * segments
-    for s_idx in range(segments):
-        s_next = (s_idx + 1) % segments
-        faces.append((last_ring + s_idx, last_ring + s_next, apex_idx))
-    # Base ring face (optional, close the bottom)
-    base_ring = list(range(segments))
-    faces.append(tuple(reversed(base_ring)))
-    obj = mesh_from_pydata(name, verts, faces, mat)
-    for p in obj.data.polygons:
-        p.use_smooth = True
-    return obj
+    faces = [(r * segments + s, r * segments + (s + 1) % segments,
+              (r + 1) * segments + (s + 1) % segments, (r + 1) * segments + s)
+             for r in range(rings - 1) for s in range(segments)]
+    faces += [(last_ring + s, last_ring + (s + 1) % segments, apex_idx) for s in range(segments)]
+    faces.append(tuple(range(segments - 1, -1, -1)))
+    return mesh_from_pydata(name, verts, faces, mat, smooth=True)
 
 
 def _bull_horns(name, origin, spread, height, mat):
@@ -219,9 +199,36 @@ def _bull_horns(name, origin, spread, height, mat):
     return obj
 
 
+def _gable_triangle(x, y, z, half_w, h):
+    """Upright triangle in the xz plane: base centred on (x, y, z), apex h above."""
+    return np.array([(x - half_w, y, z), (x + half_w, y, z), (x, y, z + h)], dtype=np.float32)
+
+
+def _corbel_verts(x, y0, y1, z, half_w, half_top, h):
+    """Trapezoid profile (x/z) swept from y0 to y1 — corbelled gallery vault."""
+    profile = np.array([(-half_w, 0.0), (half_w, 0.0), (half_top, h), (-half_top, h)],
+                       dtype=np.float32)
+    verts = np.empty((2, 4, 3), dtype=np.float32)
+    verts[..., 0] = x + profile[:, 0]
+    verts[..., 1] = np.array([y0, y1], dtype=np.float32)[:, None]
+    verts[..., 2] = z + profile[:, 1]
+    return verts.reshape(-1, 3)
+
+
+def _bastion_verts(bx, by, xs, ys, z, h):
+    """Diamond footprint pointing outward along (xs, ys), extruded from z by h."""
+    foot = np.array([(bx, by + ys * 0.70), (bx + xs * 0.70, by),
+                     (bx, by - ys * 0.30), (bx - xs * 0.30, by)], dtype=np.float32)
+    verts = np.empty((2, 4, 3), dtype=np.float32)
+    verts[..., :2] = foot
+    verts[..., 2] = np.array([z, z + h], dtype=np.float32)[:, None]
+    return verts.reshape(-1, 3)
+
+
 # ============================================================
 # STONE AGE -- Cycladic whitewashed hut
 # ============================================================
+@planned("Greeks_Stone", merge=True)
 def _build_stone(m):
     Z = 0.0
 
@@ -234,10 +241,9 @@ def _build_stone(m):
     # Front wall (with gap for entrance)
     bmesh_box("YardWallF_L", (0.80, wt, wall_h), (1.50, -0.90, Z + wall_h / 2), m['stone'])
     bmesh_box("YardWallF_R", (0.80, wt, wall_h), (1.50, 0.90, Z + wall_h / 2), m['stone'])
-    bmesh_box("YardWallR", (wt, 3.8, wall_h), (2.10, 0, Z + wall_h / 2), m['stone'])
-    bmesh_box("YardWallL", (wt, 3.8, wall_h), (-2.10, 0, Z + wall_h / 2), m['stone'])
-    bmesh_box("YardWallB", (4.2, wt, wall_h), (0, 1.90, Z + wall_h / 2), m['stone'])
-    bmesh_box("YardWallFr", (4.2, wt, wall_h), (0, -1.90, Z + wall_h / 2), m['stone'])
+    # Perimeter as one ring (centre line 2.10 x 1.90)
+    extrude_ring("YardWall", rect_xy(0, 0, 2.10 + wt / 2, 1.90 + wt / 2),
+                 rect_xy(0, 0, 2.10 - wt / 2, 1.90 - wt / 2), Z, Z + wall_h, m['stone'])
 
     BZ = Z + 0.06
 
@@ -265,11 +271,7 @@ def _build_stone(m):
 
     # === Clay pot cluster (storage vessels) ===
     for i, (px, py) in enumerate([(1.2, 0.5), (1.35, 0.8), (1.05, 0.75)]):
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.12, location=(px, py, BZ + 0.12))
-        pot = bpy.context.active_object
-        pot.name = f"ClayPot_{i}"
-        pot.scale = (1, 1, 1.3)
-        pot.data.materials.append(m['stone'])
+        uv_sphere(f"ClayPot_{i}", 0.12, (px, py, BZ + 0.12), m['stone'], scale=(1, 1, 1.3))
 
     # === Low stone bench ===
     bmesh_box("Bench", (0.80, 0.25, 0.25), (-0.8, 1.2, Z + 0.125), m['stone_dark'])
@@ -283,16 +285,14 @@ def _build_stone(m):
 
     # === Drying rack ===
     for dy in [-0.20, 0.20]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=5, radius=0.025, depth=0.80,
-                                            location=(-1.5, 0.6 + dy, Z + 0.40))
-        bpy.context.active_object.name = f"Rack_{dy:.1f}"
-        bpy.context.active_object.data.materials.append(m['wood'])
+        bmesh_cylinder(f"Rack_{dy:.1f}", 0.025, 0.80, 5, (-1.5, 0.6 + dy, Z + 0.40), m['wood'])
     bmesh_box("RackBar", (0.03, 0.50, 0.03), (-1.5, 0.6, Z + 0.80), m['wood'])
 
 
 # ============================================================
 # BRONZE AGE -- Minoan palace fragment
 # ============================================================
+@planned("Greeks_Bronze", merge=True)
 def _build_bronze(m):
     Z = 0.0
 
@@ -305,10 +305,8 @@ def _build_bronze(m):
     wall_h = 1.8
 
     # === Light stone palace walls ===
-    bmesh_box("WallF", (3.6, 0.14, wall_h), (0, -1.50, BZ + wall_h / 2), m['stone_light'])
-    bmesh_box("WallB", (3.6, 0.14, wall_h), (0, 1.50, BZ + wall_h / 2), m['stone_light'])
-    bmesh_box("WallR", (0.14, 3.0, wall_h), (1.80, 0, BZ + wall_h / 2), m['stone_light'])
-    bmesh_box("WallL", (0.14, 3.0, wall_h), (-1.80, 0, BZ + wall_h / 2), m['stone_light'])
+    extrude_ring("Walls", rect_xy(0, 0, 1.80 + 0.07, 1.50 + 0.07), rect_xy(0, 0, 1.80 - 0.07, 1.50 - 0.07),
+                 BZ, BZ + wall_h, m['stone_light'])
 
     # Horizontal stone band detail
     for z_off in [0.5, 1.0, 1.5]:
@@ -327,44 +325,17 @@ def _build_bronze(m):
         top_r = 0.09
         col_h = wall_h - 0.10
         n_seg = 12
-        verts = []
-        faces = []
-        n_rings = 2
-        for ri in range(n_rings):
-            t = ri / (n_rings - 1)
-            r = base_r + (top_r - base_r) * t
-            cz = BZ + 0.05 + col_h * t
-            for si in range(n_seg):
-                a = (2 * math.pi * si) / n_seg
-                verts.append((cx + r * math.cos(a), cy - 0.08 + r * math.sin(a), cz))
-        # Side faces
-        for ri in range(n_rings - 1):
-            for si in range(n_seg):
-                sn = (si + 1) % n_seg
-                a = ri * n_seg + si
-                b = ri * n_seg + sn
-                c = (ri + 1) * n_seg + sn
-                d = (ri + 1) * n_seg + si
-                faces.append((a, b, c, d))
-        # Bottom and top caps
-        faces.append(tuple(range(n_seg)))
-        faces.append(tuple(range((n_rings - 1) * n_seg, n_rings * n_seg)))
-        obj = mesh_from_pydata(f"MinoanCol_{i}", verts, faces, m['banner'])  # red
-        for p in obj.data.polygons:
-            p.use_smooth = True
+        verts, loops, totals = frustum_arrays(cx, cy - 0.08, BZ + 0.05, base_r, top_r,
+                                              col_h, n_seg)
+        mesh_from_arrays(f"MinoanCol_{i}", verts, loops, totals, m['banner'], smooth=True)  # red
         # Column cushion capital (wider disc)
         bmesh_prism(f"ColCap_{i}", top_r * 1.5, 0.06, n_seg,
                     (cx, cy - 0.08, BZ + 0.05 + col_h), m['banner'])
 
     # === Interior columns (two rows) ===
     for ix, iy in [(-0.5, -0.3), (-0.5, 0.5), (0.5, -0.3), (0.5, 0.5)]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=10, radius=0.07, depth=wall_h - 0.1,
-                                            location=(ix, iy, BZ + wall_h / 2))
-        col = bpy.context.active_object
-        col.name = f"IntCol_{ix:.1f}_{iy:.1f}"
-        col.data.materials.append(m['banner'])
-        for p in col.data.polygons:
-            p.use_smooth = True
+        bmesh_cylinder(f"IntCol_{ix:.1f}_{iy:.1f}", 0.07, wall_h - 0.1, 10,
+                       (ix, iy, BZ + wall_h / 2), m['banner'], smooth=True)
 
     # === Bull horns of consecration on roof ===
     _bull_horns("BullHornsC", (0, 0, BZ + wall_h + 0.12), 0.25, 0.35, m['stone_light'])
@@ -383,16 +354,13 @@ def _build_bronze(m):
 
     # === Storage jars (pithoi) ===
     for i, (px, py) in enumerate([(1.4, 0.8), (1.5, 0.4), (1.3, 1.1)]):
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.10, depth=0.40,
-                                            location=(px, py, BZ + 0.20))
-        jar = bpy.context.active_object
-        jar.name = f"Pithos_{i}"
-        jar.data.materials.append(m['stone'])
+        bmesh_cylinder(f"Pithos_{i}", 0.10, 0.40, 8, (px, py, BZ + 0.20), m['stone'])
 
 
 # ============================================================
 # IRON AGE -- Mycenaean megaron with Lion Gate
 # ============================================================
+@planned("Greeks_Iron", merge=True)
 def _build_iron(m):
     Z = 0.0
 
@@ -401,15 +369,15 @@ def _build_iron(m):
     # === Cyclopean stone wall enclosure (massive irregular blocks) ===
     wall_h = 1.6
     wt = 0.22
-    bmesh_box("CycWallF", (4.0, wt, wall_h), (0, -1.80, Z + wall_h / 2), m['stone_dark'], bevel=0.06)
-    bmesh_box("CycWallB", (4.0, wt, wall_h), (0, 1.80, Z + wall_h / 2), m['stone_dark'], bevel=0.06)
-    bmesh_box("CycWallR", (wt, 3.6, wall_h), (2.00, 0, Z + wall_h / 2), m['stone_dark'], bevel=0.06)
-    bmesh_box("CycWallL", (wt, 3.6, wall_h), (-2.00, 0, Z + wall_h / 2), m['stone_dark'], bevel=0.06)
+    extrude_ring("CycWall", rect_xy(0, 0, 2.00 + wt / 2, 1.80 + wt / 2),
+                 rect_xy(0, 0, 2.00 - wt / 2, 1.80 - wt / 2), Z, Z + wall_h, m['stone_dark'], bevel=0.06)
 
     # Stone block texture (horizontal courses on walls)
+    course_f = box_factory((3.9, 0.03, 0.04), material=m['stone'])
+    course_r = box_factory((0.03, 3.5, 0.04), material=m['stone'])
     for z_off in [0.35, 0.70, 1.05, 1.40]:
-        bmesh_box(f"CourseF_{z_off:.2f}", (3.9, 0.03, 0.04), (0, -1.81, Z + z_off), m['stone'])
-        bmesh_box(f"CourseR_{z_off:.2f}", (0.03, 3.5, 0.04), (2.01, 0, Z + z_off), m['stone'])
+        course_f(f"CourseF_{z_off:.2f}", (0, -1.81, Z + z_off))
+        course_r(f"CourseR_{z_off:.2f}", (2.01, 0, Z + z_off))
 
     BZ = Z + 0.06
 
@@ -419,12 +387,8 @@ def _build_iron(m):
     # Massive lintel stone
     bmesh_box("GateLintel", (0.30, 1.00, 0.18), (gate_x, gate_y - 0.01, Z + wall_h - 0.09), m['stone'], bevel=0.03)
     # Relieving triangle above lintel
-    rv = [
-        (gate_x - 0.40, gate_y - 0.06, Z + wall_h + 0.09),
-        (gate_x + 0.40, gate_y - 0.06, Z + wall_h + 0.09),
-        (gate_x, gate_y - 0.06, Z + wall_h + 0.45),
-    ]
-    mesh_from_pydata("RelievingTri", rv, [(0, 1, 2)], m['stone_light'])
+    rv = _gable_triangle(gate_x, gate_y - 0.06, Z + wall_h + 0.09, 0.40, 0.36)
+    mesh_from_arrays("RelievingTri", rv, *_TRI_FACES, m['stone_light'])
 
     # Lion relief panel (simplified -- two opposing triangular shapes)
     for sx in [-1, 1]:
@@ -434,14 +398,11 @@ def _build_iron(m):
             (gate_x + sx * 0.20, gate_y - 0.07, Z + wall_h + 0.38),
             (gate_x + sx * 0.08, gate_y - 0.07, Z + wall_h + 0.35),
         ]
-        mesh_from_pydata(f"Lion_{sx}", lv, [(0, 1, 2, 3)], m['gold'])
+        mesh_from_arrays(f"Lion_{sx}", lv, *_QUAD_FACES, m['gold'])
 
     # Central column in lion relief
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.04, depth=0.28,
-                                        location=(gate_x, gate_y - 0.07, Z + wall_h + 0.26))
-    col_r = bpy.context.active_object
-    col_r.name = "LionCol"
-    col_r.data.materials.append(m['stone_trim'])
+    bmesh_cylinder("LionCol", 0.04, 0.28, 8, (gate_x, gate_y - 0.07, Z + wall_h + 0.26),
+                   m['stone_trim'])
 
     # Gate opening
     bmesh_box("GateOpening", (0.08, 0.70, 1.40), (gate_x, gate_y - 0.01, Z + 0.70), m['door'])
@@ -477,26 +438,16 @@ def _build_iron(m):
     gal_h = 1.2
     bmesh_box("Gallery", (0.60, 1.2, gal_h), (gal_x, 0.8, BZ + gal_h / 2), m['stone_dark'], bevel=0.03)
     # Corbelled top (triangular profile)
-    cv = [
-        (gal_x - 0.30, 0.20, BZ + gal_h),
-        (gal_x + 0.30, 0.20, BZ + gal_h),
-        (gal_x + 0.15, 0.20, BZ + gal_h + 0.30),
-        (gal_x - 0.15, 0.20, BZ + gal_h + 0.30),
-        (gal_x - 0.30, 1.40, BZ + gal_h),
-        (gal_x + 0.30, 1.40, BZ + gal_h),
-        (gal_x + 0.15, 1.40, BZ + gal_h + 0.30),
-        (gal_x - 0.15, 1.40, BZ + gal_h + 0.30),
-    ]
-    cf = [(0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0)]
-    mesh_from_pydata("CorbelRoof", cv, cf, m['stone_dark'])
+    cv = _corbel_verts(gal_x, 0.20, 1.40, BZ + gal_h, 0.30, 0.15, 0.30)
+    mesh_from_arrays("CorbelRoof", cv, *_CORBEL_FACES, m['stone_dark'])
 
     # === Throne base (stone slab in megaron) ===
     bmesh_box("Throne", (0.35, 0.30, 0.30), (0, 1.10, BZ + 0.15), m['stone_light'])
 
     # === Steps at entrance ===
+    step = box_factory((0.25, 1.0, 0.06), material=m['stone'])
     for i in range(4):
-        bmesh_box(f"Step_{i}", (0.25, 1.0, 0.06),
-                  (0, -1.80 - 0.25 * (i + 1), Z + wall_h * 0 + 0.03 - i * 0.01), m['stone'])
+        step(f"Step_{i}", (0, -1.80 - 0.25 * (i + 1), Z + wall_h * 0 + 0.03 - i * 0.01))
 
     # === Guard tower (corner) ===
     tw_x, tw_y = 2.00, -1.80
@@ -507,6 +458,7 @@ def _build_iron(m):
 # ============================================================
 # CLASSICAL AGE -- Grand Greek temple (Parthenon style)
 # ============================================================
+@planned("Greeks_Classical", merge=True)
 def _build_classical(m):
     Z = 0.0
 
@@ -591,10 +543,7 @@ def _build_classical(m):
         (0, -sty_d / 2 - 0.10, roof_z + 0.70),
         (0, sty_d / 2 + 0.10, roof_z + 0.70),
     ]
-    rf = [(0, 3, 5, 4), (1, 2, 5, 4), (0, 1, 4), (2, 3, 5)]
-    obj = mesh_from_pydata("TempleRoof", rv, rf, m['roof'])
-    for p in obj.data.polygons:
-        p.use_smooth = True
+    mesh_from_arrays("TempleRoof", rv, *_TEMPLE_ROOF_FACES, m['roof'], smooth=True)
 
     # === Naos (inner cella hall) ===
     naos_w, naos_d, naos_h = 2.4, 1.6, 1.8
@@ -613,6 +562,7 @@ def _build_classical(m):
 # ============================================================
 # MEDIEVAL AGE -- Byzantine church
 # ============================================================
+@planned("Greeks_Medieval", merge=True)
 def _build_medieval(m):
     Z = 0.0
 
@@ -639,16 +589,13 @@ def _build_medieval(m):
     bmesh_box("ArmW", (arm_len, arm_w, arm_h), (-ctr_w / 2 - arm_len / 2 + 0.10, 0, BZ + arm_h / 2), m['stone'], bevel=0.02)
 
     # === Arm pitched roofs ===
-    for lbl, ox, oy, is_x in [("N", 0, ctr_w / 2 + arm_len / 2 - 0.10, False),
-                                ("S", 0, -ctr_w / 2 - arm_len / 2 + 0.10, False),
-                                ("E", ctr_w / 2 + arm_len / 2 - 0.10, 0, True),
-                                ("W", -ctr_w / 2 - arm_len / 2 + 0.10, 0, True)]:
-        if is_x:
-            pyramid_roof(f"ArmRoof_{lbl}", w=arm_len - 0.10, d=arm_w - 0.10, h=0.50,
-                         overhang=0.08, origin=(ox, oy, BZ + arm_h + 0.02), material=m['roof'])
-        else:
-            pyramid_roof(f"ArmRoof_{lbl}", w=arm_w - 0.10, d=arm_len - 0.10, h=0.50,
-                         overhang=0.08, origin=(ox, oy, BZ + arm_h + 0.02), material=m['roof'])
+    # One N-S roof; the E and W arms use the same mesh turned 90 degrees
+    arm_off = ctr_w / 2 + arm_len / 2 - 0.10
+    roof_z = BZ + arm_h + 0.02
+    mesh_instances("ArmRoof", *pyramid_roof_arrays(w=arm_w - 0.10, d=arm_len - 0.10, h=0.50, overhang=0.08),
+                   [("N", (0, arm_off, roof_z), 0.0), ("S", (0, -arm_off, roof_z), 0.0),
+                    ("E", (arm_off, 0, roof_z), math.pi / 2), ("W", (-arm_off, 0, roof_z), math.pi / 2)],
+                   m['roof'], smooth=True)
 
     # === Central dome on drum ===
     drum_r = 0.75
@@ -656,21 +603,17 @@ def _build_medieval(m):
     bmesh_prism("Drum", drum_r, drum_h, 16, (0, 0, BZ + wall_h), m['stone_trim'])
     # Drum windows (round arched)
     n_drum_win = 8
-    for i in range(n_drum_win):
-        a = (2 * math.pi * i) / n_drum_win
-        wx = drum_r * 0.98 * math.cos(a)
-        wy = drum_r * 0.98 * math.sin(a)
-        bmesh_box(f"DrumWin_{i}", (0.10, 0.06, 0.30),
-                  (wx, wy, BZ + wall_h + drum_h / 2 + 0.05), m['window'])
+    cos_t, sin_t = ring_table(n_drum_win)
+    drum_win = box_factory((0.10, 0.06, 0.30), material=m['window'])
+    for i, (wx, wy) in enumerate(zip((drum_r * 0.98 * cos_t).tolist(),
+                                     (drum_r * 0.98 * sin_t).tolist())):
+        drum_win(f"DrumWin_{i}", (wx, wy, BZ + wall_h + drum_h / 2 + 0.05))
     # Dome
     dome_z = BZ + wall_h + drum_h
     _dome("MainDome", (0, 0, dome_z), drum_r - 0.05, 0.65, m['roof'])
     # Cross on top of dome
     cross_z = dome_z + 0.65
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.02, depth=0.30,
-                                        location=(0, 0, cross_z + 0.15))
-    bpy.context.active_object.name = "CrossV"
-    bpy.context.active_object.data.materials.append(m['gold'])
+    bmesh_cylinder("CrossV", 0.02, 0.30, 6, (0, 0, cross_z + 0.15), m['gold'])
     bmesh_box("CrossH", (0.20, 0.03, 0.03), (0, 0, cross_z + 0.25), m['gold'])
 
     # === Round arched windows on arms ===
@@ -679,13 +622,9 @@ def _build_medieval(m):
         bmesh_box(f"WinS_{wx:.1f}", (0.12, 0.06, 0.50),
                   (wx, -ctr_w / 2 - arm_len + 0.11, BZ + arm_h / 2 + 0.20), m['window'])
         # Arched top
-        bpy.ops.mesh.primitive_cylinder_add(vertices=12, radius=0.06, depth=0.06,
-                                            location=(wx, -ctr_w / 2 - arm_len + 0.10,
-                                                      BZ + arm_h / 2 + 0.45))
-        arch = bpy.context.active_object
-        arch.name = f"WinArch_{wx:.1f}"
-        arch.rotation_euler = (math.radians(90), 0, 0)
-        arch.data.materials.append(m['stone_trim'])
+        bmesh_cylinder(f"WinArch_{wx:.1f}", 0.06, 0.06, 12,
+                       (wx, -ctr_w / 2 - arm_len + 0.10, BZ + arm_h / 2 + 0.45), m['stone_trim'],
+                       rotation=(math.radians(90), 0, 0))
 
     # East and west arm windows
     for arm_dir, ay, rot in [("E", ctr_w / 2 + arm_len / 2, 0),
@@ -708,9 +647,7 @@ def _build_medieval(m):
     # Tower dome
     _dome(f"TowerDome", (tw_x, tw_y, BZ + tower_h), 0.30, 0.35, m['roof'], segments=10, rings=6)
     # Tower cross
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.015, depth=0.20,
-                                        location=(tw_x, tw_y, BZ + tower_h + 0.35 + 0.10))
-    bpy.context.active_object.data.materials.append(m['gold'])
+    bmesh_cylinder("TwCrossV", 0.015, 0.20, 6, (tw_x, tw_y, BZ + tower_h + 0.35 + 0.10), m['gold'])
     bmesh_box("TwCrossH", (0.12, 0.02, 0.02), (tw_x, tw_y, BZ + tower_h + 0.50), m['gold'])
 
     # === Mosaic/decorative band ===
@@ -721,9 +658,9 @@ def _build_medieval(m):
     bmesh_box("PortalFrame", (0.80, 0.12, 0.08), (0, -ctr_w / 2 - arm_len + 0.09, BZ + 1.53), m['stone_trim'])
 
     # === Steps ===
+    step = box_factory((1.0, 0.22, 0.06), material=m['stone_dark'])
     for i in range(4):
-        bmesh_box(f"Step_{i}", (1.0, 0.22, 0.06),
-                  (0, -ctr_w / 2 - arm_len - 0.05 - i * 0.22, BZ - 0.02 - i * 0.04), m['stone_dark'])
+        step(f"Step_{i}", (0, -ctr_w / 2 - arm_len - 0.05 - i * 0.22, BZ - 0.02 - i * 0.04))
 
     # === Small apse (semicircular bump on north arm) ===
     bmesh_prism("Apse", 0.50, arm_h, 8, (0, ctr_w / 2 + arm_len - 0.10, BZ), m['stone'])
@@ -734,6 +671,7 @@ def _build_medieval(m):
 # ============================================================
 # GUNPOWDER AGE -- Venetian-Greek fortress
 # ============================================================
+@planned("Greeks_Gunpowder", merge=True)
 def _build_gunpowder(m):
     Z = 0.0
 
@@ -748,38 +686,29 @@ def _build_gunpowder(m):
     wt = 0.22
 
     # Fortress walls
-    bmesh_box("WallF", (wt, hw * 2 - 0.20, WALL_H), (hw, 0, BZ + WALL_H / 2), m['stone'], bevel=0.02)
-    bmesh_box("WallB", (wt, hw * 2 - 0.20, WALL_H), (-hw, 0, BZ + WALL_H / 2), m['stone'], bevel=0.02)
-    bmesh_box("WallR", (hw * 2 - 0.20, wt, WALL_H), (0, -hw, BZ + WALL_H / 2), m['stone'], bevel=0.02)
-    bmesh_box("WallL", (hw * 2 - 0.20, wt, WALL_H), (0, hw, BZ + WALL_H / 2), m['stone'], bevel=0.02)
+    # One ring; the corners it closes sit inside the bastions
+    extrude_ring("Walls", rect_xy(0, 0, hw + wt / 2, hw + wt / 2), rect_xy(0, 0, hw - wt / 2, hw - wt / 2),
+                 BZ, BZ + WALL_H, m['stone'], bevel=0.02)
 
     # Battlements
+    merlon_x = box_factory((0.10, 0.14, 0.18), 0.01, m['stone_trim'])
+    merlon_y = box_factory((0.14, 0.10, 0.18), 0.01, m['stone_trim'])
     for i in range(10):
         y = -1.8 + i * 0.40
-        bmesh_box(f"MF_{i}", (0.10, 0.14, 0.18), (hw + 0.06, y, BZ + WALL_H + 0.09), m['stone_trim'], bevel=0.01)
-        bmesh_box(f"MB_{i}", (0.10, 0.14, 0.18), (-hw - 0.06, y, BZ + WALL_H + 0.09), m['stone_trim'], bevel=0.01)
+        merlon_x(f"MF_{i}", (hw + 0.06, y, BZ + WALL_H + 0.09))
+        merlon_x(f"MB_{i}", (-hw - 0.06, y, BZ + WALL_H + 0.09))
     for i in range(10):
         x = -1.8 + i * 0.40
-        bmesh_box(f"MR_{i}", (0.14, 0.10, 0.18), (x, -hw - 0.06, BZ + WALL_H + 0.09), m['stone_trim'], bevel=0.01)
-        bmesh_box(f"ML_{i}", (0.14, 0.10, 0.18), (x, hw + 0.06, BZ + WALL_H + 0.09), m['stone_trim'], bevel=0.01)
+        merlon_y(f"MR_{i}", (x, -hw - 0.06, BZ + WALL_H + 0.09))
+        merlon_y(f"ML_{i}", (x, hw + 0.06, BZ + WALL_H + 0.09))
 
     # === Angular bastions (star fort points) ===
     bastion_h = WALL_H + 0.25
     for xs, ys, lbl in [(-1, -1, "BL"), (-1, 1, "FL"), (1, -1, "BR"), (1, 1, "FR")]:
         bx, by = xs * hw, ys * hw
         # Diamond bastion shape
-        bv = [
-            (bx, by + ys * 0.70, BZ),
-            (bx + xs * 0.70, by, BZ),
-            (bx, by - ys * 0.30, BZ),
-            (bx - xs * 0.30, by, BZ),
-            (bx, by + ys * 0.70, BZ + bastion_h),
-            (bx + xs * 0.70, by, BZ + bastion_h),
-            (bx, by - ys * 0.30, BZ + bastion_h),
-            (bx - xs * 0.30, by, BZ + bastion_h),
-        ]
-        bf = [(0, 1, 2, 3), (4, 7, 6, 5), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
-        mesh_from_pydata(f"Bastion_{lbl}", bv, bf, m['stone_upper'])
+        bv = _bastion_verts(bx, by, xs, ys, BZ, bastion_h)
+        mesh_from_arrays(f"Bastion_{lbl}", bv, *_BASTION_FACES, m['stone_upper'])
         # Cannon slit
         bmesh_box(f"CSlit_{lbl}", (0.04, 0.12, 0.08),
                   (bx + xs * 0.50, by + ys * 0.50, BZ + 1.0), m['window'])
@@ -792,17 +721,13 @@ def _build_gunpowder(m):
         (-0.20, lion_y - 0.02, BZ + WALL_H - 0.20),
         (0.20, lion_y - 0.02, BZ + WALL_H - 0.20),
     ]
-    mesh_from_pydata("VenetianLion", lv, [(0, 1, 2, 3)], m['gold'])
+    mesh_from_arrays("VenetianLion", lv, *_QUAD_FACES, m['gold'])
 
     # === Gate entrance ===
     bmesh_box("Gate", (0.60, 0.10, 1.50), (0, -hw - wt / 2 - 0.01, BZ + 0.75), m['door'])
     # Arched gate top
-    bpy.ops.mesh.primitive_cylinder_add(vertices=12, radius=0.30, depth=wt + 0.04,
-                                        location=(0, -hw, BZ + 1.50))
-    arch = bpy.context.active_object
-    arch.name = "GateArch"
-    arch.rotation_euler = (math.radians(90), 0, 0)
-    arch.data.materials.append(m['stone_trim'])
+    bmesh_cylinder("GateArch", 0.30, wt + 0.04, 12, (0, -hw, BZ + 1.50), m['stone_trim'],
+                   rotation=(math.radians(90), 0, 0))
 
     # === Domed chapel inside fortress ===
     chapel_x, chapel_y = 0.6, 0.6
@@ -811,9 +736,8 @@ def _build_gunpowder(m):
     # Chapel dome
     _dome("ChapelDome", (chapel_x, chapel_y, BZ + chapel_h), 0.55, 0.50, m['roof'])
     # Cross on dome
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.015, depth=0.20,
-                                        location=(chapel_x, chapel_y, BZ + chapel_h + 0.50 + 0.10))
-    bpy.context.active_object.data.materials.append(m['gold'])
+    bmesh_cylinder("ChapelCrossV", 0.015, 0.20, 6,
+                   (chapel_x, chapel_y, BZ + chapel_h + 0.50 + 0.10), m['gold'])
     bmesh_box("ChapelCrossH", (0.10, 0.02, 0.02), (chapel_x, chapel_y, BZ + chapel_h + 0.65), m['gold'])
 
     # Chapel windows
@@ -837,37 +761,30 @@ def _build_gunpowder(m):
                       (face_x, face_y, tz), m['window'])
 
     # Clock face
-    bpy.ops.mesh.primitive_cylinder_add(vertices=20, radius=0.22, depth=0.04,
-                                        location=(tw_x + 0.41, tw_y, BZ + 3.4))
-    clock = bpy.context.active_object
-    clock.name = "Clock"
-    clock.rotation_euler = (0, math.radians(90), 0)
-    clock.data.materials.append(m['gold'])
+    bmesh_cylinder("Clock", 0.22, 0.04, 20, (tw_x + 0.41, tw_y, BZ + 3.4), m['gold'],
+                   rotation=(0, math.radians(90), 0))
 
     # Tower pointed roof
     bmesh_cone("TowerRoof", 0.50, 1.0, 8, (tw_x, tw_y, BZ + tower_h), m['roof'])
 
     # === Steps to gate ===
+    step = box_factory((0.22, 1.2, 0.06), material=m['stone_dark'])
     for i in range(5):
-        bmesh_box(f"Step_{i}", (0.22, 1.2, 0.06),
-                  (0, -hw - wt / 2 - 0.30 - i * 0.22, BZ - 0.04 - i * 0.05), m['stone_dark'])
+        step(f"Step_{i}", (0, -hw - wt / 2 - 0.30 - i * 0.22, BZ - 0.04 - i * 0.05))
 
     # === Cannons on walls ===
     for cx, cy, rot in [(hw + 0.10, -1.0, 0), (hw + 0.10, 1.0, 0), (-1.0, -hw - 0.10, math.radians(90))]:
         bmesh_box(f"CanBase_{cx:.1f}_{cy:.1f}", (0.25, 0.12, 0.08),
                   (cx, cy, BZ + WALL_H + 0.04), m['iron'])
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.035, depth=0.35,
-                                            location=(cx + 0.15 * math.cos(rot), cy + 0.15 * math.sin(rot),
-                                                      BZ + WALL_H + 0.12))
-        cn = bpy.context.active_object
-        cn.name = f"Cannon_{cx:.1f}"
-        cn.rotation_euler = (0, math.radians(80), rot)
-        cn.data.materials.append(m['iron'])
+        bmesh_cylinder(f"Cannon_{cx:.1f}", 0.035, 0.35, 8,
+                       (cx + 0.15 * math.cos(rot), cy + 0.15 * math.sin(rot), BZ + WALL_H + 0.12),
+                       m['iron'], rotation=(0, math.radians(80), rot))
 
 
 # ============================================================
 # ENLIGHTENMENT AGE -- Neoclassical Greek revival
 # ============================================================
+@planned("Greeks_Enlightenment", by_material=True)
 def _build_enlightenment(m):
     Z = 0.0
 
@@ -891,20 +808,21 @@ def _build_enlightenment(m):
     col_h = 2.8
     n_cols = 6
     col_spacing = (main_w - 0.40) / (n_cols - 1)
+    col_x0 = -main_w / 2 + 0.20
+    front_y = -main_d / 2 - 0.45  # portico line
     for i in range(n_cols):
-        cx = -main_w / 2 + 0.20 + i * col_spacing
-        _ionic_column(f"Col_{i}", (cx, -main_d / 2 - 0.45, BZ),
+        _ionic_column(f"Col_{i}", (col_x0 + i * col_spacing, front_y, BZ),
                       0.08, col_h, m['stone_light'])
 
     # === Portico roof (flat slab held by columns) ===
     portico_z = BZ + col_h + 0.08 * 0.3 + 0.08 * 2.6 * 0.5  # above capitals
     bmesh_box("PorticoRoof", (main_w + 0.10, 0.70, 0.12),
-              (0, -main_d / 2 - 0.45, BZ + col_h + 0.30), m['stone_light'])
+              (0, front_y, BZ + col_h + 0.30), m['stone_light'])
 
     # === Triangular pediment ===
     ped_z = BZ + col_h + 0.36
     _pediment("Pediment", main_w + 0.10, 0.80, 0.12,
-              (0, -main_d / 2 - 0.45, ped_z), m['stone_light'])
+              (0, front_y, ped_z), m['stone_light'])
 
     # Pediment sculpture relief
     for sx in [-0.60, -0.20, 0.20, 0.60]:
@@ -913,62 +831,70 @@ def _build_enlightenment(m):
                   (sx, -main_d / 2 - 0.50, ped_z + fig_h / 2 + 0.03), m['gold'])
 
     # === Acroteria ===
-    _acroterion("AcroApex", (0, -main_d / 2 - 0.45, ped_z + 0.80), 0.18, m['gold'])
-    _acroterion("AcroL", (-main_w / 2 - 0.05, -main_d / 2 - 0.45, ped_z), 0.14, m['gold'])
-    _acroterion("AcroR", (main_w / 2 + 0.05, -main_d / 2 - 0.45, ped_z), 0.14, m['gold'])
+    _acroterion("AcroApex", (0, front_y, ped_z + 0.80), 0.18, m['gold'])
+    _acroterion("AcroL", (-main_w / 2 - 0.05, front_y, ped_z), 0.14, m['gold'])
+    _acroterion("AcroR", (main_w / 2 + 0.05, front_y, ped_z), 0.14, m['gold'])
 
     # === Symmetrical wings ===
     wing_w, wing_d, wing_h = 1.4, 1.8, 2.8
-    for ys, lbl in [(-2.2, "R"), (2.2, "L")]:
-        bmesh_box(f"Wing_{lbl}", (wing_w, wing_d, wing_h), (0, ys, BZ + wing_h / 2), m['stone_light'], bevel=0.02)
-        bmesh_box(f"WCornice_{lbl}", (wing_w + 0.06, wing_d + 0.06, 0.08),
-                  (0, ys, BZ + wing_h), m['stone_trim'], bevel=0.02)
-        # Wing hip roof
-        pyramid_roof(f"WRoof_{lbl}", w=wing_w - 0.15, d=wing_d - 0.15, h=0.55,
-                     overhang=0.10, origin=(0, ys, BZ + wing_h + 0.04), material=m['roof'])
-        # Wing windows (tall, 2 rows)
-        for row, z_off in [(0.5, 0), (1.6, 1)]:
-            for wy in [-0.50, 0, 0.50]:
-                bmesh_box(f"WWin_{lbl}_{row:.1f}_{wy:.1f}", (0.06, 0.16, 0.55),
-                          (wing_w / 2 + 0.01, ys + wy, BZ + row + 0.10), m['window'])
-                # Window pediment (small triangular header)
-                wv = [
-                    (wing_w / 2 + 0.02, ys + wy - 0.10, BZ + row + 0.68),
-                    (wing_w / 2 + 0.02, ys + wy + 0.10, BZ + row + 0.68),
-                    (wing_w / 2 + 0.02, ys + wy, BZ + row + 0.78),
-                ]
-                mesh_from_pydata(f"WinPed_{lbl}_{row:.1f}_{wy:.1f}", wv, [(0, 1, 2)], m['stone_trim'])
+    # The wings are symmetric, so each part is built once around y = 0 and
+    # placed on both sides as two objects sharing one mesh
+    wings = [("R", (0, -2.2, 0), 0.0), ("L", (0, 2.2, 0), 0.0)]
+    mesh_instances("Wing", *bevel_arrays(*box_arrays((wing_w, wing_d, wing_h), (0, 0, BZ + wing_h / 2)),
+                                         0.02, 2), wings, m['stone_light'])
+    mesh_instances("WCornice", *bevel_arrays(*box_arrays((wing_w + 0.06, wing_d + 0.06, 0.08),
+                                                         (0, 0, BZ + wing_h)), 0.02, 2),
+                   wings, m['stone_trim'])
+    # Wing hip roof
+    roof_v, roof_loops, roof_totals = pyramid_roof_arrays(wing_w - 0.15, wing_d - 0.15, 0.55, 0.10)
+    mesh_instances("WRoof", roof_v + np.array([0, 0, BZ + wing_h + 0.04], dtype=np.float32),
+                   roof_loops, roof_totals, wings, m['roof'], smooth=True)
+    # Wing windows (tall, 2 rows)
+    win_rows = [(wy, BZ + row) for row in (0.5, 1.6) for wy in (-0.50, 0, 0.50)]
+    mesh_instances("WWin", *boxes_arrays((0.06, 0.16, 0.55),
+                                         [(wing_w / 2 + 0.01, wy, z + 0.10) for wy, z in win_rows]),
+                   wings, m['window'])
+    win_peds = [(ys + wy, z + 0.68) for ys in (-2.2, 2.2) for wy, z in win_rows]
+
+    # Window pediments (small triangular headers) — all 12 as one mesh
+    peds = np.array(win_peds, dtype=np.float32)
+    ped_v = np.empty((len(peds), 3, 3), dtype=np.float32)
+    ped_v[..., 0] = wing_w / 2 + 0.02
+    ped_v[..., 1] = peds[:, :1] + np.array([-0.10, 0.10, 0.0], dtype=np.float32)
+    ped_v[..., 2] = peds[:, 1:] + np.array([0.0, 0.0, 0.10], dtype=np.float32)
+    mesh_from_arrays("WinPeds_All", ped_v.reshape(-1, 3), np.arange(3 * len(peds), dtype=np.int32),
+                     np.full(len(peds), 3, dtype=np.int32), m['stone_trim'])
 
     # === Main building windows (front facade) ===
-    for i, y in enumerate([-0.70, -0.25, 0.25, 0.70]):
-        for z_off, h in [(0.6, 0.60), (1.8, 0.70)]:
-            bmesh_box(f"MWin_{i}_{z_off}", (0.06, 0.18, h),
-                      (-main_w / 2 - 0.01, y, BZ + z_off), m['window'])
+    mwin = [(y, z_off, h) for y in (-0.70, -0.25, 0.25, 0.70) for z_off, h in [(0.6, 0.60), (1.8, 0.70)]]
+    merged_boxes("MWin", [(0.06, 0.18, h) for y, z_off, h in mwin],
+                 [(-main_w / 2 - 0.01, y, BZ + z_off) for y, z_off, h in mwin], m['window'])
 
     # === Hip roof on main block ===
     pyramid_roof("MainRoof", w=main_w - 0.15, d=main_d - 0.15, h=0.70,
                  overhang=0.12, origin=(0, 0, BZ + main_h + 0.04), material=m['roof'])
 
     # === Entrance door ===
-    bmesh_box("Door", (0.08, 0.65, 1.60), (0, -main_d / 2 - 0.45, BZ + 0.80), m['door'])
+    bmesh_box("Door", (0.08, 0.65, 1.60), (0, front_y, BZ + 0.80), m['door'])
 
     # === Steps (grand staircase) ===
-    for i in range(6):
-        bmesh_box(f"Step_{i}", (0.22, main_w + 0.20, 0.06),
-                  (0, -main_d / 2 - 0.70 - i * 0.22, BZ - 0.04 - i * 0.05), m['stone_light'])
+    merged_boxes("Steps", (0.22, main_w + 0.20, 0.06),
+                 [(0, -main_d / 2 - 0.70 - i * 0.22, BZ - 0.04 - i * 0.05) for i in range(6)],
+                 m['stone_light'])
 
     # === Meander decorative strip above colonnade ===
     _meander_strip("MeanderFront", main_w, (0, -main_d / 2 - 0.46, BZ + col_h + 0.20), m['gold'], axis='x')
 
     # === Formal garden hedges ===
+    hedge = box_factory((0.45, 0.22, 0.16), material=m['ground'])
     for gy in [-1.5, -0.5, 0.5, 1.5]:
-        bmesh_box(f"Hedge_{gy:.1f}", (0.45, 0.22, 0.16),
-                  (-main_d / 2 - 1.40, gy, Z + 0.08), m['ground'])
+        hedge(f"Hedge_{gy:.1f}", (-main_d / 2 - 1.40, gy, Z + 0.08))
 
 
 # ============================================================
 # INDUSTRIAL AGE -- Greek neoclassical civic building
 # ============================================================
+@planned("Greeks_Industrial", by_material=True)
 def _build_industrial(m):
     Z = 0.0
 
@@ -983,54 +909,48 @@ def _build_industrial(m):
     bmesh_box("Main", (main_w, main_d, main_h), (0, 0, BZ + main_h / 2), m['stone_light'], bevel=0.02)
 
     # Horizontal bands (marble courses)
+    band = box_factory((main_w + 0.02, main_d + 0.02, 0.04), material=m['stone_trim'])
     for z in [BZ + 0.8, BZ + 1.6, BZ + 2.4, BZ + 3.2]:
-        bmesh_box(f"Band_{z:.1f}", (main_w + 0.02, main_d + 0.02, 0.04), (0, 0, z), m['stone_trim'])
+        band(f"Band_{z:.1f}", (0, 0, z))
 
     # === Tall arched windows (3 rows x 5 cols on front) ===
-    for row, z_off in enumerate([0.4, 1.3, 2.3]):
-        for y in [-1.0, -0.50, 0, 0.50, 1.0]:
-            h = 0.55 if row < 2 else 0.45
-            bmesh_box(f"Win_{row}_{y:.1f}", (0.06, 0.20, h),
-                      (main_w / 2 + 0.01, y, BZ + z_off + 0.10), m['window'])
-            bmesh_box(f"WinF_{row}_{y:.1f}", (0.07, 0.22, 0.03),
-                      (main_w / 2 + 0.02, y, BZ + z_off + h / 2 + 0.12), m['win_frame'])
-            # Arched window top
-            if row == 1:  # main floor gets arches
-                bpy.ops.mesh.primitive_cylinder_add(vertices=10, radius=0.10, depth=0.06,
-                                                    location=(main_w / 2 + 0.02, y, BZ + z_off + h + 0.10))
-                wa = bpy.context.active_object
-                wa.name = f"WinArch_{row}_{y:.1f}"
-                wa.rotation_euler = (math.radians(90), 0, 0)
-                wa.data.materials.append(m['stone_trim'])
+    # One mesh per material: the 15 panes, then their 15 frames
+    win_y, win_z = (g.ravel() for g in np.meshgrid([-1.0, -0.50, 0, 0.50, 1.0], [0.4, 1.3, 2.3]))
+    win_h = np.where(win_z < 2.0, 0.55, 0.45)
+    win_x = np.full_like(win_y, main_w / 2)
+    merged_boxes("Win", np.stack([np.full_like(win_h, 0.06), np.full_like(win_h, 0.20), win_h], axis=1),
+                 np.stack([win_x + 0.01, win_y, BZ + win_z + 0.10], axis=1), m['window'])
+    merged_boxes("WinF", (0.07, 0.22, 0.03),
+                 np.stack([win_x + 0.02, win_y, BZ + win_z + win_h / 2 + 0.12], axis=1), m['win_frame'])
+    # Arched window tops on the main floor
+    for y in [-1.0, -0.50, 0, 0.50, 1.0]:
+        bmesh_cylinder(f"WinArch_1_{y:.1f}", 0.10, 0.06, 10,
+                       (main_w / 2 + 0.02, y, BZ + 1.3 + 0.55 + 0.10), m['stone_trim'],
+                       rotation=(math.radians(90), 0, 0))
 
     # Side windows
+    side_win = box_factory((0.20, 0.06, 0.50), material=m['window'])
     for row in range(2):
         for x in [-1.2, -0.4, 0.4, 1.2]:
-            bmesh_box(f"SWin_{row}_{x:.1f}", (0.20, 0.06, 0.50),
-                      (x, -main_d / 2 - 0.01, BZ + 0.5 + row * 1.0), m['window'])
+            side_win(f"SWin_{row}_{x:.1f}", (x, -main_d / 2 - 0.01, BZ + 0.5 + row * 1.0))
 
     # === Balustrade roofline ===
     bmesh_box("RoofSlab", (main_w + 0.08, main_d + 0.08, 0.10), (0, 0, BZ + main_h + 0.05), m['stone_light'])
     # Balustrade posts along front
     n_posts = 16
+    bal_z = BZ + main_h + 0.225
+    py0, py_step = -main_d / 2 + 0.15, (main_d - 0.30) / (n_posts - 1)
     for i in range(n_posts):
-        py = -main_d / 2 + 0.15 + i * (main_d - 0.30) / (n_posts - 1)
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.025, depth=0.25,
-                                            location=(main_w / 2 + 0.04, py, BZ + main_h + 0.225))
-        bal = bpy.context.active_object
-        bal.name = f"Baluster_{i}"
-        bal.data.materials.append(m['stone_light'])
+        bmesh_cylinder(f"Baluster_{i}", 0.025, 0.25, 6,
+                       (main_w / 2 + 0.04, py0 + i * py_step, bal_z), m['stone_light'])
     # Balustrade rail
     bmesh_box("BalRail", (0.06, main_d - 0.10, 0.04),
               (main_w / 2 + 0.04, 0, BZ + main_h + 0.36), m['stone_light'])
     # Side balustrade
+    px0, px_step = -main_w / 2 + 0.25, (main_w - 0.50) / 11
     for i in range(12):
-        px = -main_w / 2 + 0.25 + i * (main_w - 0.50) / 11
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.025, depth=0.25,
-                                            location=(px, -main_d / 2 - 0.04, BZ + main_h + 0.225))
-        bal = bpy.context.active_object
-        bal.name = f"SBaluster_{i}"
-        bal.data.materials.append(m['stone_light'])
+        bmesh_cylinder(f"SBaluster_{i}", 0.025, 0.25, 6,
+                       (px0 + i * px_step, -main_d / 2 - 0.04, bal_z), m['stone_light'])
     bmesh_box("SBalRail", (main_w - 0.20, 0.06, 0.04),
               (0, -main_d / 2 - 0.04, BZ + main_h + 0.36), m['stone_light'])
 
@@ -1054,29 +974,25 @@ def _build_industrial(m):
     # === Iron railings (fence in front) ===
     for i in range(16):
         fy = -2.0 + i * 0.26
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.015, depth=0.60,
-                                            location=(main_w / 2 + 1.20, fy, BZ + 0.15))
-        bpy.context.active_object.name = f"IronRail_{i}"
-        bpy.context.active_object.data.materials.append(m['iron'])
+        bmesh_cylinder(f"IronRail_{i}", 0.015, 0.60, 6, (main_w / 2 + 1.20, fy, BZ + 0.15), m['iron'])
     # Rail bars
     bmesh_box("IronBarTop", (0.03, 4.0, 0.03), (main_w / 2 + 1.20, 0, BZ + 0.42), m['iron'])
     bmesh_box("IronBarBot", (0.03, 4.0, 0.03), (main_w / 2 + 1.20, 0, BZ + 0.10), m['iron'])
 
     # === Steps (grand) ===
-    for i in range(7):
-        bmesh_box(f"Step_{i}", (0.22, 2.0, 0.06),
-                  (main_w / 2 + 0.75 + i * 0.22, 0, BZ - 0.04 - i * 0.05), m['stone_light'])
+    merged_boxes("Steps", (0.22, 2.0, 0.06),
+                 [(main_w / 2 + 0.75 + i * 0.22, 0, BZ - 0.04 - i * 0.05) for i in range(7)],
+                 m['stone_light'])
 
     # === Meander decorative band on facade ===
     _meander_strip("MeanderFacade", main_w - 0.20,
                    (0, -main_d / 2 - 0.02, BZ + main_h - 0.15), m['gold'], axis='x')
 
     # === Flag on roofline ===
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.02, depth=1.0,
-                                        location=(0, 0, BZ + main_h + 0.36 + 0.50))
-    bpy.context.active_object.data.materials.append(m['iron'])
-    fv = [(0.03, 0, BZ + main_h + 1.05), (0.45, 0.02, BZ + main_h + 1.00),
-          (0.45, 0.01, BZ + main_h + 1.28), (0.03, 0, BZ + main_h + 1.30)]
+    bmesh_cylinder("FlagPole", 0.02, 1.0, 6, (0, 0, BZ + main_h + 0.36 + 0.50), m['iron'])
+    base = BZ + main_h
+    fv = [(x, y, base + dz) for x, y, dz in
+          [(0.03, 0, 1.05), (0.45, 0.02, 1.00), (0.45, 0.01, 1.28), (0.03, 0, 1.30)]]
     mesh_from_pydata("Banner", fv, [(0, 1, 2, 3)], m['banner'])
     m['banner'].use_backface_culling = False
 
@@ -1084,6 +1000,7 @@ def _build_industrial(m):
 # ============================================================
 # MODERN AGE -- Greek modernist (Cycladic influence)
 # ============================================================
+@planned("Greeks_Modern", by_material=True)
 def _build_modern(m):
     Z = 0.0
 
@@ -1115,23 +1032,21 @@ def _build_modern(m):
 
     # === Blue accents (Cycladic doors and window frames) ===
     # Large front windows with blue frames
+    front_win = box_factory((0.06, 0.35, 0.80), material=glass)
+    frame_h = box_factory((0.07, 0.38, 0.04), material=m['banner'])  # blue
+    frame_v = box_factory((0.07, 0.04, 0.84), material=m['banner'])
     for y in [-0.60, 0.0, 0.60]:
-        bmesh_box(f"FWin_{y:.1f}", (0.06, 0.35, 0.80),
-                  (main_w / 2 + 0.01, y, BZ + main_h / 2 + 0.30), glass)
+        front_win(f"FWin_{y:.1f}", (main_w / 2 + 0.01, y, BZ + main_h / 2 + 0.30))
         # Blue frame
-        bmesh_box(f"FWinFrame_{y:.1f}_T", (0.07, 0.38, 0.04),
-                  (main_w / 2 + 0.02, y, BZ + main_h / 2 + 0.72), m['banner'])  # blue
-        bmesh_box(f"FWinFrame_{y:.1f}_B", (0.07, 0.38, 0.04),
-                  (main_w / 2 + 0.02, y, BZ + main_h / 2 - 0.12), m['banner'])
-        bmesh_box(f"FWinFrame_{y:.1f}_L", (0.07, 0.04, 0.84),
-                  (main_w / 2 + 0.02, y - 0.17, BZ + main_h / 2 + 0.30), m['banner'])
-        bmesh_box(f"FWinFrame_{y:.1f}_R", (0.07, 0.04, 0.84),
-                  (main_w / 2 + 0.02, y + 0.17, BZ + main_h / 2 + 0.30), m['banner'])
+        frame_h(f"FWinFrame_{y:.1f}_T", (main_w / 2 + 0.02, y, BZ + main_h / 2 + 0.72))
+        frame_h(f"FWinFrame_{y:.1f}_B", (main_w / 2 + 0.02, y, BZ + main_h / 2 - 0.12))
+        frame_v(f"FWinFrame_{y:.1f}_L", (main_w / 2 + 0.02, y - 0.17, BZ + main_h / 2 + 0.30))
+        frame_v(f"FWinFrame_{y:.1f}_R", (main_w / 2 + 0.02, y + 0.17, BZ + main_h / 2 + 0.30))
 
     # Secondary block windows
+    sec_win = box_factory((0.06, 0.28, 0.50), material=glass)
     for wy in [0.30, 0.80, 1.30]:
-        bmesh_box(f"SWin_{wy:.1f}", (0.06, 0.28, 0.50),
-                  (-1.2 - sec_w / 2 - 0.01, wy, BZ + sec_h / 2 + 0.40), glass)
+        sec_win(f"SWin_{wy:.1f}", (-1.2 - sec_w / 2 - 0.01, wy, BZ + sec_h / 2 + 0.40))
 
     # Tertiary block large glass wall
     bmesh_box("TGlass", (0.06, ter_d - 0.30, ter_h - 0.30),
@@ -1141,10 +1056,8 @@ def _build_modern(m):
     # Terrace railing (blue accented)
     for i in range(8):
         py = -main_d / 2 + 0.15 + i * (main_d - 0.30) / 7
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.02, depth=0.35,
-                                            location=(main_w / 2 + 0.02, py, BZ + main_h + 0.08 + 0.175))
-        bpy.context.active_object.name = f"TerRail_{i}"
-        bpy.context.active_object.data.materials.append(m['banner'])  # blue
+        bmesh_cylinder(f"TerRail_{i}", 0.02, 0.35, 6,
+                       (main_w / 2 + 0.02, py, BZ + main_h + 0.08 + 0.175), m['banner'])  # blue
     bmesh_box("TerRailBar", (0.04, main_d - 0.10, 0.03),
               (main_w / 2 + 0.02, 0, BZ + main_h + 0.40), m['banner'])
 
@@ -1159,28 +1072,24 @@ def _build_modern(m):
     pergola_x = main_w / 2 + 0.80
     for py in [-0.80, 0, 0.80]:
         # Slim metal posts
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.025, depth=2.0,
-                                            location=(pergola_x, py, BZ + 1.0))
-        bpy.context.active_object.name = f"PergolaPost_{py:.1f}"
-        bpy.context.active_object.data.materials.append(metal)
+        bmesh_cylinder(f"PergolaPost_{py:.1f}", 0.025, 2.0, 6, (pergola_x, py, BZ + 1.0), metal)
     # Horizontal beams
     bmesh_box("PergolaBeam1", (0.04, 2.0, 0.04), (pergola_x, 0, BZ + 2.0), metal)
-    bmesh_box("PergolaBeam2", (0.60, 0.04, 0.04), (pergola_x, -0.40, BZ + 2.0), metal)
-    bmesh_box("PergolaBeam3", (0.60, 0.04, 0.04), (pergola_x, 0.40, BZ + 2.0), metal)
+    cross_beam = box_factory((0.60, 0.04, 0.04), material=metal)
+    cross_beam("PergolaBeam2", (pergola_x, -0.40, BZ + 2.0))
+    cross_beam("PergolaBeam3", (pergola_x, 0.40, BZ + 2.0))
 
     # === Planter boxes with bougainvillea suggestion ===
+    planter = box_factory((0.35, 0.30, 0.30), material=m['stone_light'])
     for px, py in [(main_w / 2 + 0.50, -1.2), (main_w / 2 + 0.50, 1.2)]:
-        bmesh_box(f"Planter_{py:.1f}", (0.35, 0.30, 0.30), (px, py, Z + 0.15), m['stone_light'])
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.18, location=(px, py, Z + 0.40))
-        plant = bpy.context.active_object
-        plant.name = f"Plant_{py:.1f}"
-        plant.scale = (1.2, 1, 0.7)
-        plant.data.materials.append(m['banner'])  # purple/blue flowers
+        planter(f"Planter_{py:.1f}", (px, py, Z + 0.15))
+        uv_sphere(f"Plant_{py:.1f}", 0.18, (px, py, Z + 0.40), m['banner'],  # purple/blue flowers
+                  scale=(1.2, 1, 0.7))
 
     # === Steps ===
-    for i in range(4):
-        bmesh_box(f"Step_{i}", (0.22, 1.2, 0.06),
-                  (main_w / 2 + 0.30 + i * 0.22, 0, BZ - 0.02 - i * 0.04), m['stone_light'])
+    merged_boxes("Steps", (0.22, 1.2, 0.06),
+                 [(main_w / 2 + 0.30 + i * 0.22, 0, BZ - 0.02 - i * 0.04) for i in range(4)],
+                 m['stone_light'])
 
     # === Paved courtyard ===
     bmesh_box("Court", (2.5, 4.0, 0.04), (main_w / 2 + 1.00, 0, Z + 0.06), m['stone_dark'])
@@ -1189,6 +1098,7 @@ def _build_modern(m):
 # ============================================================
 # DIGITAL AGE -- Futuristic Greek
 # ============================================================
+@planned("Greeks_Digital", by_material=True, fuse={'gold': "HoloWireframe"})
 def _build_digital(m):
     Z = 0.0
 
@@ -1201,14 +1111,12 @@ def _build_digital(m):
     metal = m.get('metal', m['iron'])
 
     # === Stepped crepidoma platform (futuristic marble with LED edges) ===
-    for i in range(3):
-        step_w = 5.0 - i * 0.25
-        step_d = 3.6 - i * 0.18
-        bmesh_box(f"Crep_{i}", (step_w, step_d, 0.10),
-                  (0, 0, BZ + i * 0.10 + 0.05), m['stone_light'], bevel=0.02)
-        # LED edge on each step
-        bmesh_box(f"CrepLED_{i}", (step_w + 0.02, step_d + 0.02, 0.02),
-                  (0, 0, BZ + i * 0.10 + 0.10), m['gold'])
+    crep = [(5.0 - i * 0.25, 3.6 - i * 0.18, BZ + i * 0.10) for i in range(3)]
+    merged_boxes("Crepidoma", [(w, d, 0.10) for w, d, z in crep],
+                 [(0, 0, z + 0.05) for w, d, z in crep], m['stone_light'], bevel=0.02)
+    # LED edge on each step
+    merged_boxes("CrepLED", [(w + 0.02, d + 0.02, 0.02) for w, d, z in crep],
+                 [(0, 0, z + 0.10) for w, d, z in crep], m['gold'])
 
     PZ = BZ + 0.30  # platform top
 
@@ -1216,12 +1124,14 @@ def _build_digital(m):
     cella_w, cella_d, cella_h = 2.4, 1.6, 2.8
     bmesh_box("Cella", (cella_w, cella_d, cella_h), (0, 0, PZ + cella_h / 2), glass)
     # Metal frame structure
+    cella_frame = box_factory((cella_w + 0.02, cella_d + 0.02, 0.04), material=metal)
     for z in [PZ + 0.5, PZ + 1.4, PZ + 2.3]:
-        bmesh_box(f"CellaFrame_{z:.1f}", (cella_w + 0.02, cella_d + 0.02, 0.04), (0, 0, z), metal)
+        cella_frame(f"CellaFrame_{z:.1f}", (0, 0, z))
     # Vertical frame edges
+    cella_vert = box_factory((0.04, 0.04, cella_h), material=metal)
     for cx, cy in [(-cella_w / 2, -cella_d / 2), (cella_w / 2, -cella_d / 2),
                    (-cella_w / 2, cella_d / 2), (cella_w / 2, cella_d / 2)]:
-        bmesh_box(f"CellaVert_{cx:.1f}_{cy:.1f}", (0.04, 0.04, cella_h), (cx, cy, PZ + cella_h / 2), metal)
+        cella_vert(f"CellaVert_{cx:.1f}_{cy:.1f}", (cx, cy, PZ + cella_h / 2))
 
     # === Floating marble columns (hovering above platform) ===
     # Columns don't touch the ground -- a 0.15 gap underneath
@@ -1231,71 +1141,45 @@ def _build_digital(m):
     n_front = 8
     sty_w = 4.2
     sty_d = 2.8
+    col_z = PZ + float_gap
+    shaft_z, glow_z = col_z + col_h / 2, col_z - 0.015
+    front_y, back_y = -sty_d / 2 + 0.20, sty_d / 2 - 0.20
+    cx0, cx_step = -sty_w / 2 + 0.30, (sty_w - 0.60) / (n_front - 1)
     for i in range(n_front):
-        cx = -sty_w / 2 + 0.30 + i * (sty_w - 0.60) / (n_front - 1)
+        cx = cx0 + i * cx_step
         # Front row
-        col_z = PZ + float_gap
-        bpy.ops.mesh.primitive_cylinder_add(vertices=14, radius=col_r, depth=col_h,
-                                            location=(cx, -sty_d / 2 + 0.20, col_z + col_h / 2))
-        shaft = bpy.context.active_object
-        shaft.name = f"FCol_{i}"
-        shaft.data.materials.append(m['stone_light'])
-        for p in shaft.data.polygons:
-            p.use_smooth = True
+        bmesh_cylinder(f"FCol_{i}", col_r, col_h, 14, (cx, front_y, shaft_z),
+                       m['stone_light'], smooth=True)
         # Glowing base ring
-        bmesh_prism(f"FColGlow_{i}", col_r + 0.03, 0.03, 14,
-                    (cx, -sty_d / 2 + 0.20, col_z - 0.015), m['gold'])
+        bmesh_prism(f"FColGlow_{i}", col_r + 0.03, 0.03, 14, (cx, front_y, glow_z), m['gold'])
         # Back row
-        bpy.ops.mesh.primitive_cylinder_add(vertices=14, radius=col_r, depth=col_h,
-                                            location=(cx, sty_d / 2 - 0.20, col_z + col_h / 2))
-        shaft2 = bpy.context.active_object
-        shaft2.name = f"BCol_{i}"
-        shaft2.data.materials.append(m['stone_light'])
-        for p in shaft2.data.polygons:
-            p.use_smooth = True
-        bmesh_prism(f"BColGlow_{i}", col_r + 0.03, 0.03, 14,
-                    (cx, sty_d / 2 - 0.20, col_z - 0.015), m['gold'])
+        bmesh_cylinder(f"BCol_{i}", col_r, col_h, 14, (cx, back_y, shaft_z),
+                       m['stone_light'], smooth=True)
+        bmesh_prism(f"BColGlow_{i}", col_r + 0.03, 0.03, 14, (cx, back_y, glow_z), m['gold'])
 
     # Side columns
     n_side = 4
+    cy0, cy_step = -sty_d / 2 + 0.55, (sty_d - 1.10) / max(n_side - 1, 1)
+    side_x = [(-sty_w / 2 + 0.20, "L"), (sty_w / 2 - 0.20, "R")]
     for i in range(n_side):
-        cy = -sty_d / 2 + 0.55 + i * (sty_d - 1.10) / max(n_side - 1, 1)
-        for sx, lbl in [(-sty_w / 2 + 0.20, "L"), (sty_w / 2 - 0.20, "R")]:
-            col_z = PZ + float_gap
-            bpy.ops.mesh.primitive_cylinder_add(vertices=14, radius=col_r, depth=col_h,
-                                                location=(sx, cy, col_z + col_h / 2))
-            shaft = bpy.context.active_object
-            shaft.name = f"{lbl}Col_{i}"
-            shaft.data.materials.append(m['stone_light'])
-            for p in shaft.data.polygons:
-                p.use_smooth = True
-            bmesh_prism(f"{lbl}ColGlow_{i}", col_r + 0.03, 0.03, 14,
-                        (sx, cy, col_z - 0.015), m['gold'])
+        cy = cy0 + i * cy_step
+        for sx, lbl in side_x:
+            bmesh_cylinder(f"{lbl}Col_{i}", col_r, col_h, 14, (sx, cy, shaft_z),
+                           m['stone_light'], smooth=True)
+            bmesh_prism(f"{lbl}ColGlow_{i}", col_r + 0.03, 0.03, 14, (sx, cy, glow_z), m['gold'])
 
     # === Holographic Parthenon outline (wireframe entablature) ===
     ent_z = PZ + float_gap + col_h + 0.05
     # Thin glowing gold wireframe around the entablature
     # Top frame
-    bmesh_box("HoloEntF", (sty_w + 0.10, 0.03, 0.03), (0, -sty_d / 2 + 0.10, ent_z), m['gold'])
-    bmesh_box("HoloEntB", (sty_w + 0.10, 0.03, 0.03), (0, sty_d / 2 - 0.10, ent_z), m['gold'])
-    bmesh_box("HoloEntL", (0.03, sty_d - 0.10, 0.03), (-sty_w / 2 + 0.10, 0, ent_z), m['gold'])
-    bmesh_box("HoloEntR", (0.03, sty_d - 0.10, 0.03), (sty_w / 2 - 0.10, 0, ent_z), m['gold'])
+    _rect_frame("HoloEnt", sty_w + 0.10, sty_d - 0.10, sty_w / 2 - 0.10, sty_d / 2 - 0.10,
+                ent_z, 0.03, m['gold'])
 
-    # Holographic pediment outline (front)
+    # Holographic pediment outlines (front and back)
     ped_z = ent_z + 0.05
-    pv = [
-        (-sty_w / 2, -sty_d / 2 + 0.08, ped_z),
-        (sty_w / 2, -sty_d / 2 + 0.08, ped_z),
-        (0, -sty_d / 2 + 0.08, ped_z + 0.80),
-    ]
-    mesh_from_pydata("HoloPedF", pv, [(0, 1, 2)], m['gold'])
-    # Back pediment
-    pvb = [
-        (-sty_w / 2, sty_d / 2 - 0.08, ped_z),
-        (sty_w / 2, sty_d / 2 - 0.08, ped_z),
-        (0, sty_d / 2 - 0.08, ped_z + 0.80),
-    ]
-    mesh_from_pydata("HoloPedB", pvb, [(0, 1, 2)], m['gold'])
+    ped = [(-sty_w / 2, 0.0), (sty_w / 2, 0.0), (0.0, 0.80)]
+    pv = [(x, y, ped_z + dz) for y in (-sty_d / 2 + 0.08, sty_d / 2 - 0.08) for x, dz in ped]
+    mesh_from_pydata("HoloPeds", pv, [(0, 1, 2), (3, 4, 5)], m['gold'])
 
     # Ridge line (holographic)
     bmesh_box("HoloRidge", (0.02, sty_d - 0.20, 0.02), (0, 0, ped_z + 0.80), m['gold'])
@@ -1306,24 +1190,16 @@ def _build_digital(m):
                       (-sty_w / 2 + 0.20, sty_d / 2 - 0.20),
                       (sty_w / 2 - 0.20, sty_d / 2 - 0.20)]
     for i, (bx, by) in enumerate(beam_positions):
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.015, depth=col_h + 0.30,
-                                            location=(bx, by, PZ + float_gap + col_h / 2))
-        beam = bpy.context.active_object
-        beam.name = f"EBeam_{i}"
-        beam.data.materials.append(m['gold'])
+        bmesh_cylinder(f"EBeam_{i}", 0.015, col_h + 0.30, 8, (bx, by, PZ + float_gap + col_h / 2),
+                       m['gold'])
 
     # Horizontal energy beams connecting corner columns at mid-height
     beam_h = PZ + float_gap + col_h / 2
-    bmesh_box("HBeamF", (sty_w - 0.30, 0.02, 0.02), (0, -sty_d / 2 + 0.20, beam_h), m['gold'])
-    bmesh_box("HBeamB", (sty_w - 0.30, 0.02, 0.02), (0, sty_d / 2 - 0.20, beam_h), m['gold'])
-    bmesh_box("HBeamL", (0.02, sty_d - 0.30, 0.02), (-sty_w / 2 + 0.20, 0, beam_h), m['gold'])
-    bmesh_box("HBeamR", (0.02, sty_d - 0.30, 0.02), (sty_w / 2 - 0.20, 0, beam_h), m['gold'])
+    _rect_frame("HBeam", sty_w - 0.30, sty_d - 0.30, sty_w / 2 - 0.20, sty_d / 2 - 0.20,
+                beam_h, 0.02, m['gold'])
 
     # === LED accent strips at platform base ===
-    bmesh_box("BaseLED_F", (5.02, 0.04, 0.04), (0, -1.81, BZ + 0.02), m['gold'])
-    bmesh_box("BaseLED_B", (5.02, 0.04, 0.04), (0, 1.81, BZ + 0.02), m['gold'])
-    bmesh_box("BaseLED_L", (0.04, 3.62, 0.04), (-2.51, 0, BZ + 0.02), m['gold'])
-    bmesh_box("BaseLED_R", (0.04, 3.62, 0.04), (2.51, 0, BZ + 0.02), m['gold'])
+    _rect_frame("BaseLED", 5.02, 3.62, 2.51, 1.81, BZ + 0.02, 0.04, m['gold'])
 
     # === Floating glass roof canopy ===
     canopy_z = ped_z + 0.90
@@ -1331,10 +1207,7 @@ def _build_digital(m):
     bmesh_box("CanopyFrame", (sty_w - 0.48, sty_d - 0.48, 0.02), (0, 0, canopy_z + 0.03), metal)
 
     # === Communication spire (modern antenna) ===
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.03, depth=1.8,
-                                        location=(0, 0, canopy_z + 0.04 + 0.90))
-    bpy.context.active_object.name = "Spire"
-    bpy.context.active_object.data.materials.append(metal)
+    bmesh_cylinder("Spire", 0.03, 1.8, 8, (0, 0, canopy_z + 0.04 + 0.90), metal)
     # LED rings on spire
     for z_off in [0.4, 0.9, 1.4]:
         bmesh_prism(f"SpireLED_{z_off:.1f}", 0.08, 0.04, 12,
@@ -1365,7 +1238,17 @@ AGE_BUILDERS = {
 }
 
 
+# Objects and shared meshes of the last Greek Town Center build
+_SCOPE = new_scope()
+
+
 def build_town_center_greeks(materials, age='medieval'):
     """Build a Greeks nation Town Center with geometry appropriate for the given age."""
+    # Hand back the previous build's meshes/objects so a rebuild reuses them
+    release_all(_SCOPE)
     builder = AGE_BUILDERS.get(age, _build_medieval)
-    builder(materials)
+    set_scope(_SCOPE)
+    try:
+        builder(materials)
+    finally:
+        set_scope(None)
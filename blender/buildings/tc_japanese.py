@@ -25,18 +25,46 @@ Digital:       Ultra-modern Japanese — sleek tower with floating curved roof t
                cherry blossom hologram, LED torii gate
 """
 
-import bpy
-import bmesh
 import math
+from functools import lru_cache
+import numpy as np
 
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from lib.geometry import bmesh_box, bmesh_prism, bmesh_cone, pyramid_roof, mesh_from_pydata
+from lib.geometry import (bmesh_box, bmesh_prism, bmesh_cone, bmesh_cylinder, uv_sphere, pyramid_roof,
+                          mesh_from_pydata, mesh_from_arrays, mesh_instances, merged_boxes, merged_spheres,
+                          face_loops, frustum_arrays, ring_table, release_all, new_scope, set_scope)
+from lib.plan import planned
 
 
 # ── helpers ────────────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def _hip_fan_topology(n_eave):
+    """Apex-to-eave triangle fan plus the bottom n-gon closing the eave ring."""
+    ring = np.arange(1, n_eave + 1, dtype=np.int32)
+    fan = np.stack([np.zeros(n_eave, dtype=np.int32), ring, np.roll(ring, -1)], axis=-1).ravel()
+    loop_totals = np.full(n_eave + 1, 3, dtype=np.int32)
+    loop_totals[-1] = n_eave
+    return np.concatenate([fan, ring[::-1]]), loop_totals
+
+
+def _eave_ring(hw, hd, curve_up, segments):
+    """(4 * segments - 3, 3) eave ring around the origin — 4 sides, corners lifted by curve_up."""
+    t = np.linspace(0.0, 1.0, segments, dtype=np.float32)
+    corner_dist = np.minimum(t, 1 - t) * 2  # 0 at corners, 1 at midpoint
+    lift = curve_up * (1 - corner_dist)
+    tail, tail_lift = t[1:], lift[1:]  # later sides skip their first (shared) corner
+    ring = np.empty((4 * segments - 3, 3), dtype=np.float32)
+    ring[:, 0] = np.concatenate([np.full(segments, hw), hw - tail * 2 * hw,
+                                 np.full(segments - 1, -hw), -hw + tail * 2 * hw])
+    ring[:, 1] = np.concatenate([-hd + t * 2 * hd, np.full(segments - 1, hd),
+                                 hd - tail * 2 * hd, np.full(segments - 1, -hd)])
+    ring[:, 2] = np.concatenate([lift, tail_lift, tail_lift, tail_lift])
+    return ring
+
+
 def _curved_roof(name, w, d, h, origin, material, overhang=0.25,
                  curve_up=0.15, segments=8):
     """
@@ -48,98 +76,98 @@ def _curved_roof(name, w, d, h, origin, material, overhang=0.25,
     overhang — eave overshoot beyond w/d
     curve_up — how much the corners lift
     """
-    ox, oy, oz = origin
-    hw = w / 2 + overhang
-    hd = d / 2 + overhang
-
-    verts = []
-    faces = []
-
-    # apex (single ridge point for a hip roof)
-    apex_idx = 0
-    verts.append((ox, oy, oz + h))
-
-    # eave ring — 4 sides, each subdivided for curve
-    ring_start = 1
-    pts_per_side = segments
-
-    # generate eave points around the perimeter with upward curve at corners
-    eave = []
-    # front edge (+x): from (+hw, -hd) to (+hw, +hd)
-    for i in range(pts_per_side):
-        t = i / (pts_per_side - 1)
-        y = -hd + t * 2 * hd
-        # corners curve up
-        corner_dist = min(abs(t), abs(1 - t)) * 2  # 0 at corners, 1 at midpoint
-        lift = curve_up * (1 - corner_dist)
-        eave.append((ox + hw, oy + y, oz + lift))
-    # right edge (-y): from (+hw, +hd) to (-hw, +hd)  — skip first (shared corner)
-    for i in range(1, pts_per_side):
-        t = i / (pts_per_side - 1)
-        x = hw - t * 2 * hw
-        corner_dist = min(abs(t), abs(1 - t)) * 2
-        lift = curve_up * (1 - corner_dist)
-        eave.append((ox + x, oy + hd, oz + lift))
-    # back edge (-x): from (-hw, +hd) to (-hw, -hd)  — skip first
-    for i in range(1, pts_per_side):
-        t = i / (pts_per_side - 1)
-        y = hd - t * 2 * hd
-        corner_dist = min(abs(t), abs(1 - t)) * 2
-        lift = curve_up * (1 - corner_dist)
-        eave.append((ox - hw, oy + y, oz + lift))
-    # left edge (+y): from (-hw, -hd) to (+hw, -hd)  — skip first
-    for i in range(1, pts_per_side):
-        t = i / (pts_per_side - 1)
-        x = -hw + t * 2 * hw
-        corner_dist = min(abs(t), abs(1 - t)) * 2
-        lift = curve_up * (1 - corner_dist)
-        eave.append((ox + x, oy - hd, oz + lift))
-
-    for pt in eave:
-        verts.append(pt)
-
-    n_eave = len(eave)
-    for i in range(n_eave):
-        j = (i + 1) % n_eave
-        faces.append((apex_idx, ring_start + i, ring_start + j))
-
-    # bottom face (close eave ring)
-    bottom = list(range(ring_start, ring_start + n_eave))
-    faces.append(tuple(reversed(bottom)))
-
-    obj = mesh_from_pydata(name, verts, faces, material)
-    for p in obj.data.polygons:
-        p.use_smooth = True
-    return obj
+    shape = _curved_roof_shape(round(w, 3), round(d, 3), round(h, 3), round(overhang, 3),
+                               round(curve_up, 3), segments)
+    return mesh_from_arrays(name, shape + np.asarray(origin, dtype=np.float32),
+                            *_hip_fan_topology(len(shape) - 1), material, smooth=True)
+
+
+@lru_cache(maxsize=256)
+def _curved_roof_shape(w, d, h, overhang, curve_up, segments):
+    """_curved_roof vertices around the origin, cached — builders repeat the same few roofs.
+
+    Callers must not modify the returned array.
+    """
+    eave = _eave_ring(w / 2 + overhang, d / 2 + overhang, curve_up, segments)
+
+    # apex (single ridge point for a hip roof) followed by the eave ring
+    verts = np.empty((len(eave) + 1, 3), dtype=np.float32)
+    verts[0] = (0, 0, h)
+    verts[1:] = eave
+    return verts
+
+
+def _tier_frame(name, w, d, h, z, beam, material, post_xs=(), ends=0):
+    """Timber framing of one tenshu tier as a single mesh.
+
+    Top and bottom beams along both long faces, plus vertical posts at
+    `post_xs` on them; `ends` adds the top (1) or top and bottom (2) beams
+    across both short ends. beam = (thickness, height).
+    """
+    bt, bh = beam
+    fx, fy = w / 2 + 0.01, d / 2 + 0.01
+    levels = (z + h, z + 0.02)
+    sizes = [(w, bt, bh)] * 4
+    origins = [(0, s * fy, lz) for s in (-1, 1) for lz in levels]
+    sizes += [(bh, bt, h)] * (2 * len(post_xs))
+    origins += [(x, s * fy, z + h / 2) for s in (-1, 1) for x in post_xs]
+    if ends:
+        sizes += [(bt, d, bh)] * (2 * ends)
+        origins += [(s * fx, 0, lz) for s in (-1, 1) for lz in levels[:ends]]
+    return merged_boxes(name, sizes, origins, material)
+
+
+# Rotation laying a cylinder along Y (katsuogi logs across the ridge)
+_LYING = (math.radians(90), 0, 0)
+
+# Unit rectangle corners, and the faces of the two fixed-topology shapes below
+_RECT = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float32)
+_GABLE_LOOPS = face_loops([(0, 1, 5, 4), (2, 3, 4, 5), (0, 3, 4), (1, 2, 5)])
+_BATTER_LOOPS = face_loops([(0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5),
+                            (2, 3, 7, 6), (3, 0, 4, 7)])
+
+
+def _gable_roof(name, hw, hd, ridge_hw, h, origin, material, smooth=False):
+    """Thatched gable roof: a 2hw x 2hd eave rectangle rising h to a ridge 2ridge_hw long."""
+    verts = np.zeros((6, 3), dtype=np.float32)
+    verts[:4, :2] = _RECT * (hw, hd)
+    verts[4:, 0] = (-ridge_hw, ridge_hw)
+    verts[4:, 2] = h
+    return mesh_from_arrays(name, verts + np.asarray(origin, dtype=np.float32), *_GABLE_LOOPS,
+                            material, smooth=smooth)
+
+
+def _battered_base(name, base_w, base_d, top_w, top_d, h, origin, material):
+    """Ishigaki — battered stone base, a truncated pyramid from base_w x base_d to top_w x top_d."""
+    verts = np.zeros((8, 3), dtype=np.float32)
+    verts[:4, :2] = _RECT * (base_w / 2, base_d / 2)
+    verts[4:, :2] = _RECT * (top_w / 2, top_d / 2)
+    verts[4:, 2] = h
+    return mesh_from_arrays(name, verts + np.asarray(origin, dtype=np.float32), *_BATTER_LOOPS, material)
+
+
+@lru_cache(maxsize=None)
+def _kasagi_arrays(w):
+    """Kasagi top beam for a gate of width w, centred on the origin — wider on top than below."""
+    lo, hi = w / 2 + 0.12, w / 2 + 0.15
+    verts = np.array([(-lo, -0.04, 0), (lo, -0.04, 0), (lo, 0.04, 0), (-lo, 0.04, 0),
+                      (-hi, -0.04, 0.06), (hi, -0.04, 0.06), (hi, 0.04, 0.06), (-hi, 0.04, 0.06)],
+                     dtype=np.float32)
+    return (verts,) + face_loops([(0, 1, 2, 3), (4, 5, 6, 7),
+                                  (0, 1, 5, 4), (2, 3, 7, 6),
+                                  (0, 3, 7, 4), (1, 2, 6, 5)])
 
 
 def _torii_gate(prefix, cx, cy, z, h, w, mat_pillar, mat_beam):
     """Small torii gate."""
-    # two pillars
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.05, depth=h,
-                                        location=(cx - w / 2, cy, z + h / 2))
-    p1 = bpy.context.active_object
-    p1.name = f"{prefix}_PillarL"
-    p1.data.materials.append(mat_pillar)
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.05, depth=h,
-                                        location=(cx + w / 2, cy, z + h / 2))
-    p2 = bpy.context.active_object
-    p2.name = f"{prefix}_PillarR"
-    p2.data.materials.append(mat_pillar)
+    # two pillars (one shared cylinder mesh)
+    bmesh_cylinder(f"{prefix}_PillarL", 0.05, h, 8, (cx - w / 2, cy, z + h / 2), mat_pillar)
+    bmesh_cylinder(f"{prefix}_PillarR", 0.05, h, 8, (cx + w / 2, cy, z + h / 2), mat_pillar)
     # kasagi (top beam, slightly curved up at ends)
     top_z = z + h
-    bv = [(cx - w / 2 - 0.12, cy - 0.04, top_z + 0.06),
-          (cx + w / 2 + 0.12, cy - 0.04, top_z + 0.06),
-          (cx + w / 2 + 0.12, cy + 0.04, top_z + 0.06),
-          (cx - w / 2 - 0.12, cy + 0.04, top_z + 0.06),
-          (cx - w / 2 - 0.15, cy - 0.04, top_z + 0.12),
-          (cx + w / 2 + 0.15, cy - 0.04, top_z + 0.12),
-          (cx + w / 2 + 0.15, cy + 0.04, top_z + 0.12),
-          (cx - w / 2 - 0.15, cy + 0.04, top_z + 0.12)]
-    mesh_from_pydata(f"{prefix}_Kasagi", bv,
-                     [(0, 1, 2, 3), (4, 5, 6, 7),
-                      (0, 1, 5, 4), (2, 3, 7, 6),
-                      (0, 3, 7, 4), (1, 2, 6, 5)], mat_beam)
+    verts, loop_verts, loop_totals = _kasagi_arrays(w)
+    mesh_from_arrays(f"{prefix}_Kasagi", verts + np.array([cx, cy, top_z + 0.06], dtype=np.float32),
+                     loop_verts, loop_totals, mat_beam)
     # nuki (lower crossbeam)
     bmesh_box(f"{prefix}_Nuki", (w + 0.06, 0.06, 0.05),
               (cx, cy, top_z - 0.15), mat_beam)
@@ -148,6 +176,7 @@ def _torii_gate(prefix, cx, cy, z, h, w, mat_pillar, mat_beam):
 # ============================================================
 # STONE AGE — Jomon pit dwelling compound
 # ============================================================
+@planned("Japanese_Stone", merge=True)
 def _build_stone(m):
     Z = 0.0
 
@@ -164,10 +193,9 @@ def _build_stone(m):
     bmesh_prism("SmokeHole", 0.18, 0.12, 8, (0, 0, Z + 2.20), m['wood'])
 
     # Ridge poles visible under thatch
-    for i in range(8):
-        a = (2 * math.pi * i) / 8
-        ex, ey = 1.7 * math.cos(a), 1.7 * math.sin(a)
-        sv = [(ex, ey, Z + 0.10), (0, 0, Z + 2.25)]
+    cos8, sin8 = (t.tolist() for t in ring_table(8))
+    for i, (c, s) in enumerate(zip(cos8, sin8)):
+        sv = [(1.7 * c, 1.7 * s, Z + 0.10), (0, 0, Z + 2.25)]
         mesh_from_pydata(f"Ridge_{i}", sv, [], m['wood_dark'])
 
     # Entrance passage (low tunnel)
@@ -175,26 +203,16 @@ def _build_stone(m):
     bmesh_box("EntrDoor", (0.06, 0.40, 0.50), (2.10, 0, Z + 0.28), m['door'])
 
     # Support posts around interior (visible through doorway)
-    for i in range(6):
-        a = (2 * math.pi * i) / 6
-        px, py = 1.1 * math.cos(a), 1.1 * math.sin(a)
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.06, depth=2.0,
-                                            location=(px, py, Z + 1.0))
-        pole = bpy.context.active_object
-        pole.name = f"Post_{i}"
-        pole.data.materials.append(m['wood'])
+    cos6, sin6 = ring_table(6)
+    for i, (px, py) in enumerate(zip((1.1 * cos6).tolist(), (1.1 * sin6).tolist())):
+        bmesh_cylinder(f"Post_{i}", 0.06, 2.0, 6, (px, py, Z + 1.0), m['wood'])
 
     # === Central firepit (outdoor gathering) ===
     bmesh_prism("FirePit", 0.35, 0.10, 10, (1.8, -1.2, Z + 0.02), m['stone_dark'])
     # Stones around pit
-    for i in range(8):
-        a = (2 * math.pi * i) / 8
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.06,
-                                              location=(1.8 + 0.30 * math.cos(a),
-                                                        -1.2 + 0.30 * math.sin(a), Z + 0.06))
-        st = bpy.context.active_object
-        st.name = f"FStone_{i}"
-        st.data.materials.append(m['stone'])
+    for i, (c, s) in enumerate(zip(cos8, sin8)):
+        uv_sphere(f"FStone_{i}", 0.06, (1.8 + 0.30 * c, -1.2 + 0.30 * s, Z + 0.06), m['stone'],
+                  segments=8, rings=4)
 
     # === Secondary pit dwelling (smaller) ===
     bmesh_prism("Pit2Rim", 0.85, 0.10, 10, (-1.5, 1.2, Z), m['stone_dark'])
@@ -205,12 +223,9 @@ def _build_stone(m):
     SX, SY = -1.6, -1.4
     stilt_h = 0.9
     # Four stilts
-    for dx, dy in [(-0.35, -0.30), (-0.35, 0.30), (0.35, -0.30), (0.35, 0.30)]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.05, depth=stilt_h,
-                                            location=(SX + dx, SY + dy, Z + stilt_h / 2))
-        s = bpy.context.active_object
-        s.name = f"Stilt_{dx:.1f}_{dy:.1f}"
-        s.data.materials.append(m['wood'])
+    for i, (dx, dy) in enumerate([(-0.35, -0.30), (-0.35, 0.30), (0.35, -0.30), (0.35, 0.30)]):
+        bmesh_cylinder(f"Stilt_{i}", 0.05, stilt_h, 6,
+                       (SX + dx, SY + dy, Z + stilt_h / 2), m['wood'])
 
     # Platform
     bmesh_box("StorePlatform", (0.85, 0.75, 0.06), (SX, SY, Z + stilt_h + 0.03), m['wood'])
@@ -221,28 +236,24 @@ def _build_stone(m):
 
     # Ladder to storage
     bmesh_box("Ladder", (0.06, 0.25, 1.0), (SX + 0.50, SY, Z + 0.50), m['wood'])
-    for rz in [0.25, 0.45, 0.65, 0.85]:
-        bmesh_box(f"Rung_{rz:.2f}", (0.04, 0.30, 0.03), (SX + 0.50, SY, Z + rz), m['wood_dark'])
+    for i, rz in enumerate([0.25, 0.45, 0.65, 0.85]):
+        bmesh_box(f"Rung_{i}", (0.04, 0.30, 0.03), (SX + 0.50, SY, Z + rz), m['wood_dark'])
 
     # === Drying rack ===
-    for dy in [-0.30, 0.30]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.03, depth=1.1,
-                                            location=(1.8, 1.3 + dy, Z + 0.55))
-        bpy.context.active_object.data.materials.append(m['wood'])
+    for i, dy in enumerate([-0.30, 0.30]):
+        bmesh_cylinder(f"RackPole_{i}", 0.03, 1.1, 6, (1.8, 1.3 + dy, Z + 0.55), m['wood'])
     bmesh_box("DryBeam", (0.04, 0.65, 0.04), (1.8, 1.3, Z + 1.10), m['wood'])
 
     # === Jomon pottery decoration ===
     for i, (px, py) in enumerate([(2.2, -0.5), (2.1, 0.5)]):
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.10, location=(px, py, Z + 0.10))
-        pot = bpy.context.active_object
-        pot.name = f"Pot_{i}"
-        pot.scale = (1, 1, 0.85)
-        pot.data.materials.append(m['roof_edge'])
+        uv_sphere(f"Pot_{i}", 0.10, (px, py, Z + 0.10), m['roof_edge'], scale=(1, 1, 0.85),
+                  segments=12, rings=6)
 
 
 # ============================================================
 # BRONZE AGE — Yayoi raised-floor granary village
 # ============================================================
+@planned("Japanese_Bronze", merge=True)
 def _build_bronze(m):
     Z = 0.0
 
@@ -253,12 +264,9 @@ def _build_bronze(m):
     # Heavy pillars
     pillar_positions = [(-0.70, -0.55), (-0.70, 0.55), (0.70, -0.55), (0.70, 0.55),
                         (0, -0.55), (0, 0.55)]
-    for px, py in pillar_positions:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.08, depth=stilt_h,
-                                            location=(px, py, Z + stilt_h / 2))
-        p = bpy.context.active_object
-        p.name = f"MainPillar_{px:.1f}_{py:.1f}"
-        p.data.materials.append(m['wood'])
+    for i, (px, py) in enumerate(pillar_positions):
+        bmesh_cylinder(f"MainPillar_{i}", 0.08, stilt_h, 8,
+                       (px, py, Z + stilt_h / 2), m['wood'])
 
     # Floor platform
     fl_z = Z + stilt_h
@@ -273,49 +281,35 @@ def _build_bronze(m):
 
     # Distinctive thatched gable roof with extended ridge
     roof_base = fl_z + 0.08 + wall_h
-    rv = [(-0.95, -0.75, roof_base), (0.95, -0.75, roof_base),
-          (0.95, 0.75, roof_base), (-0.95, 0.75, roof_base),
-          (-1.10, 0, roof_base + 1.1), (1.10, 0, roof_base + 1.1)]
-    rf = [(0, 1, 5, 4), (2, 3, 4, 5), (0, 3, 4), (1, 2, 5)]
-    r = mesh_from_pydata("MainRoof", rv, rf, m['roof'])
-    for p in r.data.polygons:
-        p.use_smooth = True
+    _gable_roof("MainRoof", 0.95, 0.75, 1.10, 1.1, (0, 0, roof_base), m['roof'], smooth=True)
 
     # Chigi (crossed ridge-end timbers, distinctive Yayoi/Shinto feature)
     ridge_z = roof_base + 1.1
     for xs, lbl in [(-1, "B"), (1, "F")]:
-        for dy in [-0.06, 0.06]:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.03, depth=0.7,
-                                                location=(xs * 1.10, dy, ridge_z + 0.15))
-            ch = bpy.context.active_object
-            ch.name = f"Chigi_{lbl}_{dy:.2f}"
-            ch.rotation_euler = (0, math.radians(15 * xs), 0)
-            ch.data.materials.append(m['wood'])
+        tilt = (0, math.radians(15 * xs), 0)
+        for j, dy in enumerate([-0.06, 0.06]):
+            bmesh_cylinder(f"Chigi_{lbl}_{j}", 0.03, 0.7, 6, (xs * 1.10, dy, ridge_z + 0.15),
+                           m['wood'], rotation=tilt)
 
     # Katsuogi (log weights on ridge)
-    for kx in [-0.6, -0.2, 0.2, 0.6]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.04, depth=0.30,
-                                            location=(kx, 0, ridge_z + 0.06))
-        k = bpy.context.active_object
-        k.name = f"Katsuogi_{kx:.1f}"
-        k.rotation_euler = (math.radians(90), 0, 0)
-        k.data.materials.append(m['wood_dark'])
+    for i, kx in enumerate([-0.6, -0.2, 0.2, 0.6]):
+        bmesh_cylinder(f"Katsuogi_{i}", 0.04, 0.30, 6, (kx, 0, ridge_z + 0.06),
+                       m['wood_dark'], rotation=_LYING)
 
     # Door opening
     bmesh_box("MainDoor", (0.06, 0.40, 0.80), (0.86, 0, fl_z + 0.48), m['door'])
 
     # Ladder
     bmesh_box("MainLadder", (0.06, 0.25, 1.2), (1.20, 0, Z + 0.60), m['wood'])
-    for rz in [0.25, 0.45, 0.65, 0.85]:
-        bmesh_box(f"MRung_{rz:.2f}", (0.04, 0.30, 0.03), (1.20, 0, Z + rz), m['wood_dark'])
+    for i, rz in enumerate([0.25, 0.45, 0.65, 0.85]):
+        bmesh_box(f"MRung_{i}", (0.04, 0.30, 0.03), (1.20, 0, Z + rz), m['wood_dark'])
 
     # === Secondary granary (smaller, to the side) ===
     GX, GY = -1.5, -1.0
     g_stilt_h = 0.8
-    for dx, dy in [(-0.35, -0.30), (-0.35, 0.30), (0.35, -0.30), (0.35, 0.30)]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.06, depth=g_stilt_h,
-                                            location=(GX + dx, GY + dy, Z + g_stilt_h / 2))
-        bpy.context.active_object.data.materials.append(m['wood'])
+    for i, (dx, dy) in enumerate([(-0.35, -0.30), (-0.35, 0.30), (0.35, -0.30), (0.35, 0.30)]):
+        bmesh_cylinder(f"GranStilt_{i}", 0.06, g_stilt_h, 8,
+                       (GX + dx, GY + dy, Z + g_stilt_h / 2), m['wood'])
 
     g_fl = Z + g_stilt_h
     bmesh_box("GranFloor", (0.85, 0.75, 0.06), (GX, GY, g_fl + 0.03), m['wood'])
@@ -323,25 +317,20 @@ def _build_bronze(m):
 
     # Granary gable roof
     grz = g_fl + 0.06 + 0.75
-    gv = [(GX - 0.48, GY - 0.40, grz), (GX + 0.48, GY - 0.40, grz),
-          (GX + 0.48, GY + 0.40, grz), (GX - 0.48, GY + 0.40, grz),
-          (GX - 0.55, GY, grz + 0.55), (GX + 0.55, GY, grz + 0.55)]
-    gf = [(0, 1, 5, 4), (2, 3, 4, 5), (0, 3, 4), (1, 2, 5)]
-    mesh_from_pydata("GranRoof", gv, gf, m['roof'])
+    _gable_roof("GranRoof", 0.48, 0.40, 0.55, 0.55, (GX, GY, grz), m['roof'])
 
     # Rat guards on stilts (nezumi-gaeshi)
-    for dx, dy in [(-0.35, -0.30), (-0.35, 0.30), (0.35, -0.30), (0.35, 0.30)]:
-        bmesh_box(f"RatGuard_{dx:.1f}_{dy:.1f}", (0.22, 0.22, 0.03),
+    for i, (dx, dy) in enumerate([(-0.35, -0.30), (-0.35, 0.30), (0.35, -0.30), (0.35, 0.30)]):
+        bmesh_box(f"RatGuard_{i}", (0.22, 0.22, 0.03),
                   (GX + dx, GY + dy, Z + g_stilt_h * 0.6), m['wood'])
 
     # === Watchtower (yagura) ===
     TX, TY = 1.5, 1.3
     t_h = 2.8
     # Four corner posts
-    for dx, dy in [(-0.25, -0.25), (-0.25, 0.25), (0.25, -0.25), (0.25, 0.25)]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.05, depth=t_h,
-                                            location=(TX + dx, TY + dy, Z + t_h / 2))
-        bpy.context.active_object.data.materials.append(m['wood'])
+    for i, (dx, dy) in enumerate([(-0.25, -0.25), (-0.25, 0.25), (0.25, -0.25), (0.25, 0.25)]):
+        bmesh_cylinder(f"WatchPost_{i}", 0.05, t_h, 6,
+                       (TX + dx, TY + dy, Z + t_h / 2), m['wood'])
     # Platform
     bmesh_box("WatchPlat", (0.65, 0.65, 0.06), (TX, TY, Z + t_h * 0.7), m['wood'])
     # Railing
@@ -353,20 +342,20 @@ def _build_bronze(m):
     # === Wooden fence enclosure ===
     fence_r = 2.3
     n_posts = 22
-    for i in range(n_posts):
-        a = (2 * math.pi * i) / n_posts
-        # leave gap at front
-        if abs(a) < 0.25 or abs(a - 2 * math.pi) < 0.25:
+    cos_t, sin_t = ring_table(n_posts)
+    gap_cos = math.cos(0.25)
+    for i, (c, s) in enumerate(zip(cos_t.tolist(), sin_t.tolist())):
+        # leave gap at front (posts within 0.25 rad of +x)
+        if c > gap_cos:
             continue
-        fx, fy = fence_r * math.cos(a), fence_r * math.sin(a)
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.04, depth=0.80,
-                                            location=(fx, fy, Z + 0.40))
-        bpy.context.active_object.data.materials.append(m['wood'])
+        fx, fy = fence_r * c, fence_r * s
+        bmesh_cylinder(f"Fence_{i}", 0.04, 0.80, 6, (fx, fy, Z + 0.40), m['wood'])
 
 
 # ============================================================
 # IRON AGE — Kofun period palace
 # ============================================================
+@planned("Japanese_Iron", merge=True)
 def _build_iron(m):
     Z = 0.0
 
@@ -381,10 +370,9 @@ def _build_iron(m):
     # === Surrounding ditch/moat ===
     # Ring of low walls suggesting a moat around the palace area
     moat_r = 2.0
-    for i in range(24):
-        a = (2 * math.pi * i) / 24
-        mx, my = moat_r * math.cos(a), moat_r * math.sin(a)
-        bmesh_box(f"Moat_{i}", (0.20, 0.20, 0.10), (mx, my, Z + 0.05), m['stone'])
+    cos_t, sin_t = ring_table(24)
+    merged_boxes("Moat", (0.20, 0.20, 0.10),
+                 np.column_stack((moat_r * cos_t, moat_r * sin_t, np.full(24, Z + 0.05))), m['stone'])
 
     BZ = Z + 0.15
 
@@ -399,13 +387,10 @@ def _build_iron(m):
     # Pillars (wooden, red-tinted)
     pillar_xs = [-0.8, 0, 0.8]
     pillar_ys = [-0.75, 0, 0.75]
-    for px in pillar_xs:
-        for py in pillar_ys:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.07, depth=hall_h,
-                                                location=(0.3 + px, py, fl_z + hall_h / 2))
-            p = bpy.context.active_object
-            p.name = f"Pillar_{px:.1f}_{py:.1f}"
-            p.data.materials.append(m['wood'])
+    for i, px in enumerate(pillar_xs):
+        for j, py in enumerate(pillar_ys):
+            bmesh_cylinder(f"Pillar_{i}_{j}", 0.07, hall_h, 8,
+                           (0.3 + px, py, fl_z + hall_h / 2), m['wood'])
 
     # Walls between pillars (light wood panels)
     bmesh_box("HallWallB", (0.06, 1.60, hall_h * 0.7), (0.3 - 0.85, 0, fl_z + hall_h * 0.35), m['wood_dark'])
@@ -423,22 +408,16 @@ def _build_iron(m):
 
     # Ridge ornaments (chigi — forked finials)
     for xs in [-1, 1]:
-        for dy in [-0.06, 0.06]:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.03, depth=0.50,
-                                                location=(0.3 + xs * 1.15, dy, roof_z + 1.30 + 0.10))
-            ch = bpy.context.active_object
-            ch.name = f"Chigi_{xs}_{dy:.2f}"
-            ch.rotation_euler = (0, math.radians(12 * xs), 0)
-            ch.data.materials.append(m['wood_dark'])
+        tilt = (0, math.radians(12 * xs), 0)
+        for j, dy in enumerate([-0.06, 0.06]):
+            bmesh_cylinder(f"Chigi_{xs}_{j}", 0.03, 0.50, 6,
+                           (0.3 + xs * 1.15, dy, roof_z + 1.30 + 0.10),
+                           m['wood_dark'], rotation=tilt)
 
     # Katsuogi (ridge weights)
-    for kx in [-0.5, 0.0, 0.5]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.04, depth=0.25,
-                                            location=(0.3 + kx, 0, roof_z + 1.30))
-        k = bpy.context.active_object
-        k.name = f"Katsuogi_{kx:.1f}"
-        k.rotation_euler = (math.radians(90), 0, 0)
-        k.data.materials.append(m['wood'])
+    for i, kx in enumerate([-0.5, 0.0, 0.5]):
+        bmesh_cylinder(f"Katsuogi_{i}", 0.04, 0.25, 6, (0.3 + kx, 0, roof_z + 1.30),
+                       m['wood'], rotation=_LYING)
 
     # === Annex building (smaller, side) ===
     AX, AY = 0.3, -1.5
@@ -448,16 +427,14 @@ def _build_iron(m):
                  overhang=0.15, curve_up=0.08)
 
     # === Wooden palisade fence ===
-    for i in range(16):
-        a = (2 * math.pi * i) / 16
-        if 0.15 < a < 0.55:
+    cos_t, sin_t = ring_table(16)
+    heights = (1.0 + 0.08 * np.sin(np.arange(16) * 2.7)).tolist()
+    step = 2 * math.pi / 16
+    for i, (c, s, h) in enumerate(zip(cos_t.tolist(), sin_t.tolist(), heights)):
+        if 0.15 < step * i < 0.55:
             continue  # gate opening
-        fx = 2.3 * math.cos(a)
-        fy = 2.3 * math.sin(a)
-        h = 1.0 + 0.08 * math.sin(i * 2.7)
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.05, depth=h,
-                                            location=(fx, fy, Z + h / 2))
-        bpy.context.active_object.data.materials.append(m['wood'])
+        fx, fy = 2.3 * c, 2.3 * s
+        bmesh_cylinder(f"Palisade_{i}", 0.05, h, 6, (fx, fy, Z + h / 2), m['wood'])
 
     # Gate posts
     bmesh_box("GatePostL", (0.10, 0.10, 1.3), (2.25, -0.25, Z + 0.65), m['wood_dark'])
@@ -465,16 +442,14 @@ def _build_iron(m):
     bmesh_box("GateBeam", (0.10, 0.60, 0.08), (2.25, 0, Z + 1.30), m['wood_dark'])
 
     # === Haniwa figure (clay figurine) ===
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.08, depth=0.40,
-                                        location=(1.8, 1.5, Z + 0.20))
-    bpy.context.active_object.data.materials.append(m['roof_edge'])
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.10, location=(1.8, 1.5, Z + 0.48))
-    bpy.context.active_object.data.materials.append(m['roof_edge'])
+    bmesh_cylinder("HaniwaBody", 0.08, 0.40, 8, (1.8, 1.5, Z + 0.20), m['roof_edge'])
+    uv_sphere("HaniwaHead", 0.10, (1.8, 1.5, Z + 0.48), m['roof_edge'], segments=12, rings=6)
 
 
 # ============================================================
 # CLASSICAL AGE — Nara period temple-palace
 # ============================================================
+@planned("Japanese_Classical", merge=True)
 def _build_classical(m):
     Z = 0.0
 
@@ -491,14 +466,10 @@ def _build_classical(m):
     hall_h = 2.2
 
     # Red-painted pillars (iconic Nara style)
-    for px in [-1.2, -0.6, 0, 0.6, 1.2]:
-        for py in [-0.95, 0.95]:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=10, radius=0.08, depth=hall_h,
-                                                location=(px, py, BZ + hall_h / 2))
-            p = bpy.context.active_object
-            p.name = f"RedPillar_{px:.1f}_{py:.1f}"
-            p.data.materials.append(m['banner'])  # red material
-            bpy.ops.object.shade_smooth()
+    for i, px in enumerate([-1.2, -0.6, 0, 0.6, 1.2]):
+        for j, py in enumerate([-0.95, 0.95]):
+            bmesh_cylinder(f"RedPillar_{i}_{j}", 0.08, hall_h, 10,
+                           (px, py, BZ + hall_h / 2), m['banner'], smooth=True)  # red material
 
     # White plaster walls
     bmesh_box("WallB", (0.06, 1.80, hall_h * 0.6), (-1.25, 0, BZ + hall_h * 0.3), m['stone_light'])
@@ -527,9 +498,8 @@ def _build_classical(m):
                  overhang=0.38, curve_up=0.20)
 
     # Gold ornament at roof peak
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.10, location=(0, 0, roof_z + 1.40))
-    bpy.context.active_object.data.materials.append(m['gold'])
-    bpy.ops.object.shade_smooth()
+    uv_sphere("RoofOrnament", 0.10, (0, 0, roof_z + 1.40), m['gold'], smooth=True,
+              segments=12, rings=6)
 
     # === Covered walkway (kairo) around main hall ===
     for side_y, lbl in [(-1.5, "R"), (1.5, "L")]:
@@ -540,41 +510,36 @@ def _build_classical(m):
                      overhang=0.12, curve_up=0.06)
         # Walkway pillars
         for wx in [-1.2, -0.4, 0.4, 1.2]:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.04, depth=1.15,
-                                                location=(wx, side_y, BZ + 0.60))
-            bpy.context.active_object.data.materials.append(m['banner'])
+            bmesh_cylinder(f"KairoPillar_{lbl}_{wx:.1f}", 0.04, 1.15, 8, (wx, side_y, BZ + 0.60),
+                           m['banner'])
 
     # === Five-story pagoda (iconic, side) ===
     PX, PY = -1.6, -1.2
-    pag_z = BZ
     tier_sizes = [(0.70, 0.50), (0.58, 0.42), (0.46, 0.35), (0.36, 0.30), (0.28, 0.25)]
 
+    tz = BZ  # running base of the current tier
     for tier, (tw, th) in enumerate(tier_sizes):
-        tz = pag_z + sum(s[1] + 0.10 for s in tier_sizes[:tier])
         # Tier body (white walls)
         bmesh_box(f"PagTier_{tier}", (tw, tw, th), (PX, PY, tz + th / 2), m['stone_light'])
         # Curved roof per tier
         _curved_roof(f"PagRoof_{tier}", tw + 0.05, tw + 0.05, 0.15,
                      (PX, PY, tz + th), m['roof'], overhang=0.12, curve_up=0.06)
+        tz += th + 0.10
 
     # Pagoda spire (sorin)
-    spire_z = pag_z + sum(s[1] + 0.10 for s in tier_sizes)
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.03, depth=0.60,
-                                        location=(PX, PY, spire_z + 0.30))
-    bpy.context.active_object.data.materials.append(m['gold'])
+    spire_z = tz
+    bmesh_cylinder("PagSpire", 0.03, 0.60, 8, (PX, PY, spire_z + 0.30), m['gold'])
     # Rings on spire
-    for rz in [0.10, 0.20, 0.30, 0.40]:
-        bmesh_prism(f"PagRing_{rz:.2f}", 0.06, 0.02, 8, (PX, PY, spire_z + rz), m['gold'])
+    for i, rz in enumerate([0.10, 0.20, 0.30, 0.40]):
+        bmesh_prism(f"PagRing_{i}", 0.06, 0.02, 8, (PX, PY, spire_z + rz), m['gold'])
 
     # === Steps to main hall ===
-    for i in range(5):
-        bmesh_box(f"Step_{i}", (0.18, 1.2, 0.05), (1.40 + i * 0.20, 0, BZ - 0.03 - i * 0.04), m['stone'])
+    merged_boxes("Steps", (0.18, 1.2, 0.05),
+                 [(1.40 + i * 0.20, 0, BZ - 0.03 - i * 0.04) for i in range(5)], m['stone'])
 
     # === Stone lantern ===
     LX, LY = 1.8, -1.6
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.06, depth=0.60,
-                                        location=(LX, LY, Z + 0.30))
-    bpy.context.active_object.data.materials.append(m['stone'])
+    bmesh_cylinder("LanternPost", 0.06, 0.60, 6, (LX, LY, Z + 0.30), m['stone'])
     bmesh_box("LanternCap", (0.20, 0.20, 0.04), (LX, LY, Z + 0.62), m['stone'])
     bmesh_cone("LanternRoof", 0.16, 0.15, 4, (LX, LY, Z + 0.64), m['stone_dark'])
 
@@ -582,6 +547,7 @@ def _build_classical(m):
 # ============================================================
 # MEDIEVAL AGE — Himeji-style castle (tenshu)
 # ============================================================
+@planned("Japanese_Medieval", merge=True)
 def _build_medieval(m):
     Z = 0.0
 
@@ -589,26 +555,18 @@ def _build_medieval(m):
 
     # === Stone foundation walls (ishigaki) with battered slope ===
     # The characteristic sloped stone base of Japanese castles
-    # Built as a truncated pyramid using mesh_from_pydata
+    # Built as a truncated pyramid (_battered_base)
     base_w, base_d = 3.8, 3.4
     top_w, top_d = 3.2, 2.8
     ishi_h = 1.2
-    bv = [
-        (-base_w / 2, -base_d / 2, Z), (base_w / 2, -base_d / 2, Z),
-        (base_w / 2, base_d / 2, Z), (-base_w / 2, base_d / 2, Z),
-        (-top_w / 2, -top_d / 2, Z + ishi_h), (top_w / 2, -top_d / 2, Z + ishi_h),
-        (top_w / 2, top_d / 2, Z + ishi_h), (-top_w / 2, top_d / 2, Z + ishi_h),
-    ]
-    bf = [(0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
-    mesh_from_pydata("Ishigaki", bv, bf, m['stone_dark'])
+    _battered_base("Ishigaki", base_w, base_d, top_w, top_d, ishi_h, (0, 0, Z), m['stone_dark'])
 
     # Stone wall texture lines
-    for i in range(4):
-        lz = Z + 0.25 + i * 0.25
-        t = lz / ishi_h
-        lw = base_w + (top_w - base_w) * t
-        ld = base_d + (top_d - base_d) * t
-        bmesh_box(f"IshiLine_{i}", (lw + 0.02, ld + 0.02, 0.02), (0, 0, lz), m['stone'])
+    lz = Z + 0.25 + 0.25 * np.arange(4)
+    t = lz / ishi_h
+    line_sizes = np.column_stack((base_w + (top_w - base_w) * t + 0.02,
+                                  base_d + (top_d - base_d) * t + 0.02, np.full(4, 0.02)))
+    merged_boxes("IshiLines", line_sizes, np.column_stack((np.zeros(4), np.zeros(4), lz)), m['stone'])
 
     BZ = Z + ishi_h
 
@@ -617,22 +575,13 @@ def _build_medieval(m):
     bmesh_box("Tier1", (t1_w, t1_d, t1_h), (0, 0, BZ + t1_h / 2), m['stone_light'])
 
     # Dark timber frame on tier 1
-    for py_s in [-1, 1]:
-        py = py_s * t1_d / 2
-        bmesh_box(f"T1FrameH_{py_s}", (t1_w, 0.04, 0.05), (0, py + py_s * 0.01, BZ + t1_h), m['wood_dark'])
-        bmesh_box(f"T1FrameB_{py_s}", (t1_w, 0.04, 0.05), (0, py + py_s * 0.01, BZ + 0.02), m['wood_dark'])
-        for fx in [-1.1, -0.4, 0.4, 1.1]:
-            bmesh_box(f"T1FrameV_{py_s}_{fx:.1f}", (0.05, 0.04, t1_h),
-                      (fx, py + py_s * 0.01, BZ + t1_h / 2), m['wood_dark'])
-    for px_s in [-1, 1]:
-        px = px_s * t1_w / 2
-        bmesh_box(f"T1FrameH_X_{px_s}", (0.04, t1_d, 0.05), (px + px_s * 0.01, 0, BZ + t1_h), m['wood_dark'])
-        bmesh_box(f"T1FrameB_X_{px_s}", (0.04, t1_d, 0.05), (px + px_s * 0.01, 0, BZ + 0.02), m['wood_dark'])
+    _tier_frame("T1Frame", t1_w, t1_d, t1_h, BZ, (0.04, 0.05), m['wood_dark'],
+                post_xs=(-1.1, -0.4, 0.4, 1.1), ends=2)
 
     # Windows (shoji-style, small rectangles)
-    for y in [-0.8, -0.1, 0.6]:
-        bmesh_box(f"T1WinF_{y:.1f}", (0.06, 0.25, 0.35), (t1_w / 2 + 0.01, y, BZ + 0.80), m['window'])
-        bmesh_box(f"T1WinFr_{y:.1f}", (0.07, 0.27, 0.03), (t1_w / 2 + 0.02, y, BZ + 1.00), m['win_frame'])
+    for i, y in enumerate([-0.8, -0.1, 0.6]):
+        bmesh_box(f"T1WinF_{i}", (0.06, 0.25, 0.35), (t1_w / 2 + 0.01, y, BZ + 0.80), m['window'])
+        bmesh_box(f"T1WinFr_{i}", (0.07, 0.27, 0.03), (t1_w / 2 + 0.02, y, BZ + 1.00), m['win_frame'])
 
     # Curved roof tier 1
     t1_roof_z = BZ + t1_h
@@ -645,18 +594,13 @@ def _build_medieval(m):
     bmesh_box("Tier2", (t2_w, t2_d, t2_h), (0, 0, t2_z + t2_h / 2), m['stone_light'])
 
     # Timber framing tier 2
-    for py_s in [-1, 1]:
-        py = py_s * t2_d / 2
-        bmesh_box(f"T2FrameH_{py_s}", (t2_w, 0.04, 0.04), (0, py + py_s * 0.01, t2_z + t2_h), m['wood_dark'])
-        bmesh_box(f"T2FrameB_{py_s}", (t2_w, 0.04, 0.04), (0, py + py_s * 0.01, t2_z + 0.02), m['wood_dark'])
-        for fx in [-0.7, 0, 0.7]:
-            bmesh_box(f"T2FrameV_{py_s}_{fx:.1f}", (0.04, 0.04, t2_h),
-                      (fx, py + py_s * 0.01, t2_z + t2_h / 2), m['wood_dark'])
+    _tier_frame("T2Frame", t2_w, t2_d, t2_h, t2_z, (0.04, 0.04), m['wood_dark'],
+                post_xs=(-0.7, 0, 0.7))
 
     # Windows tier 2
-    for y in [-0.5, 0.2]:
-        bmesh_box(f"T2WinF_{y:.1f}", (0.06, 0.22, 0.30), (t2_w / 2 + 0.01, y, t2_z + 0.60), m['window'])
-        bmesh_box(f"T2WinFr_{y:.1f}", (0.07, 0.24, 0.03), (t2_w / 2 + 0.02, y, t2_z + 0.78), m['win_frame'])
+    for i, y in enumerate([-0.5, 0.2]):
+        bmesh_box(f"T2WinF_{i}", (0.06, 0.22, 0.30), (t2_w / 2 + 0.01, y, t2_z + 0.60), m['window'])
+        bmesh_box(f"T2WinFr_{i}", (0.07, 0.24, 0.03), (t2_w / 2 + 0.02, y, t2_z + 0.78), m['win_frame'])
 
     # Curved roof tier 2
     t2_roof_z = t2_z + t2_h
@@ -669,14 +613,11 @@ def _build_medieval(m):
     bmesh_box("Tier3", (t3_w, t3_d, t3_h), (0, 0, t3_z + t3_h / 2), m['stone_light'])
 
     # Timber framing tier 3
-    for py_s in [-1, 1]:
-        py = py_s * t3_d / 2
-        bmesh_box(f"T3FrameH_{py_s}", (t3_w, 0.03, 0.04), (0, py + py_s * 0.01, t3_z + t3_h), m['wood_dark'])
-        bmesh_box(f"T3FrameB_{py_s}", (t3_w, 0.03, 0.04), (0, py + py_s * 0.01, t3_z + 0.02), m['wood_dark'])
+    _tier_frame("T3Frame", t3_w, t3_d, t3_h, t3_z, (0.03, 0.04), m['wood_dark'])
 
     # Windows tier 3
-    for y in [-0.3, 0.3]:
-        bmesh_box(f"T3WinF_{y:.1f}", (0.05, 0.18, 0.25), (t3_w / 2 + 0.01, y, t3_z + 0.50), m['window'])
+    for i, y in enumerate([-0.3, 0.3]):
+        bmesh_box(f"T3WinF_{i}", (0.05, 0.18, 0.25), (t3_w / 2 + 0.01, y, t3_z + 0.50), m['window'])
 
     # Curved roof tier 3
     t3_roof_z = t3_z + t3_h
@@ -694,28 +635,23 @@ def _build_medieval(m):
                  overhang=0.22, curve_up=0.12)
 
     # === Gold shachihoko (fish ornaments on main roof peak) ===
-    for dy in [-0.15, 0.15]:
+    for i, dy in enumerate([-0.15, 0.15]):
         # Stylized fish — body + tail
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.08,
-                                              location=(0, dy, t4_roof_z + 0.42))
-        sh = bpy.context.active_object
-        sh.name = f"Shachi_{dy:.2f}"
-        sh.scale = (1.2, 0.6, 1)
-        sh.data.materials.append(m['gold'])
-        bpy.ops.object.shade_smooth()
+        uv_sphere(f"Shachi_{i}", 0.08, (0, dy, t4_roof_z + 0.42), m['gold'],
+                  scale=(1.2, 0.6, 1), smooth=True, segments=12, rings=6)
         # Tail fin
         tv = [(0, dy, t4_roof_z + 0.48),
               (0, dy + 0.08 * (-1 if dy < 0 else 1), t4_roof_z + 0.55),
               (0, dy, t4_roof_z + 0.55)]
-        mesh_from_pydata(f"ShachiTail_{dy:.2f}", tv, [(0, 1, 2)], m['gold'])
+        mesh_from_pydata(f"ShachiTail_{i}", tv, [(0, 1, 2)], m['gold'])
 
     # === Gate in the ishigaki base ===
     bmesh_box("Gate", (0.08, 0.55, 0.90), (base_w / 2 + 0.01, 0, Z + 0.45), m['door'])
     bmesh_box("GateFrame", (0.10, 0.65, 0.06), (base_w / 2 + 0.02, 0, Z + 0.92), m['wood_dark'])
 
     # === Stone steps ===
-    for i in range(6):
-        bmesh_box(f"Step_{i}", (0.18, 1.0, 0.05), (base_w / 2 + 0.20 + i * 0.18, 0, Z - 0.03 + i * 0.03), m['stone'])
+    merged_boxes("Steps", (0.18, 1.0, 0.05),
+                 [(base_w / 2 + 0.20 + i * 0.18, 0, Z - 0.03 + i * 0.03) for i in range(6)], m['stone'])
 
     # === Corner watchtower (small yagura) ===
     yx, yy = -1.3, -1.2
@@ -724,9 +660,7 @@ def _build_medieval(m):
                  overhang=0.15, curve_up=0.08)
 
     # === Banner ===
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.025, depth=0.80,
-                                        location=(0, 0, t4_roof_z + 0.80))
-    bpy.context.active_object.data.materials.append(m['wood'])
+    bmesh_cylinder("BannerPole", 0.025, 0.80, 6, (0, 0, t4_roof_z + 0.80), m['wood'])
     bv = [(0.03, 0, t4_roof_z + 1.00), (0.40, 0.03, t4_roof_z + 0.97),
           (0.40, 0.02, t4_roof_z + 1.22), (0.03, 0, t4_roof_z + 1.20)]
     mesh_from_pydata("Banner", bv, [(0, 1, 2, 3)], m['banner'])
@@ -736,6 +670,7 @@ def _build_medieval(m):
 # ============================================================
 # GUNPOWDER AGE — Azuchi-Momoyama castle (5-story tenshu)
 # ============================================================
+@planned("Japanese_Gunpowder", by_material=True)
 def _build_gunpowder(m):
     Z = 0.0
 
@@ -773,14 +708,7 @@ def _build_gunpowder(m):
     base_w, base_d = 3.0, 2.6
     top_w, top_d = 2.4, 2.0
     ishi_h = 1.5
-    bv = [
-        (-base_w / 2, -base_d / 2, Z), (base_w / 2, -base_d / 2, Z),
-        (base_w / 2, base_d / 2, Z), (-base_w / 2, base_d / 2, Z),
-        (-top_w / 2, -top_d / 2, Z + ishi_h), (top_w / 2, -top_d / 2, Z + ishi_h),
-        (top_w / 2, top_d / 2, Z + ishi_h), (-top_w / 2, top_d / 2, Z + ishi_h),
-    ]
-    bf = [(0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
-    mesh_from_pydata("Ishigaki", bv, bf, m['stone_dark'])
+    _battered_base("Ishigaki", base_w, base_d, top_w, top_d, ishi_h, (0, 0, Z), m['stone_dark'])
 
     BZ = Z + ishi_h
 
@@ -800,26 +728,16 @@ def _build_gunpowder(m):
         bmesh_box(f"Tier{tier}", (tw, td, th), (0, 0, cur_z + th / 2), m['stone_light'])
 
         # Dark timber frame
-        for py_s in [-1, 1]:
-            py = py_s * td / 2
-            bmesh_box(f"T{tier}FH_{py_s}", (tw, 0.03, 0.04), (0, py + py_s * 0.01, cur_z + th), m['wood_dark'])
-            bmesh_box(f"T{tier}FB_{py_s}", (tw, 0.03, 0.04), (0, py + py_s * 0.01, cur_z + 0.02), m['wood_dark'])
-            n_verts = max(2, int(tw / 0.4))
-            for vi in range(n_verts):
-                vx = -tw / 2 + 0.2 + vi * (tw - 0.4) / max(1, n_verts - 1)
-                bmesh_box(f"T{tier}FV_{py_s}_{vi}", (0.04, 0.03, th),
-                          (vx, py + py_s * 0.01, cur_z + th / 2), m['wood_dark'])
-        for px_s in [-1, 1]:
-            px = px_s * tw / 2
-            bmesh_box(f"T{tier}FHx_{px_s}", (0.03, td, 0.04), (px + px_s * 0.01, 0, cur_z + th), m['wood_dark'])
+        _tier_frame(f"T{tier}Frame", tw, td, th, cur_z, (0.03, 0.04), m['wood_dark'],
+                    post_xs=np.linspace(-tw / 2 + 0.2, tw / 2 - 0.2, max(2, int(tw / 0.4))), ends=1)
 
         # Windows
         if tier < 4:
             n_win = max(1, int(tw / 0.5))
-            for wi in range(n_win):
-                wy = -tw / 2 + 0.3 + wi * (tw - 0.6) / max(1, n_win - 1) if n_win > 1 else 0
-                bmesh_box(f"T{tier}Win_{wi}", (0.05, 0.18, 0.22),
-                          (tw / 2 + 0.01, wy, cur_z + th * 0.55), m['window'])
+            win_y = np.linspace(-tw / 2 + 0.3, tw / 2 - 0.3, n_win) if n_win > 1 else np.zeros(1)
+            merged_boxes(f"T{tier}Win", (0.05, 0.18, 0.22),
+                         np.column_stack((np.full(n_win, tw / 2 + 0.01), win_y,
+                                          np.full(n_win, cur_z + th * 0.55))), m['window'])
 
         # Curved roof
         _curved_roof(f"Tier{tier}Roof", tw, td, 0.35 + tier * 0.02,
@@ -835,14 +753,9 @@ def _build_gunpowder(m):
 
     # === Gold shachihoko on top ===
     top_z = cur_z - 0.02
-    for dy in [-0.12, 0.12]:
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.10,
-                                              location=(0, dy, top_z + 0.12))
-        sh = bpy.context.active_object
-        sh.name = f"Shachi_{dy:.2f}"
-        sh.scale = (1.3, 0.6, 1.2)
-        sh.data.materials.append(m['gold'])
-        bpy.ops.object.shade_smooth()
+    for i, dy in enumerate([-0.12, 0.12]):
+        uv_sphere(f"Shachi_{i}", 0.10, (0, dy, top_z + 0.12), m['gold'],
+                  scale=(1.3, 0.6, 1.2), smooth=True, segments=12, rings=6)
 
     # === Corner turrets (attached to outer wall) ===
     for xs, ys, lbl in [(-1, -1, "BL"), (1, 1, "FR")]:
@@ -852,14 +765,11 @@ def _build_gunpowder(m):
                      (tx, ty, Z + 1.40), m['roof'], overhang=0.12, curve_up=0.06)
 
     # Steps
-    for i in range(5):
-        bmesh_box(f"Step_{i}", (0.16, 0.80, 0.05),
-                  (ow_hw + 0.25 + i * 0.18, 0, Z - 0.03 + i * 0.02), m['stone'])
+    merged_boxes("Steps", (0.16, 0.80, 0.05),
+                 [(ow_hw + 0.25 + i * 0.18, 0, Z - 0.03 + i * 0.02) for i in range(5)], m['stone'])
 
     # Banner
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.025, depth=0.70,
-                                        location=(0, 0, top_z + 0.50))
-    bpy.context.active_object.data.materials.append(m['wood'])
+    bmesh_cylinder("BannerPole", 0.025, 0.70, 6, (0, 0, top_z + 0.50), m['wood'])
     bverts = [(0.03, 0, top_z + 0.65), (0.40, 0.03, top_z + 0.62),
               (0.40, 0.02, top_z + 0.90), (0.03, 0, top_z + 0.88)]
     mesh_from_pydata("Banner", bverts, [(0, 1, 2, 3)], m['banner'])
@@ -869,6 +779,7 @@ def _build_gunpowder(m):
 # ============================================================
 # ENLIGHTENMENT AGE — Edo period shogun palace
 # ============================================================
+@planned("Japanese_Enlightenment", by_material=True)
 def _build_enlightenment(m):
     Z = 0.0
 
@@ -882,45 +793,44 @@ def _build_enlightenment(m):
     # === Main palace (shoin-zukuri style, wide and elegant) ===
     main_w, main_d = 3.6, 2.4
     main_h = 2.0
+    floor_z = BZ + 0.08  # top of the raised floor
+    wall_z = floor_z + main_h / 2
+    front_x = main_w / 2 + 0.01
 
     # Raised wooden floor
     bmesh_box("MainFloor", (main_w + 0.10, main_d + 0.10, 0.08), (0, 0, BZ + 0.04), m['wood'])
 
     # White plaster walls with dark timber frame (shikkui + timber)
-    bmesh_box("MainWallB", (0.08, main_d, main_h), (-main_w / 2, 0, BZ + 0.08 + main_h / 2), m['stone_light'])
-    bmesh_box("MainWallR", (main_w, 0.08, main_h), (0, -main_d / 2, BZ + 0.08 + main_h / 2), m['stone_light'])
-    bmesh_box("MainWallL", (main_w, 0.08, main_h), (0, main_d / 2, BZ + 0.08 + main_h / 2), m['stone_light'])
+    bmesh_box("MainWallB", (0.08, main_d, main_h), (-main_w / 2, 0, wall_z), m['stone_light'])
+    bmesh_box("MainWallR", (main_w, 0.08, main_h), (0, -main_d / 2, wall_z), m['stone_light'])
+    bmesh_box("MainWallL", (main_w, 0.08, main_h), (0, main_d / 2, wall_z), m['stone_light'])
 
     # Dark timber grid on walls
-    for py_s in [-1, 1]:
-        py = py_s * main_d / 2 + py_s * 0.01
-        for fz in [BZ + 0.10, BZ + 0.08 + main_h]:
-            bmesh_box(f"MFH_{py_s}_{fz:.2f}", (main_w, 0.04, 0.05), (0, py, fz), m['wood_dark'])
-        for fx in range(8):
-            vx = -main_w / 2 + 0.25 + fx * (main_w - 0.50) / 7
-            bmesh_box(f"MFV_{py_s}_{fx}", (0.04, 0.04, main_h),
-                      (vx, py, BZ + 0.08 + main_h / 2), m['wood_dark'])
+    grid_y = (-main_d / 2 - 0.01, main_d / 2 + 0.01)
+    merged_boxes("MFH", (main_w, 0.04, 0.05),
+                 [(0, py, fz) for py in grid_y for fz in (BZ + 0.10, floor_z + main_h)], m['wood_dark'])
+    post_x = np.linspace(-main_w / 2 + 0.25, main_w / 2 - 0.25, 8)
+    merged_boxes("MFV", (0.04, 0.04, main_h),
+                 [(vx, py, wall_z) for py in grid_y for vx in post_x], m['wood_dark'])
 
     # Front: shoji screen panels (translucent sliding doors)
     for wy in range(6):
         sy = -main_d / 2 + 0.25 + wy * (main_d - 0.50) / 5
         bmesh_box(f"Shoji_{wy}", (0.04, 0.30, 1.30),
-                  (main_w / 2, sy, BZ + 0.08 + 0.65), m['plaster'])
+                  (main_w / 2, sy, floor_z + 0.65), m['plaster'])
         bmesh_box(f"ShojiFrame_{wy}", (0.05, 0.32, 0.03),
-                  (main_w / 2 + 0.01, sy, BZ + 0.08 + 1.32), m['wood_dark'])
+                  (front_x, sy, floor_z + 1.32), m['wood_dark'])
 
     # === Deep curved hip roof (characteristic Edo style) ===
-    roof_z = BZ + 0.08 + main_h
+    roof_z = floor_z + main_h
     _curved_roof("MainRoof", main_w, main_d, 1.5, (0, 0, roof_z), m['roof'],
                  overhang=0.50, curve_up=0.22)
     _curved_roof("MainRoofEdge", main_w + 0.02, main_d + 0.02, 1.45, (0, 0, roof_z - 0.03), m['roof_edge'],
                  overhang=0.53, curve_up=0.24)
 
     # Gold ridge ornaments
-    for dx in [-0.8, 0, 0.8]:
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.06, location=(dx, 0, roof_z + 1.50))
-        bpy.context.active_object.data.materials.append(m['gold'])
-        bpy.ops.object.shade_smooth()
+    merged_spheres("RidgeOrnaments", 0.06, [(dx, 0, roof_z + 1.50) for dx in (-0.8, 0, 0.8)],
+                   m['gold'], smooth=True, segments=12, rings=6)
 
     # === Karahafu gable (ornate curved gable over entrance) ===
     gable_z = roof_z + 0.30
@@ -947,20 +857,17 @@ def _build_enlightenment(m):
     bmesh_box("GateDoor", (0.06, 0.65, 1.30), (gate_x + 0.06, 0, BZ + 0.65), m['door'])
 
     # Gold gate ornament
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.05, location=(gate_x, 0, BZ + 2.17))
-    bpy.context.active_object.data.materials.append(m['gold'])
-    bpy.ops.object.shade_smooth()
+    uv_sphere("GateOrnament", 0.05, (gate_x, 0, BZ + 2.17), m['gold'], smooth=True,
+              segments=12, rings=6)
 
     # === Zen garden area ===
     bmesh_box("GardenBed", (1.2, 1.0, 0.04), (-1.8, 1.5, BZ + 0.02), m['stone_light'])
     # Raked gravel lines
-    for gi in range(6):
-        gy = 1.1 + gi * 0.15
-        bmesh_box(f"Gravel_{gi}", (1.0, 0.02, 0.01), (-1.8, gy, BZ + 0.045), m['stone'])
+    merged_boxes("Gravel", (1.0, 0.02, 0.01), [(-1.8, 1.1 + gi * 0.15, BZ + 0.045) for gi in range(6)],
+                 m['stone'])
     # Stones in garden
-    for sx, sy, sr in [(-2.0, 1.3, 0.08), (-1.6, 1.6, 0.06), (-1.9, 1.8, 0.05)]:
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=sr, location=(sx, sy, BZ + sr))
-        bpy.context.active_object.data.materials.append(m['stone_dark'])
+    for i, (sx, sy, sr) in enumerate([(-2.0, 1.3, 0.08), (-1.6, 1.6, 0.06), (-1.9, 1.8, 0.05)]):
+        uv_sphere(f"GardenStone_{i}", sr, (sx, sy, BZ + sr), m['stone_dark'], segments=8, rings=4)
 
     # === Wing building (lower, connected) ===
     WX, WY = -0.5, -1.8
@@ -971,14 +878,12 @@ def _build_enlightenment(m):
                  overhang=0.20, curve_up=0.10)
 
     # Steps
-    for i in range(4):
-        bmesh_box(f"Step_{i}", (0.16, 1.2, 0.04), (gate_x + 0.20 + i * 0.16, 0, BZ - 0.02 - i * 0.03), m['stone'])
+    merged_boxes("Steps", (0.16, 1.2, 0.04),
+                 [(gate_x + 0.20 + i * 0.16, 0, BZ - 0.02 - i * 0.03) for i in range(4)], m['stone'])
 
     # Stone lanterns
     for lx, ly in [(2.2, 1.4), (-2.2, -0.8)]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.05, depth=0.50,
-                                            location=(lx, ly, BZ + 0.25))
-        bpy.context.active_object.data.materials.append(m['stone'])
+        bmesh_cylinder(f"LPost_{lx:.1f}", 0.05, 0.50, 6, (lx, ly, BZ + 0.25), m['stone'])
         bmesh_box(f"LCap_{lx:.1f}", (0.16, 0.16, 0.03), (lx, ly, BZ + 0.52), m['stone'])
         bmesh_cone(f"LRoof_{lx:.1f}", 0.12, 0.10, 4, (lx, ly, BZ + 0.55), m['stone_dark'])
 
@@ -986,6 +891,7 @@ def _build_enlightenment(m):
 # ============================================================
 # INDUSTRIAL AGE — Meiji era Western-Japanese fusion
 # ============================================================
+@planned("Japanese_Industrial", by_material=True)
 def _build_industrial(m):
     Z = 0.0
 
@@ -999,6 +905,8 @@ def _build_industrial(m):
     # === Main building — brick base, Western proportions ===
     main_w, main_d = 3.4, 2.6
     main_h = 3.0
+    upper_z = BZ + main_h * 0.4  # brick base / plastered upper storey
+    front_x = main_w / 2 + 0.01
 
     # Brick lower section (Meiji Western influence)
     bmesh_box("BrickBase", (main_w, main_d, main_h * 0.4), (0, 0, BZ + main_h * 0.2), m['stone'], bevel=0.02)
@@ -1010,37 +918,35 @@ def _build_industrial(m):
 
     # Upper section (plastered, lighter)
     bmesh_box("UpperWalls", (main_w, main_d, main_h * 0.6),
-              (0, 0, BZ + main_h * 0.4 + main_h * 0.3), m['stone_light'])
+              (0, 0, BZ + main_h * 0.7), m['stone_light'])
 
     # Dark timber frame (Japanese influence on upper story)
-    for py_s in [-1, 1]:
-        py = py_s * main_d / 2 + py_s * 0.01
-        bmesh_box(f"TimberH_{py_s}", (main_w, 0.04, 0.05), (0, py, BZ + main_h * 0.4), m['wood_dark'])
-        bmesh_box(f"TimberT_{py_s}", (main_w, 0.04, 0.05), (0, py, BZ + main_h), m['wood_dark'])
-        for fx in range(6):
-            vx = -main_w / 2 + 0.35 + fx * (main_w - 0.70) / 5
-            bmesh_box(f"TimberV_{py_s}_{fx}", (0.04, 0.04, main_h * 0.6),
-                      (vx, py, BZ + main_h * 0.4 + main_h * 0.3), m['wood_dark'])
+    grid_y = (-main_d / 2 - 0.01, main_d / 2 + 0.01)
+    merged_boxes("TimberH", (main_w, 0.04, 0.05),
+                 [(0, py, fz) for py in grid_y for fz in (upper_z, BZ + main_h)], m['wood_dark'])
+    post_x = np.linspace(-main_w / 2 + 0.35, main_w / 2 - 0.35, 6)
+    merged_boxes("TimberV", (0.04, 0.04, main_h * 0.6),
+                 [(vx, py, BZ + main_h * 0.7) for py in grid_y for vx in post_x], m['wood_dark'])
 
     # Windows (Western-style arched on brick, Japanese-style on upper)
     # Lower row — arched Western windows
     for y in [-0.9, -0.3, 0.3, 0.9]:
         bmesh_box(f"LowWin_{y:.1f}", (0.06, 0.22, 0.45),
-                  (main_w / 2 + 0.01, y, BZ + 0.50), m['window'])
+                  (front_x, y, BZ + 0.50), m['window'])
         bmesh_box(f"LowWinH_{y:.1f}", (0.07, 0.26, 0.04),
-                  (main_w / 2 + 0.02, y, BZ + 0.75), m['stone_trim'])
+                  (front_x + 0.01, y, BZ + 0.75), m['stone_trim'])
 
     # Upper row — taller Japanese-proportion windows
     for y in [-0.9, -0.3, 0.3, 0.9]:
         bmesh_box(f"UpWin_{y:.1f}", (0.06, 0.20, 0.55),
-                  (main_w / 2 + 0.01, y, BZ + main_h * 0.4 + 0.55), m['window'])
+                  (front_x, y, upper_z + 0.55), m['window'])
         bmesh_box(f"UpWinFr_{y:.1f}", (0.07, 0.22, 0.03),
-                  (main_w / 2 + 0.02, y, BZ + main_h * 0.4 + 0.85), m['win_frame'])
+                  (front_x + 0.01, y, upper_z + 0.85), m['win_frame'])
 
     # Side windows
     for x in [-1.0, -0.2, 0.6]:
         bmesh_box(f"SideWin_{x:.1f}", (0.20, 0.06, 0.45),
-                  (x, -main_d / 2 - 0.01, BZ + main_h * 0.4 + 0.55), m['window'])
+                  (x, -main_d / 2 - 0.01, upper_z + 0.55), m['window'])
 
     # === Japanese-style curved roof on Western building ===
     roof_z = BZ + main_h
@@ -1048,10 +954,8 @@ def _build_industrial(m):
                  overhang=0.40, curve_up=0.18)
 
     # Ridge ornaments
-    for dx in [-0.6, 0, 0.6]:
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.05, location=(dx, 0, roof_z + 1.20))
-        bpy.context.active_object.data.materials.append(m['gold'])
-        bpy.ops.object.shade_smooth()
+    merged_spheres("RidgeOrnaments", 0.05, [(dx, 0, roof_z + 1.20) for dx in (-0.6, 0, 0.6)],
+                   m['gold'], smooth=True, segments=12, rings=6)
 
     # === Clock tower (yagura-style with Western clock) ===
     TX, TY = -0.8, -1.0
@@ -1068,12 +972,8 @@ def _build_industrial(m):
                   (TX, TY + side * ct_w / 2 + side * 0.01, ct_base + 0.02), m['wood_dark'])
 
     # Clock face (Western element)
-    bpy.ops.mesh.primitive_cylinder_add(vertices=20, radius=0.22, depth=0.04,
-                                        location=(TX + ct_w / 2 + 0.01, TY, ct_base + ct_h * 0.6))
-    clock = bpy.context.active_object
-    clock.name = "Clock"
-    clock.rotation_euler = (0, math.radians(90), 0)
-    clock.data.materials.append(m['gold'])
+    bmesh_cylinder("Clock", 0.22, 0.04, 20, (TX + ct_w / 2 + 0.01, TY, ct_base + ct_h * 0.6),
+                   m['gold'], rotation=(0, math.radians(90), 0))
 
     # Japanese-style roof on clock tower
     _curved_roof("CTRoof", ct_w, ct_w, 0.45, (TX, TY, ct_base + ct_h), m['roof'],
@@ -1084,32 +984,26 @@ def _build_industrial(m):
 
     # === Entrance portico (Western columns with Japanese roof) ===
     for dy in [-0.45, 0.45]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=12, radius=0.08, depth=2.0,
-                                            location=(main_w / 2 + 0.45, dy, BZ + 1.0))
-        c = bpy.context.active_object
-        c.name = f"PorCol_{dy:.2f}"
-        c.data.materials.append(m['stone_light'])
-        bpy.ops.object.shade_smooth()
+        bmesh_cylinder(f"PorCol_{dy:.2f}", 0.08, 2.0, 12, (main_w / 2 + 0.45, dy, BZ + 1.0),
+                       m['stone_light'], smooth=True)
 
     # Portico roof (Japanese curve)
     _curved_roof("PorRoof", 0.50, 1.10, 0.25, (main_w / 2 + 0.45, 0, BZ + 2.05), m['roof'],
                  overhang=0.12, curve_up=0.06)
 
     # Door
-    bmesh_box("Door", (0.08, 0.60, 1.50), (main_w / 2 + 0.01, 0, BZ + 0.75), m['door'])
-    bmesh_box("DoorFrame", (0.10, 0.70, 0.06), (main_w / 2 + 0.02, 0, BZ + 1.53), m['wood_dark'])
+    bmesh_box("Door", (0.08, 0.60, 1.50), (front_x, 0, BZ + 0.75), m['door'])
+    bmesh_box("DoorFrame", (0.10, 0.70, 0.06), (front_x + 0.01, 0, BZ + 1.53), m['wood_dark'])
 
     # === Iron fence (Western influence) ===
+    # Cylinders, not frustum_arrays: the hexagons start at +y like primitive_cylinder_add
     for i in range(12):
-        fy = -1.6 + i * 0.28
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.015, depth=0.55,
-                                            location=(main_w / 2 + 0.90, fy, BZ + 0.15))
-        bpy.context.active_object.data.materials.append(m['iron'])
+        bmesh_cylinder(f"FenceBar_{i}", 0.015, 0.55, 6, (main_w / 2 + 0.90, -1.6 + i * 0.28, BZ + 0.15),
+                       m['iron'])
 
     # Steps
-    for i in range(5):
-        bmesh_box(f"Step_{i}", (0.18, 1.6, 0.05),
-                  (main_w / 2 + 0.65 + i * 0.20, 0, BZ - 0.03 - i * 0.04), m['stone'])
+    merged_boxes("Steps", (0.18, 1.6, 0.05),
+                 [(main_w / 2 + 0.65 + i * 0.20, 0, BZ - 0.03 - i * 0.04) for i in range(5)], m['stone'])
 
     # Chimney (brick)
     bmesh_box("Chimney", (0.25, 0.25, 1.5), (-main_w / 2 + 0.4, 0.8, roof_z + 0.75), m['stone'])
@@ -1119,6 +1013,7 @@ def _build_industrial(m):
 # ============================================================
 # MODERN AGE — Post-war Japanese modernist
 # ============================================================
+@planned("Japanese_Modern", by_material=True)
 def _build_modern(m):
     Z = 0.0
 
@@ -1135,6 +1030,8 @@ def _build_modern(m):
     # === Main building — clean concrete, Japanese proportions ===
     main_w, main_d = 3.2, 2.4
     main_h = 3.8
+    front_x = main_w / 2 + 0.01
+    glass_z = BZ + main_h / 2 + 0.1
     bmesh_box("Main", (main_w, main_d, main_h), (0, 0, BZ + main_h / 2), m['stone'])
 
     # Clean horizontal lines (concrete bands, tatami-proportion rhythm)
@@ -1145,12 +1042,12 @@ def _build_modern(m):
 
     # Glass curtain wall on front (full height)
     bmesh_box("FrontGlass", (0.06, main_d - 0.5, main_h - 0.3),
-              (main_w / 2 + 0.01, 0, BZ + main_h / 2 + 0.1), glass)
+              (front_x, 0, glass_z), glass)
 
     # Vertical mullions (aluminum)
     for y in [-0.7, -0.2, 0.3, 0.8]:
         bmesh_box(f"Mullion_{y:.1f}", (0.04, 0.03, main_h - 0.4),
-                  (main_w / 2 + 0.03, y, BZ + main_h / 2 + 0.1), metal)
+                  (front_x + 0.02, y, glass_z), metal)
 
     # Side windows (narrow horizontal bands — Japanese modernist style)
     for x in [-1.0, 0, 1.0]:
@@ -1178,51 +1075,41 @@ def _build_modern(m):
     # === Zen garden (karesansui — dry landscape) ===
     bmesh_box("Garden", (1.8, 1.6, 0.03), (-1.8, 1.3, BZ + 0.015), m['stone_light'])
     # Raked gravel pattern (concentric lines around rocks)
-    for gi in range(8):
-        gy = 0.65 + gi * 0.18
-        bmesh_box(f"Gravel_{gi}", (1.5, 0.015, 0.008), (-1.8, gy, BZ + 0.035), m['stone'])
+    merged_boxes("Gravel", (1.5, 0.015, 0.008), [(-1.8, 0.65 + gi * 0.18, BZ + 0.035) for gi in range(8)],
+                 m['stone'])
     # Garden rocks
-    for rx, ry, rr in [(-2.1, 1.1, 0.10), (-1.5, 1.4, 0.07), (-2.0, 1.6, 0.06)]:
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=rr, location=(rx, ry, BZ + rr))
-        bpy.context.active_object.data.materials.append(m['stone_dark'])
+    for i, (rx, ry, rr) in enumerate([(-2.1, 1.1, 0.10), (-1.5, 1.4, 0.07), (-2.0, 1.6, 0.06)]):
+        uv_sphere(f"GardenRock_{i}", rr, (rx, ry, BZ + rr), m['stone_dark'], segments=8, rings=4)
 
     # === Entrance canopy (floating slab) ===
     bmesh_box("Canopy", (1.0, 2.0, 0.06),
               (main_w / 2 + 0.55, 0, BZ + 1.60), metal)
     # Single column support
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.04, depth=1.50,
-                                        location=(main_w / 2 + 0.55, -0.80, BZ + 0.83))
-    bpy.context.active_object.data.materials.append(metal)
+    bmesh_cylinder("CanopyColumn", 0.04, 1.50, 8, (main_w / 2 + 0.55, -0.80, BZ + 0.83), metal)
 
     # Glass door
     bmesh_box("GlassDoor", (0.05, 1.2, 1.80),
-              (main_w / 2 + 0.01, 0, BZ + 0.90), glass)
+              (front_x, 0, BZ + 0.90), glass)
 
     # === Small water feature ===
     bmesh_box("WaterBasin", (0.30, 0.30, 0.20),
               (-2.2, -1.5, BZ + 0.10), m['stone'])
     # Bamboo spout
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.02, depth=0.35,
-                                        location=(-2.2, -1.5 - 0.18, BZ + 0.35))
-    bc = bpy.context.active_object
-    bc.name = "BambooSpout"
-    bc.rotation_euler = (math.radians(30), 0, 0)
-    bc.data.materials.append(m['wood'])
+    bmesh_cylinder("BambooSpout", 0.02, 0.35, 6, (-2.2, -1.5 - 0.18, BZ + 0.35), m['wood'],
+                   rotation=(math.radians(30), 0, 0))
 
     # Steps
-    for i in range(4):
-        bmesh_box(f"Step_{i}", (0.16, 1.4, 0.04),
-                  (main_w / 2 + 0.75 + i * 0.18, 0, BZ - 0.02 - i * 0.02), m['stone'])
+    merged_boxes("Steps", (0.16, 1.4, 0.04),
+                 [(main_w / 2 + 0.75 + i * 0.18, 0, BZ - 0.02 - i * 0.02) for i in range(4)], m['stone'])
 
     # Antenna / communication mast
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.03, depth=1.5,
-                                        location=(0, 0, BZ + main_h + 0.85))
-    bpy.context.active_object.data.materials.append(metal)
+    bmesh_cylinder("Mast", 0.03, 1.5, 8, (0, 0, BZ + main_h + 0.85), metal)
 
 
 # ============================================================
 # DIGITAL AGE — Ultra-modern Japanese
 # ============================================================
+@planned("Japanese_Digital", by_material=True)
 def _build_digital(m):
     Z = 0.0
 
@@ -1262,60 +1149,44 @@ def _build_digital(m):
         _curved_roof(f"FloatRoof_{ti}", fw, fd, fh, (0, 0, fz), m['roof'],
                      overhang=0.30, curve_up=0.15)
         # Thin support columns for floating roofs
-        for dx, dy in [(-fw / 4, -fd / 4), (fw / 4, fd / 4)]:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.025, depth=0.30,
-                                                location=(dx, dy, fz - 0.15))
-            bpy.context.active_object.data.materials.append(metal)
+        for i, (dx, dy) in enumerate([(-fw / 4, -fd / 4), (fw / 4, fd / 4)]):
+            bmesh_cylinder(f"FloatCol_{ti}_{i}", 0.025, 0.30, 8, (dx, dy, fz - 0.15), metal)
 
     # Gold accent on top floating roof
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.08,
-                                          location=(0, 0, float_tiers[2][2] + float_tiers[2][3] + 0.05))
-    bpy.context.active_object.data.materials.append(m['gold'])
-    bpy.ops.object.shade_smooth()
+    uv_sphere("FloatAccent", 0.08, (0, 0, float_tiers[2][2] + float_tiers[2][3] + 0.05), m['gold'],
+              smooth=True, segments=12, rings=6)
 
     # === LED torii gate (modern interpretation) ===
     TX, TY = 2.2, 0
     torii_h = 2.0
     torii_w = 1.0
     # Pillars (thin metal)
-    for dy in [-torii_w / 2, torii_w / 2]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.04, depth=torii_h,
-                                            location=(TX, TY + dy, BZ + torii_h / 2))
-        bpy.context.active_object.data.materials.append(metal)
-
-    # Kasagi (top beam) — LED-lit
-    bmesh_box("ToriiKasagi", (0.08, torii_w + 0.30, 0.06),
-              (TX, TY, BZ + torii_h + 0.03), m['gold'])
-    # Nuki (lower beam) — LED-lit
-    bmesh_box("ToriiNuki", (0.06, torii_w + 0.10, 0.04),
-              (TX, TY, BZ + torii_h - 0.25), m['gold'])
-    # LED strips on torii
-    bmesh_box("ToriiLED_L", (0.02, 0.02, torii_h),
-              (TX + 0.03, TY - torii_w / 2, BZ + torii_h / 2), m['gold'])
-    bmesh_box("ToriiLED_R", (0.02, 0.02, torii_h),
-              (TX + 0.03, TY + torii_w / 2, BZ + torii_h / 2), m['gold'])
+    pillar_y = (TY - torii_w / 2, TY + torii_w / 2)
+    mesh_instances("ToriiPillar", *frustum_arrays(0, 0, -torii_h / 2, 0.04, 0.04, torii_h, 8),
+                   [(i, (TX, y, BZ + torii_h / 2), 0) for i, y in enumerate(pillar_y)], metal)
+
+    # LED-lit Kasagi (top beam) and Nuki (lower beam), LED strips down both pillars
+    merged_boxes("ToriiLED",
+                 [(0.08, torii_w + 0.30, 0.06), (0.06, torii_w + 0.10, 0.04),
+                  (0.02, 0.02, torii_h), (0.02, 0.02, torii_h)],
+                 [(TX, TY, BZ + torii_h + 0.03), (TX, TY, BZ + torii_h - 0.25),
+                  (TX + 0.03, TY - torii_w / 2, BZ + torii_h / 2),
+                  (TX + 0.03, TY + torii_w / 2, BZ + torii_h / 2)], m['gold'])
 
     # === Cherry blossom hologram (glowing pink sphere cluster) ===
     # Represented as a cluster of small glowing spheres
     holo_x, holo_y, holo_z = -1.8, 1.2, BZ + 1.5
     # Hologram projector base
     bmesh_prism("HoloProjBase", 0.20, 0.15, 8, (holo_x, holo_y, BZ), metal)
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.03, depth=0.5,
-                                        location=(holo_x, holo_y, BZ + 0.40))
-    bpy.context.active_object.data.materials.append(metal)
+    bmesh_cylinder("HoloProjStem", 0.03, 0.5, 8, (holo_x, holo_y, BZ + 0.40), metal)
 
     # Cherry blossom hologram cluster (gold/banner material for pink glow)
-    blossom_offsets = [(0, 0, 0), (0.15, 0.10, 0.08), (-0.12, 0.08, 0.05),
-                       (0.05, -0.12, 0.12), (-0.08, -0.06, -0.05),
-                       (0.10, -0.05, -0.08), (-0.15, 0.02, 0.10),
-                       (0.02, 0.15, -0.03)]
-    for bi, (bx, by, bbz) in enumerate(blossom_offsets):
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.06,
-                                              location=(holo_x + bx, holo_y + by, holo_z + bbz))
-        bl = bpy.context.active_object
-        bl.name = f"Blossom_{bi}"
-        bl.data.materials.append(m['banner'])  # pink/red glow
-        bpy.ops.object.shade_smooth()
+    blossom_offsets = np.array([(0, 0, 0), (0.15, 0.10, 0.08), (-0.12, 0.08, 0.05),
+                                (0.05, -0.12, 0.12), (-0.08, -0.06, -0.05),
+                                (0.10, -0.05, -0.08), (-0.15, 0.02, 0.10),
+                                (0.02, 0.15, -0.03)], dtype=np.float32)
+    merged_spheres("Blossoms", 0.06, blossom_offsets + (holo_x, holo_y, holo_z),
+                   m['banner'], smooth=True, segments=12, rings=6)  # pink/red glow
 
     # === Lower connected wing ===
     wing_w, wing_d, wing_h = 2.4, 1.4, 2.5
@@ -1342,24 +1213,19 @@ def _build_digital(m):
 
     # === Solar/tech panels on wing roof ===
     wing_roof_z = BZ + wing_h + 0.25
-    for i in range(3):
-        bmesh_box(f"Solar_{i}", (0.6, 0.4, 0.03),
-                  (WX - 0.6 + i * 0.7, -0.8, wing_roof_z + 0.10), glass)
-        bmesh_box(f"SolarF_{i}", (0.62, 0.42, 0.02),
-                  (WX - 0.6 + i * 0.7, -0.8, wing_roof_z + 0.07), metal)
+    solar_x = [WX - 0.6 + i * 0.7 for i in range(3)]
+    merged_boxes("Solar", (0.6, 0.4, 0.03), [(x, -0.8, wing_roof_z + 0.10) for x in solar_x], glass)
+    merged_boxes("SolarF", (0.62, 0.42, 0.02), [(x, -0.8, wing_roof_z + 0.07) for x in solar_x], metal)
 
     # === Communication spire ===
     spire_z = BZ + tower_h + float_tiers[2][3] + 0.15
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.03, depth=1.5,
-                                        location=(0, 0, spire_z + 0.75))
-    bpy.context.active_object.data.materials.append(metal)
+    bmesh_cylinder("CommSpire", 0.03, 1.5, 8, (0, 0, spire_z + 0.75), metal)
     for sz in [0.3, 0.6, 0.9, 1.2]:
         bmesh_box(f"SpireBar_{sz:.1f}", (0.5, 0.02, 0.02), (0, 0, spire_z + sz), metal)
 
     # Steps (minimal, floating)
-    for i in range(3):
-        bmesh_box(f"Step_{i}", (0.20, 1.8, 0.04),
-                  (tower_w / 2 + 0.80 + i * 0.22, 0, BZ - 0.02 - i * 0.02), metal)
+    merged_boxes("Steps", (0.20, 1.8, 0.04),
+                 [(tower_w / 2 + 0.80 + i * 0.22, 0, BZ - 0.02 - i * 0.02) for i in range(3)], metal)
 
 
 # ============================================================
@@ -1379,7 +1245,17 @@ AGE_BUILDERS = {
 }
 
 
+# Objects and shared meshes of the last Japanese Town Center build
+_SCOPE = new_scope()
+
+
 def build_town_center_japanese(materials, age='medieval'):
     """Build a Japanese Town Center with geometry appropriate for the given age."""
+    # Hand back the previous build's meshes/objects so a rebuild reuses them
+    release_all(_SCOPE)
     builder = AGE_BUILDERS.get(age, _build_medieval)
-    builder(materials)
+    set_scope(_SCOPE)
+    try:
+        builder(materials)
+    finally:
+        set_scope(None)
@@ -28,66 +28,69 @@ Digital:       Futuristic Persian — glass iwan portal, holographic geometric
                fractal structure
 """
 
-import bpy
-import bmesh
 import math
+from functools import lru_cache
+import numpy as np
+
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from lib.geometry import bmesh_box, bmesh_prism, bmesh_cone, pyramid_roof, mesh_from_pydata
+from lib.geometry import (bmesh_box, box_factory, bmesh_prism, prism_factory, bmesh_cone, bmesh_cylinder,
+                          uv_sphere, pyramid_roof, mesh_from_pydata, mesh_from_arrays, mesh_instances,
+                          merged_boxes, merged_prisms, extrude_ring, rect_xy, box_arrays, face_loops,
+                          frustum_arrays, join_arrays, ring_table, release_all, new_scope, set_scope)
+from lib.plan import planned
 
 
 # -- helpers ---------------------------------------------------------
 
+# Faces of the fixed-topology hand-built pieces, flattened once for mesh_from_arrays
+_TRI_LOOPS = face_loops([(0, 1, 2)])
+_QUAD_LOOPS = face_loops([(0, 1, 2, 3)])
+_ARCH_LOOPS = face_loops([(0, 1, 2, 4), (2, 3, 4)])
+# Eight-corner slab (bottom 0-3, top 4-7) such as the ramp and relief panels
+_SLAB_LOOPS = face_loops([(0, 1, 5, 4), (2, 3, 7, 6), (0, 3, 7, 4), (1, 2, 6, 5),
+                          (4, 5, 6, 7), (0, 1, 2, 3)])
+
+
+@lru_cache(maxsize=None)
+def _dome_topology(segments):
+    """Apex triangle fan, quads between the latitude rings, n-gon closing the base."""
+    rings = segments // 2
+    ring = np.arange(segments, dtype=np.int32)
+    nxt = np.roll(ring, -1)
+    fan = np.stack([np.zeros(segments, dtype=np.int32), 1 + ring, 1 + nxt], axis=-1).ravel()
+    base = (1 + np.arange(rings - 1, dtype=np.int32) * segments)[:, None]
+    quads = np.stack([base + ring, base + nxt, base + segments + nxt, base + segments + ring],
+                     axis=-1).ravel()
+    bottom = 1 + (rings - 1) * segments + ring[::-1]
+    loop_verts = np.concatenate([fan, quads, bottom])
+    loop_totals = np.concatenate([np.full(segments, 3, dtype=np.int32),
+                                  np.full((rings - 1) * segments, 4, dtype=np.int32),
+                                  np.array([segments], dtype=np.int32)])
+    return loop_verts, loop_totals
+
+
 def _dome(name, radius, height, segments, origin, material, smooth=True):
     """
     Half-sphere dome built from latitude/longitude strips.
     Gives the characteristic Persian bulbous dome shape.
     """
     ox, oy, oz = origin
-    verts = []
-    faces = []
     rings = segments // 2
+    cos_t, sin_t = ring_table(segments)
+    phi = (np.pi / 2) * np.arange(1, rings + 1, dtype=np.float32)[:, None] / rings
+    ring_r = radius * np.sin(phi)
 
-    # apex
-    verts.append((ox, oy, oz + height))
-
-    for r in range(1, rings + 1):
-        phi = (math.pi / 2) * (r / rings)
-        z = oz + height * math.cos(phi)
-        ring_r = radius * math.sin(phi)
-        for s in range(segments):
-            theta = (2 * math.pi * s) / segments
-            verts.append((ox + ring_r * math.cos(theta),
-                          oy + ring_r * math.sin(theta), z))
-
-    # faces from apex to first ring
-    for s in range(segments):
-        s_next = (s + 1) % segments
-        faces.append((0, 1 + s, 1 + s_next))
-
-    # faces between rings
-    for r in range(rings - 1):
-        base = 1 + r * segments
-        for s in range(segments):
-            s_next = (s + 1) % segments
-            a = base + s
-            b = base + s_next
-            c = base + segments + s_next
-            d = base + segments + s
-            faces.append((a, b, c, d))
-
-    # bottom face
-    last_ring_start = 1 + (rings - 1) * segments
-    bottom = list(range(last_ring_start, last_ring_start + segments))
-    faces.append(tuple(reversed(bottom)))
-
-    obj = mesh_from_pydata(name, verts, faces, material)
-    if smooth:
-        for p in obj.data.polygons:
-            p.use_smooth = True
-    return obj
+    # apex, then one ring per latitude
+    verts = np.empty((1 + rings * segments, 3), dtype=np.float32)
+    body = verts[1:].reshape(rings, segments, 3)
+    body[..., 0] = ox + ring_r * cos_t
+    body[..., 1] = oy + ring_r * sin_t
+    body[..., 2] = oz + height * np.cos(phi)
+    verts[0] = (ox, oy, oz + height)
+    return mesh_from_arrays(name, verts, *_dome_topology(segments), material, smooth=smooth)
 
 
 def _iwan(name, width, depth, height, origin, wall_mat, arch_mat):
@@ -99,18 +102,15 @@ def _iwan(name, width, depth, height, origin, wall_mat, arch_mat):
     hw = width / 2
     hd = depth / 2
 
-    # Side walls
+    # Side walls, top beam and full back wall as one mesh
     wall_t = 0.12
-    bmesh_box(f"{name}_WallL", (wall_t, depth, height),
-              (ox - hw + wall_t / 2, oy, oz + height / 2), wall_mat)
-    bmesh_box(f"{name}_WallR", (wall_t, depth, height),
-              (ox + hw - wall_t / 2, oy, oz + height / 2), wall_mat)
-    # Top beam
-    bmesh_box(f"{name}_Top", (width, depth, 0.10),
-              (ox, oy, oz + height - 0.05), wall_mat)
-    # Back wall (full)
-    bmesh_box(f"{name}_Back", (width, wall_t, height),
-              (ox, oy - hd + wall_t / 2, oz + height / 2), wall_mat)
+    merged_boxes(f"{name}_Frame",
+                 [(wall_t, depth, height), (wall_t, depth, height), (width, depth, 0.10),
+                  (width, wall_t, height)],
+                 [(ox - hw + wall_t / 2, oy, oz + height / 2),
+                  (ox + hw - wall_t / 2, oy, oz + height / 2),
+                  (ox, oy, oz + height - 0.05),
+                  (ox, oy - hd + wall_t / 2, oz + height / 2)], wall_mat)
 
     # Pointed arch face (simplified as triangular gable over rectangular opening)
     arch_w = width - wall_t * 2
@@ -125,21 +125,17 @@ def _iwan(name, width, depth, height, origin, wall_mat, arch_mat):
         (ox, front_y, oz + peak_h),
         (ox - arch_w / 2, front_y, oz + arch_h),
     ]
-    af = [(0, 1, 2, 4), (2, 3, 4)]
-    obj = mesh_from_pydata(f"{name}_Arch", av, af, arch_mat)
-    for p in obj.data.polygons:
-        p.use_smooth = True
-    return obj
+    return mesh_from_arrays(f"{name}_Arch", av, *_ARCH_LOOPS, arch_mat, smooth=True)
 
 
 def _minaret(name, radius, height, origin, material, cap_mat, segments=12):
     """Slender Persian minaret with a small dome cap."""
     ox, oy, oz = origin
-    # Shaft
-    bmesh_prism(f"{name}_Shaft", radius, height, segments, (ox, oy, oz), material)
-    # Balcony ring
-    bmesh_prism(f"{name}_Balcony", radius * 1.5, 0.08, segments,
-                (ox, oy, oz + height * 0.85), material)
+    # Shaft and balcony ring as one mesh
+    mesh_from_arrays(f"{name}_Shaft", *join_arrays(
+        frustum_arrays(ox, oy, oz, radius, radius, height, segments),
+        frustum_arrays(ox, oy, oz + height * 0.85, radius * 1.5, radius * 1.5, 0.08, segments)),
+        material)
     # Small dome cap
     _dome(f"{name}_Cap", radius * 1.3, radius * 1.8, segments,
           (ox, oy, oz + height), cap_mat)
@@ -154,17 +150,13 @@ def _windcatcher(name, width, height, origin, material, vent_mat):
     # Tower body
     bmesh_box(f"{name}_Body", (width, width, height),
               (ox, oy, oz + height / 2), material)
-    # Vent openings on four sides (upper portion)
+    # Vent openings on four sides (upper portion), one mesh
     vent_h = height * 0.3
     vent_z = oz + height - vent_h / 2 - 0.05
-    for dx, dy, rot in [(hw + 0.01, 0, 0), (-hw - 0.01, 0, 0),
-                         (0, hw + 0.01, 1), (0, -hw - 0.01, 1)]:
-        if rot == 0:
-            bmesh_box(f"{name}_Vent_{dx:.2f}", (0.04, width * 0.6, vent_h),
-                      (ox + dx, oy + dy, vent_z), vent_mat)
-        else:
-            bmesh_box(f"{name}_Vent_{dy:.2f}", (width * 0.6, 0.04, vent_h),
-                      (ox + dx, oy + dy, vent_z), vent_mat)
+    merged_boxes(f"{name}_Vents",
+                 [(0.04, width * 0.6, vent_h)] * 2 + [(width * 0.6, 0.04, vent_h)] * 2,
+                 [(ox + hw + 0.01, oy, vent_z), (ox - hw - 0.01, oy, vent_z),
+                  (ox, oy + hw + 0.01, vent_z), (ox, oy - hw - 0.01, vent_z)], vent_mat)
     # Cap
     pyramid_roof(f"{name}_Cap", width + 0.06, width + 0.06, 0.20,
                  overhang=0.04, origin=(ox, oy, oz + height), material=material)
@@ -176,39 +168,40 @@ def _muqarnas_band(name, cx, cy, z, width, depth, tiers, material):
     stepped, overlapping small boxes creating a cascading profile.
     """
     hw = width / 2
+    sizes, origins = [], []
     for t in range(tiers):
         n_cells = 4 + t * 2
         cell_w = width / n_cells
-        offset_z = z - t * 0.04
         inset = t * 0.02
-        for i in range(n_cells):
-            cx_i = cx - hw + inset + cell_w / 2 + i * (width - 2 * inset) / n_cells
-            bmesh_box(f"{name}_T{t}_C{i}", (cell_w * 0.85, depth, 0.035),
-                      (cx_i, cy, offset_z), material)
+        row = np.empty((n_cells, 3), dtype=np.float32)
+        row[:, 0] = cx - hw + inset + cell_w / 2 + np.arange(n_cells) * (width - 2 * inset) / n_cells
+        row[:, 1] = cy
+        row[:, 2] = z - t * 0.04
+        sizes += [(cell_w * 0.85, depth, 0.035)] * n_cells
+        origins.append(row)
+    # Every cell of the band in one mesh
+    merged_boxes(name, sizes, np.concatenate(origins), material)
 
 
 def _fluted_column(name, radius, height, origin, material, segments=12, flutes=8):
     """Fluted column reminiscent of Persepolis pillars."""
     ox, oy, oz = origin
-    bpy.ops.mesh.primitive_cylinder_add(vertices=segments, radius=radius, depth=height,
-                                        location=(ox, oy, oz + height / 2))
-    col = bpy.context.active_object
-    col.name = name
-    col.data.materials.append(material)
-    bpy.ops.object.shade_smooth()
-    # Column base
-    bmesh_prism(f"{name}_Base", radius * 1.3, 0.08, segments, (ox, oy, oz), material)
-    # Column capital
-    bmesh_box(f"{name}_Cap", (radius * 2.2, radius * 2.2, 0.10),
-              (ox, oy, oz + height + 0.05), material)
+    col = bmesh_cylinder(name, radius, height, segments, (ox, oy, oz + height / 2), material,
+                         smooth=True)
+    # Column base and capital: one shared mesh each for every column of this radius and material
+    prism_factory(radius * 1.3, 0.08, segments, material)(f"{name}_Base", (ox, oy, oz))
+    box_factory((radius * 2.2, radius * 2.2, 0.10), material=material)(
+        f"{name}_Cap", (ox, oy, oz + height + 0.05))
     return col
 
 
 # ============================================================
 # STONE AGE -- Neolithic Zagros mountain settlement
 # ============================================================
+@planned("Persians_Stone", merge=True)
 def _build_stone(m):
     Z = 0.0
+    stone_dark, wood, stone = m['stone_dark'], m['wood'], m['stone']
 
     bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
 
@@ -216,159 +209,114 @@ def _build_stone(m):
     wall_r = 2.2
     n_segs = 28
     wall_h = 0.75
-    for i in range(n_segs):
-        a0 = (2 * math.pi * i) / n_segs
-        a1 = (2 * math.pi * (i + 1)) / n_segs
-        # Gate gap at front
-        if 13 <= i <= 15:
-            continue
-        x0 = wall_r * math.cos(a0)
-        y0 = wall_r * math.sin(a0)
-        x1 = wall_r * math.cos(a1)
-        y1 = wall_r * math.sin(a1)
-        cx = (x0 + x1) / 2
-        cy = (y0 + y1) / 2
-        seg_len = math.sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2)
-        angle = math.atan2(y1 - y0, x1 - x0)
-        bm = bmesh.new()
-        hw = seg_len / 2 + 0.02
-        ht = 0.14
-        hh = wall_h / 2
-        v = [
-            bm.verts.new((-hw, -ht, -hh)), bm.verts.new((hw, -ht, -hh)),
-            bm.verts.new((hw, ht, -hh)), bm.verts.new((-hw, ht, -hh)),
-            bm.verts.new((-hw, -ht, hh)), bm.verts.new((hw, -ht, hh)),
-            bm.verts.new((hw, ht, hh)), bm.verts.new((-hw, ht, hh)),
-        ]
-        bm.faces.new([v[0], v[3], v[2], v[1]])
-        bm.faces.new([v[4], v[5], v[6], v[7]])
-        bm.faces.new([v[0], v[1], v[5], v[4]])
-        bm.faces.new([v[2], v[3], v[7], v[6]])
-        bm.faces.new([v[0], v[4], v[7], v[3]])
-        bm.faces.new([v[1], v[2], v[6], v[5]])
-        mesh = bpy.data.meshes.new(f"Wall_{i}")
-        bm.to_mesh(mesh)
-        bm.free()
-        obj = bpy.data.objects.new(f"Wall_{i}", mesh)
-        bpy.context.collection.objects.link(obj)
-        obj.location = (cx, cy, Z + wall_h / 2)
-        obj.rotation_euler = (0, 0, angle)
-        obj.data.materials.append(m['stone_dark'])
+    # Every segment is the same box (the ring is regular): one shared mesh, placed per segment.
+    # Segment i is the chord centred on angle (i + 0.5) * step, on the apothem circle,
+    # turned to the tangent there.
+    step = 2 * math.pi / n_segs
+    seg_len = 2 * wall_r * math.sin(step / 2)
+    apothem = wall_r * math.cos(step / 2)
+    mids = [(i + 0.5) * step for i in range(n_segs)]
+    placements = [(i, (apothem * math.cos(a), apothem * math.sin(a), Z + wall_h / 2), a + math.pi / 2)
+                  for i, a in enumerate(mids)
+                  if not 13 <= i <= 15]  # gate gap at front
+    mesh_instances("Wall", *box_arrays((seg_len + 0.04, 0.28, wall_h), (0, 0, 0)), placements,
+                   stone_dark)
 
     # Gate posts
-    for dy in [-0.35, 0.35]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.08, depth=1.0,
-                                            location=(2.2, dy, Z + 0.50))
-        bpy.context.active_object.name = f"GatePost_{dy:.2f}"
-        bpy.context.active_object.data.materials.append(m['wood'])
+    for i, dy in enumerate([-0.35, 0.35]):
+        bmesh_cylinder(f"GatePost_{i}", 0.08, 1.0, 8, (2.2, dy, Z + 0.50), wood)
     bmesh_box("GateLintel", (0.10, 0.80, 0.08), (2.2, 0, Z + 1.0), m['wood_dark'])
 
     # === Main rectangular room (largest, central) ===
-    bmesh_box("MainRoom", (2.0, 1.6, 1.2), (0, 0, Z + 0.60), m['stone'])
+    bmesh_box("MainRoom", (2.0, 1.6, 1.2), (0, 0, Z + 0.60), stone)
     # Flat mud-brick roof
-    bmesh_box("MainRoof", (2.2, 1.8, 0.10), (0, 0, Z + 1.25), m['stone_dark'])
+    bmesh_box("MainRoof", (2.2, 1.8, 0.10), (0, 0, Z + 1.25), stone_dark)
     # Door
     bmesh_box("MainDoor", (0.06, 0.45, 0.80), (1.01, 0, Z + 0.40), m['door'])
 
     # Roof support beams (wooden, visible)
-    for by in [-0.5, 0, 0.5]:
-        bmesh_box(f"Beam_{by:.1f}", (2.1, 0.08, 0.06), (0, by, Z + 1.15), m['wood'])
+    for i, by in enumerate([-0.5, 0, 0.5]):
+        bmesh_box(f"Beam_{i}", (2.1, 0.08, 0.06), (0, by, Z + 1.15), wood)
 
     # === Secondary room (attached, smaller) ===
-    bmesh_box("Room2", (1.2, 1.0, 0.95), (-1.3, -0.5, Z + 0.475), m['stone'])
-    bmesh_box("Room2Roof", (1.35, 1.15, 0.08), (-1.3, -0.5, Z + 1.00), m['stone_dark'])
+    bmesh_box("Room2", (1.2, 1.0, 0.95), (-1.3, -0.5, Z + 0.475), stone)
+    bmesh_box("Room2Roof", (1.35, 1.15, 0.08), (-1.3, -0.5, Z + 1.00), stone_dark)
     bmesh_box("Room2Door", (0.06, 0.35, 0.65), (-0.69, -0.5, Z + 0.33), m['door'])
 
     # === Small courtyard (open area with packed earth) ===
     bmesh_box("Courtyard", (1.5, 1.5, 0.04), (0.8, -1.0, Z + 0.02), m['stone_light'])
 
     # === Grain storage pit ===
-    bmesh_prism("GrainPit", 0.50, 0.08, 12, (-0.5, 1.2, Z + 0.04), m['stone_dark'])
+    bmesh_prism("GrainPit", 0.50, 0.08, 12, (-0.5, 1.2, Z + 0.04), stone_dark)
     bmesh_prism("GrainRim", 0.55, 0.10, 12, (-0.5, 1.2, Z), m['wood_dark'])
     # Woven cover
-    bpy.ops.mesh.primitive_cylinder_add(vertices=12, radius=0.45, depth=0.04,
-                                        location=(-0.5, 1.2, Z + 0.14))
-    bpy.context.active_object.name = "GrainCover"
-    bpy.context.active_object.data.materials.append(m['roof'])
+    bmesh_cylinder("GrainCover", 0.45, 0.04, 12, (-0.5, 1.2, Z + 0.14), m['roof'])
 
     # === Central fire pit ===
-    bmesh_prism("FirePit", 0.30, 0.08, 10, (0.8, -1.0, Z + 0.04), m['stone_dark'])
-    for i in range(6):
-        a = (2 * math.pi * i) / 6
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.05,
-                                              location=(0.8 + 0.25 * math.cos(a),
-                                                        -1.0 + 0.25 * math.sin(a), Z + 0.05))
-        st = bpy.context.active_object
-        st.name = f"FStone_{i}"
-        st.data.materials.append(m['stone'])
+    bmesh_prism("FirePit", 0.30, 0.08, 10, (0.8, -1.0, Z + 0.04), stone_dark)
+    for i, (c, s) in enumerate(zip(*ring_table(6))):
+        uv_sphere(f"FStone_{i}", 0.05, (0.8 + 0.25 * c, -1.0 + 0.25 * s, Z + 0.05), stone)
 
     # === Storage room (rectangular, small) ===
-    bmesh_box("StoreRoom", (0.80, 0.65, 0.80), (1.5, 1.0, Z + 0.40), m['stone'])
-    bmesh_box("StoreRoof", (0.90, 0.75, 0.06), (1.5, 1.0, Z + 0.83), m['stone_dark'])
+    bmesh_box("StoreRoom", (0.80, 0.65, 0.80), (1.5, 1.0, Z + 0.40), stone)
+    bmesh_box("StoreRoof", (0.90, 0.75, 0.06), (1.5, 1.0, Z + 0.83), stone_dark)
 
     # === Clay water jars ===
     for i, (px, py) in enumerate([(-1.6, 0.6), (0.3, 1.5)]):
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.10, location=(px, py, Z + 0.10))
-        jar = bpy.context.active_object
-        jar.name = f"Jar_{i}"
-        jar.scale = (1, 1, 1.3)
-        jar.data.materials.append(m['roof_edge'])
+        uv_sphere(f"Jar_{i}", 0.10, (px, py, Z + 0.10), m['roof_edge'], scale=(1, 1, 1.3))
 
     # === Drying rack ===
-    for dx in [-0.25, 0.25]:
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.03, depth=1.0,
-                                            location=(-1.8 + dx, -1.5, Z + 0.50))
-        bpy.context.active_object.data.materials.append(m['wood'])
-    bmesh_box("DryBar", (0.04, 0.55, 0.04), (-1.8, -1.5, Z + 1.0), m['wood'])
+    for i, dx in enumerate([-0.25, 0.25]):
+        bmesh_cylinder(f"DryPost_{i}", 0.03, 1.0, 6, (-1.8 + dx, -1.5, Z + 0.50), wood)
+    bmesh_box("DryBar", (0.04, 0.55, 0.04), (-1.8, -1.5, Z + 1.0), wood)
 
 
 # ============================================================
 # BRONZE AGE -- Elamite ziggurat complex
 # ============================================================
+@planned("Persians_Bronze", merge=True)
 def _build_bronze(m):
     Z = 0.0
+    stone, stone_dark = m['stone'], m['stone_dark']
 
     bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
 
     # === Outer brick enclosure wall ===
     ow_hw = 2.4
     ow_h = 1.0
-    bmesh_box("OuterWallF", (0.15, ow_hw * 2, ow_h), (ow_hw, 0, Z + ow_h / 2), m['stone'], bevel=0.02)
-    bmesh_box("OuterWallB", (0.15, ow_hw * 2, ow_h), (-ow_hw, 0, Z + ow_h / 2), m['stone'], bevel=0.02)
-    bmesh_box("OuterWallR", (ow_hw * 2, 0.15, ow_h), (0, -ow_hw, Z + ow_h / 2), m['stone'], bevel=0.02)
-    bmesh_box("OuterWallL", (ow_hw * 2, 0.15, ow_h), (0, ow_hw, Z + ow_h / 2), m['stone'], bevel=0.02)
+    ow_t = 0.15
+    # All four sides as one extruded ring, beveled once
+    extrude_ring("OuterWall", rect_xy(0, 0, ow_hw + ow_t / 2, ow_hw + ow_t / 2),
+                 rect_xy(0, 0, ow_hw - ow_t / 2, ow_hw - ow_t / 2), Z, Z + ow_h, stone, bevel=0.02)
 
-    # Wall crenellations
+    # Wall crenellations: one shared block mesh
+    placements = []
     for i in range(10):
         cx = -ow_hw + 0.30 + i * (ow_hw * 2 - 0.60) / 9
-        bmesh_box(f"CrenF_{i}", (0.18, 0.18, 0.18),
-                  (ow_hw, cx, Z + ow_h + 0.09), m['stone_dark'])
-        bmesh_box(f"CrenB_{i}", (0.18, 0.18, 0.18),
-                  (-ow_hw, cx, Z + ow_h + 0.09), m['stone_dark'])
+        placements += [(f"F_{i}", (ow_hw, cx, Z + ow_h + 0.09), 0),
+                       (f"B_{i}", (-ow_hw, cx, Z + ow_h + 0.09), 0)]
+    mesh_instances("Cren", *box_arrays((0.18, 0.18, 0.18), (0, 0, 0)), placements, stone_dark)
 
     # === Gateway with bull guardians ===
     gate_x = ow_hw + 0.01
-    bmesh_box("GatePillarL", (0.15, 0.15, 1.4), (gate_x, -0.40, Z + 0.70), m['stone_dark'])
-    bmesh_box("GatePillarR", (0.15, 0.15, 1.4), (gate_x, 0.40, Z + 0.70), m['stone_dark'])
-    bmesh_box("GateLintel", (0.20, 1.00, 0.12), (gate_x, 0, Z + 1.40), m['stone_dark'])
+    bmesh_box("GatePillarL", (0.15, 0.15, 1.4), (gate_x, -0.40, Z + 0.70), stone_dark)
+    bmesh_box("GatePillarR", (0.15, 0.15, 1.4), (gate_x, 0.40, Z + 0.70), stone_dark)
+    bmesh_box("GateLintel", (0.20, 1.00, 0.12), (gate_x, 0, Z + 1.40), stone_dark)
     bmesh_box("GateDoor", (0.06, 0.60, 1.0), (gate_x + 0.08, 0, Z + 0.50), m['door'])
 
     # Bull guardian figures (simplified as blocky shapes)
     for dy, lbl in [(-0.60, "L"), (0.60, "R")]:
         # Body
         bmesh_box(f"Bull_{lbl}_Body", (0.35, 0.18, 0.30),
-                  (gate_x + 0.20, dy, Z + 0.15), m['stone_dark'])
+                  (gate_x + 0.20, dy, Z + 0.15), stone_dark)
         # Head
         bmesh_box(f"Bull_{lbl}_Head", (0.12, 0.12, 0.18),
-                  (gate_x + 0.35, dy, Z + 0.35), m['stone_dark'])
+                  (gate_x + 0.35, dy, Z + 0.35), stone_dark)
         # Horns
-        for hdy in [-0.08, 0.08]:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.015, depth=0.15,
-                                                location=(gate_x + 0.38, dy + hdy, Z + 0.48))
-            horn = bpy.context.active_object
-            horn.name = f"BullHorn_{lbl}_{hdy:.2f}"
-            horn.rotation_euler = (0, math.radians(30), 0)
-            horn.data.materials.append(m['gold'])
+        for hi, hdy in enumerate([-0.08, 0.08]):
+            bmesh_cylinder(f"BullHorn_{lbl}_{hi}", 0.015, 0.15, 6,
+                           (gate_x + 0.38, dy + hdy, Z + 0.48), m['gold'],
+                           rotation=(0, math.radians(30), 0))
 
     # === Three-tiered ziggurat (central) ===
     tiers = [
@@ -378,21 +326,21 @@ def _build_bronze(m):
     ]
     cur_z = Z + 0.02
     for t, (tw, td, th) in enumerate(tiers):
-        bmesh_box(f"Zig_{t}", (tw, td, th), (0, 0, cur_z + th / 2), m['stone'])
+        bmesh_box(f"Zig_{t}", (tw, td, th), (0, 0, cur_z + th / 2), stone)
         # Stepped edges (brick pattern)
         bmesh_box(f"ZigTrim_{t}", (tw + 0.04, td + 0.04, 0.06),
-                  (0, 0, cur_z + th), m['stone_dark'])
+                  (0, 0, cur_z + th), stone_dark)
         # Decorative niches on walls
         if t < 2:
             n_niches = 4 - t
             for ni in range(n_niches):
                 nx = -tw / 2 + 0.30 + ni * (tw - 0.60) / max(1, n_niches - 1)
                 bmesh_box(f"Niche_{t}_{ni}", (0.15, 0.06, 0.30),
-                          (nx, td / 2 + 0.01, cur_z + th * 0.5), m['stone_dark'])
+                          (nx, td / 2 + 0.01, cur_z + th * 0.5), stone_dark)
         cur_z += th
 
     # Small temple at ziggurat top
-    bmesh_box("Temple", (0.90, 0.70, 0.60), (0, 0, cur_z + 0.30), m['stone_dark'])
+    bmesh_box("Temple", (0.90, 0.70, 0.60), (0, 0, cur_z + 0.30), stone_dark)
     bmesh_box("TempleRoof", (1.0, 0.80, 0.06), (0, 0, cur_z + 0.63), m['stone_trim'])
     bmesh_box("TempleDoor", (0.05, 0.25, 0.45), (0.46, 0, cur_z + 0.23), m['door'])
 
@@ -403,30 +351,27 @@ def _build_bronze(m):
         (1.6, -0.35, Z + 1.2), (1.75, -0.35, Z + 1.2),
         (1.75, 0.35, Z + 1.2), (1.6, 0.35, Z + 1.2),
     ]
-    ramp_faces = [(0, 1, 5, 4), (2, 3, 7, 6), (0, 3, 7, 4),
-                  (1, 2, 6, 5), (4, 5, 6, 7), (0, 1, 2, 3)]
-    mesh_from_pydata("Ramp", ramp_verts, ramp_faces, m['stone_dark'])
+    mesh_from_arrays("Ramp", ramp_verts, *_SLAB_LOOPS, stone_dark)
 
     # === Auxiliary building ===
-    bmesh_box("AuxBuilding", (1.0, 0.80, 0.80), (-1.8, -1.5, Z + 0.40), m['stone'])
+    bmesh_box("AuxBuilding", (1.0, 0.80, 0.80), (-1.8, -1.5, Z + 0.40), stone)
     pyramid_roof("AuxRoof", 1.0, 0.80, 0.30, overhang=0.08,
-                 origin=(-1.8, -1.5, Z + 0.80), material=m['stone_dark'])
+                 origin=(-1.8, -1.5, Z + 0.80), material=stone_dark)
 
     # Flagpole
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.03, depth=1.5,
-                                        location=(0, 0, cur_z + 0.63 + 0.75))
-    bpy.context.active_object.name = "Flagpole"
-    bpy.context.active_object.data.materials.append(m['wood'])
+    bmesh_cylinder("Flagpole", 0.03, 1.5, 6, (0, 0, cur_z + 0.63 + 0.75), m['wood'])
     bv = [(0.04, 0, cur_z + 1.80), (0.45, 0.03, cur_z + 1.75),
           (0.45, 0.02, cur_z + 2.00), (0.04, 0, cur_z + 1.98)]
-    mesh_from_pydata("Flag", bv, [(0, 1, 2, 3)], m['banner'])
+    mesh_from_arrays("Flag", bv, *_QUAD_LOOPS, m['banner'])
 
 
 # ============================================================
 # IRON AGE -- Median fortress
 # ============================================================
+@planned("Persians_Iron", merge=True)
 def _build_iron(m):
     Z = 0.0
+    stone_dark, stone, stone_light = m['stone_dark'], m['stone'], m['stone_light']
 
     bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
 
@@ -434,12 +379,13 @@ def _build_iron(m):
     fw_hw = 2.3
     fw_h = 1.5
     wall_t = 0.25
-    bmesh_box("FortWallF", (wall_t, fw_hw * 2, fw_h), (fw_hw, 0, Z + fw_h / 2), m['stone_dark'], bevel=0.03)
-    bmesh_box("FortWallB", (wall_t, fw_hw * 2, fw_h), (-fw_hw, 0, Z + fw_h / 2), m['stone_dark'], bevel=0.03)
-    bmesh_box("FortWallR", (fw_hw * 2, wall_t, fw_h), (0, -fw_hw, Z + fw_h / 2), m['stone_dark'], bevel=0.03)
-    bmesh_box("FortWallL", (fw_hw * 2, wall_t, fw_h), (0, fw_hw, Z + fw_h / 2), m['stone_dark'], bevel=0.03)
+    # All four sides as one extruded ring, beveled once
+    extrude_ring("FortWall", rect_xy(0, 0, fw_hw + wall_t / 2, fw_hw + wall_t / 2),
+                 rect_xy(0, 0, fw_hw - wall_t / 2, fw_hw - wall_t / 2), Z, Z + fw_h, stone_dark,
+                 bevel=0.03)
 
-    # Crenellations on all walls
+    # Crenellations on all walls: one shared block mesh, turned a quarter for the walls along x
+    placements = []
     for wall_idx, (wx, wy, along_x) in enumerate([
         (fw_hw, 0, False), (-fw_hw, 0, False),
         (0, -fw_hw, True), (0, fw_hw, True),
@@ -447,26 +393,25 @@ def _build_iron(m):
         for ci in range(9):
             offset = -fw_hw + 0.30 + ci * (fw_hw * 2 - 0.60) / 8
             if along_x:
-                bmesh_box(f"Cren_{wall_idx}_{ci}", (0.20, 0.28, 0.20),
-                          (offset, wy, Z + fw_h + 0.10), m['stone_dark'])
+                placements.append((f"{wall_idx}_{ci}", (offset, wy, Z + fw_h + 0.10), math.pi / 2))
             else:
-                bmesh_box(f"Cren_{wall_idx}_{ci}", (0.28, 0.20, 0.20),
-                          (wx, offset, Z + fw_h + 0.10), m['stone_dark'])
+                placements.append((f"{wall_idx}_{ci}", (wx, offset, Z + fw_h + 0.10), 0))
+    mesh_instances("Cren", *box_arrays((0.28, 0.20, 0.20), (0, 0, 0)), placements, stone_dark)
 
     # === Corner towers (4) ===
     for tx, ty, lbl in [(fw_hw, fw_hw, "FL"), (fw_hw, -fw_hw, "FR"),
                         (-fw_hw, fw_hw, "BL"), (-fw_hw, -fw_hw, "BR")]:
         tower_h = 2.2
-        bmesh_prism(f"Tower_{lbl}", 0.45, tower_h, 8, (tx, ty, Z), m['stone_dark'])
+        bmesh_prism(f"Tower_{lbl}", 0.45, tower_h, 8, (tx, ty, Z), stone_dark)
         # Tower cap (cone roof)
         bmesh_cone(f"TowerCap_{lbl}", 0.55, 0.45, 8, (tx, ty, Z + tower_h), m['roof'])
         # Arrow slits
         bmesh_box(f"Slit_{lbl}", (0.04, 0.08, 0.30),
-                  (tx + 0.42 * (1 if tx > 0 else -1), ty, Z + tower_h * 0.6), m['stone'])
+                  (tx + 0.42 * (1 if tx > 0 else -1), ty, Z + tower_h * 0.6), stone)
 
     # === Gatehouse ===
     gate_x = fw_hw + 0.01
-    bmesh_box("GateFrame", (0.30, 1.0, 2.0), (gate_x, 0, Z + 1.0), m['stone_dark'])
+    bmesh_box("GateFrame", (0.30, 1.0, 2.0), (gate_x, 0, Z + 1.0), stone_dark)
     bmesh_box("GateOpen", (0.32, 0.65, 1.4), (gate_x, 0, Z + 0.70), m['door'])
     pyramid_roof("GateRoof", 0.50, 1.2, 0.30, overhang=0.08,
                  origin=(gate_x, 0, Z + 2.0), material=m['roof'])
@@ -477,31 +422,27 @@ def _build_iron(m):
     hall_w, hall_d = 2.6, 2.0
     hall_h = 2.5
     # Stone platform
-    bmesh_box("HallPlat", (hall_w + 0.3, hall_d + 0.3, 0.15), (0, 0, BZ + 0.075), m['stone'], bevel=0.04)
+    bmesh_box("HallPlat", (hall_w + 0.3, hall_d + 0.3, 0.15), (0, 0, BZ + 0.075), stone, bevel=0.04)
 
     fl_z = BZ + 0.15
     # Columns (3x3 grid)
     col_xs = [-0.80, 0, 0.80]
     col_ys = [-0.65, 0, 0.65]
-    for px in col_xs:
-        for py in col_ys:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=10, radius=0.09, depth=hall_h,
-                                                location=(px, py, fl_z + hall_h / 2))
-            col = bpy.context.active_object
-            col.name = f"ApadCol_{px:.1f}_{py:.1f}"
-            col.data.materials.append(m['stone_light'])
-            bpy.ops.object.shade_smooth()
+    for xi, px in enumerate(col_xs):
+        for yi, py in enumerate(col_ys):
+            bmesh_cylinder(f"ApadCol_{xi}_{yi}", 0.09, hall_h, 10,
+                           (px, py, fl_z + hall_h / 2), stone_light, smooth=True)
             # Simple capital
-            bmesh_box(f"ApadCap_{px:.1f}_{py:.1f}", (0.22, 0.22, 0.08),
-                      (px, py, fl_z + hall_h + 0.04), m['stone_light'])
+            bmesh_box(f"ApadCap_{xi}_{yi}", (0.22, 0.22, 0.08),
+                      (px, py, fl_z + hall_h + 0.04), stone_light)
 
     # Walls (partial, between columns on back and sides)
     bmesh_box("HallWallB", (0.08, hall_d, hall_h * 0.6),
-              (-hall_w / 2 + 0.04, 0, fl_z + hall_h * 0.3), m['stone'])
+              (-hall_w / 2 + 0.04, 0, fl_z + hall_h * 0.3), stone)
     bmesh_box("HallWallR", (hall_w, 0.08, hall_h * 0.6),
-              (0, -hall_d / 2 + 0.04, fl_z + hall_h * 0.3), m['stone'])
+              (0, -hall_d / 2 + 0.04, fl_z + hall_h * 0.3), stone)
     bmesh_box("HallWallL", (hall_w, 0.08, hall_h * 0.6),
-              (0, hall_d / 2 - 0.04, fl_z + hall_h * 0.3), m['stone'])
+              (0, hall_d / 2 - 0.04, fl_z + hall_h * 0.3), stone)
 
     # Flat timber roof with stone trim
     bmesh_box("HallRoof", (hall_w + 0.2, hall_d + 0.2, 0.12),
@@ -516,40 +457,45 @@ def _build_iron(m):
     for dy, lbl in [(-0.55, "L"), (0.55, "R")]:
         # Lion body (blocky, stylized)
         bmesh_box(f"Lion_{lbl}_Body", (0.40, 0.18, 0.25),
-                  (hall_w / 2 + 0.30, dy, fl_z + 0.125), m['stone_light'])
+                  (hall_w / 2 + 0.30, dy, fl_z + 0.125), stone_light)
         # Lion head
         bmesh_box(f"Lion_{lbl}_Head", (0.15, 0.14, 0.18),
-                  (hall_w / 2 + 0.50, dy, fl_z + 0.30), m['stone_light'])
+                  (hall_w / 2 + 0.50, dy, fl_z + 0.30), stone_light)
         # Mane
         bmesh_prism(f"Lion_{lbl}_Mane", 0.10, 0.06, 8,
                     (hall_w / 2 + 0.45, dy, fl_z + 0.30), m['gold'])
 
     # Steps to hall
-    for i in range(4):
-        bmesh_box(f"Step_{i}", (0.16, 1.4, 0.05),
-                  (hall_w / 2 + 0.50 + i * 0.18, 0, fl_z - 0.03 - i * 0.04), m['stone'])
+    i = np.arange(4)
+    merged_boxes("Steps", (0.16, 1.4, 0.05),
+                 np.column_stack((hall_w / 2 + 0.50 + i * 0.18, np.zeros(4),
+                                  fl_z - 0.03 - i * 0.04)),
+                 stone)
 
 
 # ============================================================
 # CLASSICAL AGE -- Achaemenid Persepolis
 # ============================================================
+@planned("Persians_Classical", merge=True)
 def _build_classical(m):
     Z = 0.0
+    stone_dark, stone, stone_light, gold = m['stone_dark'], m['stone'], m['stone_light'], m['gold']
 
     bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
 
     # === Grand stone platform (multi-tier, Persepolis terrace) ===
-    bmesh_box("Plat1", (5.2, 4.8, 0.20), (0, 0, Z + 0.10), m['stone_dark'], bevel=0.05)
-    bmesh_box("Plat2", (4.8, 4.4, 0.15), (0, 0, Z + 0.275), m['stone'], bevel=0.04)
+    bmesh_box("Plat1", (5.2, 4.8, 0.20), (0, 0, Z + 0.10), stone_dark, bevel=0.05)
+    bmesh_box("Plat2", (4.8, 4.4, 0.15), (0, 0, Z + 0.275), stone, bevel=0.04)
 
     BZ = Z + 0.35
 
     # === Wide staircase with relief panels ===
     stair_x = 2.4
     n_steps = 8
-    for i in range(n_steps):
-        bmesh_box(f"Step_{i}", (0.18, 2.0, 0.06),
-                  (stair_x + i * 0.20, 0, BZ - 0.04 - i * 0.04), m['stone'])
+    i = np.arange(n_steps)
+    merged_boxes("Steps", (0.18, 2.0, 0.06),
+                 np.column_stack((stair_x + i * 0.20, np.zeros(n_steps), BZ - 0.04 - i * 0.04)),
+                 stone)
 
     # Relief panels on staircase sides (simplified as textured slabs)
     for dy, lbl in [(-1.05, "L"), (1.05, "R")]:
@@ -564,9 +510,7 @@ def _build_classical(m):
             (stair_x + n_steps * 0.20, dy + 0.04, BZ + 0.40 - n_steps * 0.04),
             (stair_x, dy + 0.04, BZ + 0.40),
         ]
-        pf = [(0, 1, 5, 4), (2, 3, 7, 6), (0, 3, 7, 4), (1, 2, 6, 5),
-              (4, 5, 6, 7), (0, 1, 2, 3)]
-        mesh_from_pydata(f"Relief_{lbl}", panel_verts, pf, m['stone_trim'])
+        mesh_from_arrays(f"Relief_{lbl}", panel_verts, *_SLAB_LOOPS, m['stone_trim'])
 
     # === Apadana hall (grand columned audience hall) ===
     hall_w, hall_d = 3.6, 3.0
@@ -575,92 +519,87 @@ def _build_classical(m):
     # Tall fluted columns (4x4 grid)
     col_xs = [-1.2, -0.4, 0.4, 1.2]
     col_ys = [-1.0, -0.33, 0.33, 1.0]
-    for px in col_xs:
-        for py in col_ys:
-            _fluted_column(f"ApadCol_{px:.1f}_{py:.1f}", 0.09, hall_h,
-                           (px, py, BZ), m['stone_light'])
+    for xi, px in enumerate(col_xs):
+        for yi, py in enumerate(col_ys):
+            _fluted_column(f"ApadCol_{xi}_{yi}", 0.09, hall_h,
+                           (px, py, BZ), stone_light)
 
     # Bull capitals on corner columns (double bull heads)
-    for px in [col_xs[0], col_xs[-1]]:
-        for py in [col_ys[0], col_ys[-1]]:
+    for xi in (0, len(col_xs) - 1):
+        for yi in (0, len(col_ys) - 1):
+            px, py = col_xs[xi], col_ys[yi]
             cap_z = BZ + hall_h + 0.10
             # Two bull heads facing outward
-            for ddx, ddy in [(0.10, 0), (-0.10, 0)]:
-                bmesh_box(f"BullCap_{px:.1f}_{py:.1f}_{ddx:.2f}",
-                          (0.10, 0.08, 0.14), (px + ddx, py + ddy, cap_z + 0.07), m['stone_light'])
+            for bi, (ddx, ddy) in enumerate([(0.10, 0), (-0.10, 0)]):
+                bmesh_box(f"BullCap_{xi}_{yi}_{bi}",
+                          (0.10, 0.08, 0.14), (px + ddx, py + ddy, cap_z + 0.07), stone_light)
                 # Horns
-                for hd in [-0.05, 0.05]:
-                    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.012, depth=0.10,
-                                                        location=(px + ddx + 0.06, py + ddy + hd, cap_z + 0.18))
-                    horn = bpy.context.active_object
-                    horn.name = f"BullHorn_{px:.1f}_{py:.1f}_{ddx:.2f}_{hd:.2f}"
-                    horn.rotation_euler = (0, math.radians(25), 0)
-                    horn.data.materials.append(m['gold'])
+                for hi, hd in enumerate([-0.05, 0.05]):
+                    bmesh_cylinder(f"BullHorn_{xi}_{yi}_{bi}_{hi}", 0.012, 0.10, 6,
+                                   (px + ddx + 0.06, py + ddy + hd, cap_z + 0.18), gold,
+                                   rotation=(0, math.radians(25), 0))
 
     # Roof beams (massive wooden)
     bmesh_box("RoofBeams", (hall_w + 0.3, hall_d + 0.3, 0.15),
               (0, 0, BZ + hall_h + 0.10 + 0.075), m['wood_dark'])
     bmesh_box("RoofSlab", (hall_w + 0.4, hall_d + 0.4, 0.08),
-              (0, 0, BZ + hall_h + 0.32), m['stone_dark'])
+              (0, 0, BZ + hall_h + 0.32), stone_dark)
 
     # Partial walls (back and sides, with windows)
     bmesh_box("WallB", (0.10, hall_d, hall_h * 0.5),
-              (-hall_w / 2, 0, BZ + hall_h * 0.25), m['stone'])
+              (-hall_w / 2, 0, BZ + hall_h * 0.25), stone)
     for py_s in [-1, 1]:
         py = py_s * hall_d / 2
         bmesh_box(f"WallS_{py_s}", (hall_w * 0.5, 0.10, hall_h * 0.5),
-                  (-hall_w / 4, py, BZ + hall_h * 0.25), m['stone'])
+                  (-hall_w / 4, py, BZ + hall_h * 0.25), stone)
 
     # === Gate of All Nations (smaller structure to the side) ===
     GX, GY = 1.8, -1.5
     gate_w, gate_d = 1.2, 0.80
     gate_h = 2.2
     bmesh_box("GateNations", (gate_w, gate_d, gate_h),
-              (GX, GY, BZ + gate_h / 2), m['stone'])
+              (GX, GY, BZ + gate_h / 2), stone)
     bmesh_box("GateNDoor", (0.06, 0.50, 1.40), (GX + gate_w / 2 + 0.01, GY, BZ + 0.70), m['door'])
     # Lamassu figures (winged bulls at gate entrance)
     for ddy, lbl in [(-0.40, "L"), (0.40, "R")]:
         # Winged bull body
         bmesh_box(f"Lamassu_{lbl}", (0.30, 0.15, 0.35),
-                  (GX + gate_w / 2 + 0.20, GY + ddy, BZ + 0.175), m['stone_light'])
+                  (GX + gate_w / 2 + 0.20, GY + ddy, BZ + 0.175), stone_light)
         # Head
         bmesh_box(f"LamHead_{lbl}", (0.12, 0.10, 0.15),
-                  (GX + gate_w / 2 + 0.35, GY + ddy, BZ + 0.40), m['stone_light'])
+                  (GX + gate_w / 2 + 0.35, GY + ddy, BZ + 0.40), stone_light)
         # Wing (simple triangular)
         wv = [
             (GX + gate_w / 2 + 0.12, GY + ddy, BZ + 0.30),
             (GX + gate_w / 2 + 0.20, GY + ddy + 0.08 * (1 if ddy > 0 else -1), BZ + 0.55),
             (GX + gate_w / 2 + 0.30, GY + ddy, BZ + 0.30),
         ]
-        mesh_from_pydata(f"LamWing_{lbl}", wv, [(0, 1, 2)], m['gold'])
+        mesh_from_arrays(f"LamWing_{lbl}", wv, *_TRI_LOOPS, gold)
     # Gate roof
     bmesh_box("GateNRoof", (gate_w + 0.15, gate_d + 0.15, 0.10),
-              (GX, GY, BZ + gate_h + 0.05), m['stone_dark'])
+              (GX, GY, BZ + gate_h + 0.05), stone_dark)
 
     # === Fire altar ===
     AX, AY = -1.8, 1.2
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.12, depth=0.60,
-                                        location=(AX, AY, BZ + 0.30))
-    bpy.context.active_object.name = "Altar"
-    bpy.context.active_object.data.materials.append(m['stone'])
-    bmesh_cone("AltarFlame", 0.08, 0.25, 8, (AX, AY, BZ + 0.60), m['gold'])
+    bmesh_cylinder("Altar", 0.12, 0.60, 8, (AX, AY, BZ + 0.30), stone)
+    bmesh_cone("AltarFlame", 0.08, 0.25, 8, (AX, AY, BZ + 0.60), gold)
 
     # Gold ornament at roof peak
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.08, location=(0, 0, BZ + hall_h + 0.40))
-    bpy.context.active_object.data.materials.append(m['gold'])
-    bpy.ops.object.shade_smooth()
+    uv_sphere("RoofOrnament", 0.08, (0, 0, BZ + hall_h + 0.40), gold, smooth=True)
 
 
 # ============================================================
 # MEDIEVAL AGE -- Sassanid/Islamic palace
 # ============================================================
+@planned("Persians_Medieval", merge=True)
 def _build_medieval(m):
     Z = 0.0
+    stone_dark, stone, stone_trim, gold = m['stone_dark'], m['stone'], m['stone_trim'], m['gold']
 
     bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
 
     # === Stone platform ===
-    bmesh_box("Plat", (5.0, 4.8, 0.12), (0, 0, Z + 0.06), m['stone_dark'], bevel=0.04)
+    bmesh_box("Plat", (5.0, 4.8, 0.12), (0, 0, Z + 0.06), stone_dark, bevel=0.04)
 
     BZ = Z + 0.12
 
@@ -668,41 +607,37 @@ def _build_medieval(m):
     main_w, main_d = 3.2, 2.8
     main_h = 2.5
     bmesh_box("PalaceBody", (main_w, main_d, main_h),
-              (0, 0, BZ + main_h / 2), m['stone'])
+              (0, 0, BZ + main_h / 2), stone)
 
     # Decorative tile trim bands
-    for bz_i in range(3):
-        lz = BZ + 0.60 + bz_i * 0.80
-        bmesh_box(f"TileBand_{bz_i}", (main_w + 0.04, main_d + 0.04, 0.06),
-                  (0, 0, lz), m['stone_trim'])
+    band_z = BZ + 0.60 + 0.80 * np.arange(3)
+    merged_boxes("TileBands", (main_w + 0.04, main_d + 0.04, 0.06),
+                 np.column_stack((np.zeros(3), np.zeros(3), band_z)), stone_trim)
 
     # === Grand iwan (tall arched portal, front face) ===
     iwan_w = 1.6
     iwan_h = main_h + 0.5
-    _iwan("MainIwan", iwan_w, 0.60, iwan_h, (0, main_d / 2, BZ), m['stone_dark'], m['gold'])
+    _iwan("MainIwan", iwan_w, 0.60, iwan_h, (0, main_d / 2, BZ), stone_dark, gold)
 
     # Iwan decorative spandrels (geometric patterns - simplified as panels)
-    for dx in [-0.55, 0.55]:
-        bmesh_box(f"Spandrel_{dx:.2f}", (0.35, 0.04, 0.35),
-                  (dx, main_d / 2 + 0.02, BZ + iwan_h - 0.50), m['stone_trim'])
+    for i, dx in enumerate([-0.55, 0.55]):
+        bmesh_box(f"Spandrel_{i}", (0.35, 0.04, 0.35),
+                  (dx, main_d / 2 + 0.02, BZ + iwan_h - 0.50), stone_trim)
 
     # === Central dome ===
     dome_r = 1.0
     dome_h = 1.2
     dome_base = BZ + main_h
     # Drum (octagonal base for dome)
-    bmesh_prism("DomeDrum", dome_r + 0.05, 0.30, 8, (0, 0, dome_base), m['stone'])
+    bmesh_prism("DomeDrum", dome_r + 0.05, 0.30, 8, (0, 0, dome_base), stone)
     # Dome
     _dome("MainDome", dome_r, dome_h, 16, (0, 0, dome_base + 0.30), m['roof'])
 
     # Dome finial (gold crescent)
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.06,
-                                          location=(0, 0, dome_base + 0.30 + dome_h + 0.06))
-    bpy.context.active_object.data.materials.append(m['gold'])
-    bpy.ops.object.shade_smooth()
+    uv_sphere("DomeFinial", 0.06, (0, 0, dome_base + 0.30 + dome_h + 0.06), gold, smooth=True)
 
     # === Muqarnas cornice under dome ===
-    _muqarnas_band("DomeMuq", 0, 0, dome_base + 0.05, 2.2, 0.10, 3, m['stone_trim'])
+    _muqarnas_band("DomeMuq", 0, 0, dome_base + 0.05, 2.2, 0.10, 3, stone_trim)
 
     # === Courtyard with pool ===
     CX, CY = 0, -1.6
@@ -710,61 +645,60 @@ def _build_medieval(m):
     # Reflecting pool
     bmesh_box("Pool", (1.2, 0.60, 0.08), (CX, CY, BZ + 0.04), m['window'])
     # Pool border
-    bmesh_box("PoolBorderF", (1.30, 0.06, 0.10), (CX, CY - 0.33, BZ + 0.05), m['stone'])
-    bmesh_box("PoolBorderB", (1.30, 0.06, 0.10), (CX, CY + 0.33, BZ + 0.05), m['stone'])
-    bmesh_box("PoolBorderL", (0.06, 0.60, 0.10), (CX - 0.65, CY, BZ + 0.05), m['stone'])
-    bmesh_box("PoolBorderR", (0.06, 0.60, 0.10), (CX + 0.65, CY, BZ + 0.05), m['stone'])
+    bmesh_box("PoolBorderF", (1.30, 0.06, 0.10), (CX, CY - 0.33, BZ + 0.05), stone)
+    bmesh_box("PoolBorderB", (1.30, 0.06, 0.10), (CX, CY + 0.33, BZ + 0.05), stone)
+    bmesh_box("PoolBorderL", (0.06, 0.60, 0.10), (CX - 0.65, CY, BZ + 0.05), stone)
+    bmesh_box("PoolBorderR", (0.06, 0.60, 0.10), (CX + 0.65, CY, BZ + 0.05), stone)
 
     # === Wind tower (badgir) ===
-    _windcatcher("Badgir", 0.55, 2.8, (-1.2, 0.8, BZ), m['stone'], m['wood_dark'])
+    _windcatcher("Badgir", 0.55, 2.8, (-1.2, 0.8, BZ), stone, m['wood_dark'])
 
     # === Side arched gallery (arcade) ===
     for i in range(4):
         ax = -1.2 + i * 0.70
-        bpy.ops.mesh.primitive_cylinder_add(vertices=10, radius=0.06, depth=1.5,
-                                            location=(ax, -main_d / 2 - 0.30, BZ + 0.75))
-        col = bpy.context.active_object
-        col.name = f"ArcadeCol_{i}"
-        col.data.materials.append(m['stone_light'])
-        bpy.ops.object.shade_smooth()
+        bmesh_cylinder(f"ArcadeCol_{i}", 0.06, 1.5, 10, (ax, -main_d / 2 - 0.30, BZ + 0.75),
+                       m['stone_light'], smooth=True)
 
     # Arcade beam
     bmesh_box("ArcadeBeam", (3.0, 0.10, 0.10),
-              (-0.05, -main_d / 2 - 0.30, BZ + 1.55), m['stone'])
+              (-0.05, -main_d / 2 - 0.30, BZ + 1.55), stone)
     # Arcade roof
     bmesh_box("ArcadeRoof", (3.0, 0.50, 0.06),
-              (-0.05, -main_d / 2 - 0.30, BZ + 1.65), m['stone_dark'])
+              (-0.05, -main_d / 2 - 0.30, BZ + 1.65), stone_dark)
 
     # === Windows with geometric screens ===
-    for y in [-0.7, 0.0, 0.7]:
-        bmesh_box(f"Win_{y:.1f}", (0.06, 0.28, 0.45),
+    for i, y in enumerate([-0.7, 0.0, 0.7]):
+        bmesh_box(f"Win_{i}", (0.06, 0.28, 0.45),
                   (main_w / 2 + 0.01, y, BZ + 1.30), m['window'])
-        bmesh_box(f"WinFrame_{y:.1f}", (0.07, 0.30, 0.04),
+        bmesh_box(f"WinFrame_{i}", (0.07, 0.30, 0.04),
                   (main_w / 2 + 0.02, y, BZ + 1.55), m['win_frame'])
         # Geometric screen pattern (simple cross)
-        bmesh_box(f"WinScreenH_{y:.1f}", (0.02, 0.24, 0.02),
+        bmesh_box(f"WinScreenH_{i}", (0.02, 0.24, 0.02),
                   (main_w / 2 + 0.04, y, BZ + 1.30), m['wood'])
-        bmesh_box(f"WinScreenV_{y:.1f}", (0.02, 0.02, 0.40),
+        bmesh_box(f"WinScreenV_{i}", (0.02, 0.02, 0.40),
                   (main_w / 2 + 0.04, y, BZ + 1.30), m['wood'])
 
     # Door
     bmesh_box("Door", (0.08, 0.55, 1.40), (0, main_d / 2 + 0.31, BZ + 0.70), m['door'])
 
     # Steps
-    for i in range(4):
-        bmesh_box(f"Step_{i}", (0.16, 1.6, 0.05),
-                  (0, main_d / 2 + 0.55 + i * 0.18, BZ - 0.03 - i * 0.03), m['stone'])
+    i = np.arange(4)
+    merged_boxes("Steps", (0.16, 1.6, 0.05),
+                 np.column_stack((np.zeros(4), main_d / 2 + 0.55 + i * 0.18, BZ - 0.03 - i * 0.03)),
+                 stone)
 
     # Gold accents on iwan
     bmesh_box("IwanGold", (iwan_w + 0.10, 0.06, 0.06),
-              (0, main_d / 2 + 0.02, BZ + iwan_h - 0.03), m['gold'])
+              (0, main_d / 2 + 0.02, BZ + iwan_h - 0.03), gold)
 
 
 # ============================================================
 # GUNPOWDER AGE -- Safavid Isfahan style
 # ============================================================
+@planned("Persians_Gunpowder", by_material=True)
 def _build_gunpowder(m):
     Z = 0.0
+    stone_trim, stone_light, gold = m['stone_trim'], m['stone_light'], m['gold']
 
     bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
 
@@ -780,22 +714,17 @@ def _build_gunpowder(m):
               (0, 0, BZ + main_h / 2), m['stone'])
 
     # Decorative tile bands (blue/gold geometric patterns)
-    for bz_i in range(5):
-        lz = BZ + 0.50 + bz_i * 0.70
-        bmesh_box(f"TileBand_{bz_i}", (main_w + 0.04, main_d + 0.04, 0.05),
-                  (0, 0, lz), m['stone_trim'])
+    band_z = BZ + 0.50 + 0.70 * np.arange(5)
+    merged_boxes("TileBands", (main_w + 0.04, main_d + 0.04, 0.05),
+                 np.column_stack((np.zeros(5), np.zeros(5), band_z)), stone_trim)
 
     # Upper gallery (open columned balcony, Ali Qapu signature)
     gallery_z = BZ + main_h * 0.65
     gallery_h = main_h * 0.35
     for i in range(6):
         gx = -main_w / 2 + 0.25 + i * (main_w - 0.50) / 5
-        bpy.ops.mesh.primitive_cylinder_add(vertices=10, radius=0.05, depth=gallery_h,
-                                            location=(gx, main_d / 2 + 0.01, gallery_z + gallery_h / 2))
-        col = bpy.context.active_object
-        col.name = f"GalCol_{i}"
-        col.data.materials.append(m['stone_light'])
-        bpy.ops.object.shade_smooth()
+        bmesh_cylinder(f"GalCol_{i}", 0.05, gallery_h, 10,
+                       (gx, main_d / 2 + 0.01, gallery_z + gallery_h / 2), stone_light, smooth=True)
 
     # Gallery floor
     bmesh_box("GalFloor", (main_w + 0.30, 0.40, 0.06),
@@ -815,64 +744,63 @@ def _build_gunpowder(m):
     # === Grand iwan entrance ===
     iwan_w = 1.8
     iwan_h = 3.5
-    _iwan("GrandIwan", iwan_w, 0.70, iwan_h, (0, main_d / 2, BZ), m['stone_dark'], m['gold'])
+    _iwan("GrandIwan", iwan_w, 0.70, iwan_h, (0, main_d / 2, BZ), m['stone_dark'], gold)
 
     # Muqarnas in the iwan vault
-    _muqarnas_band("IwanMuq", 0, main_d / 2 + 0.15, BZ + iwan_h - 0.10, iwan_w - 0.30, 0.12, 4, m['stone_trim'])
+    _muqarnas_band("IwanMuq", 0, main_d / 2 + 0.15, BZ + iwan_h - 0.10, iwan_w - 0.30, 0.12, 4, stone_trim)
 
     # === Blue tile mosaic dome ===
     dome_r = 1.1
     dome_h = 1.5
     dome_base = BZ + main_h
     # Drum
-    bmesh_prism("DomeDrum", dome_r + 0.08, 0.40, 12, (0, 0, dome_base), m['stone_trim'])
+    bmesh_prism("DomeDrum", dome_r + 0.08, 0.40, 12, (0, 0, dome_base), stone_trim)
     # Dome (using roof material for blue tiles)
     _dome("BlueDome", dome_r, dome_h, 20, (0, 0, dome_base + 0.40), m['roof'])
-    # Dome geometric tile pattern lines (meridians)
-    for i in range(8):
-        a = (2 * math.pi * i) / 8
-        for seg in range(5):
-            phi = (math.pi / 2) * (seg / 5)
-            sz = dome_base + 0.40 + dome_h * math.cos(phi)
-            sr = dome_r * math.sin(phi) * 1.01
-            bpy.ops.mesh.primitive_cylinder_add(vertices=4, radius=0.015, depth=0.04,
-                                                location=(sr * math.cos(a), sr * math.sin(a), sz))
-            bpy.context.active_object.data.materials.append(m['gold'])
+    # Dome geometric tile pattern lines (meridians): 8 meridians x 5 studs, one mesh
+    cos_a, sin_a = ring_table(8)
+    phi = (np.pi / 2) * np.arange(5, dtype=np.float32)[:, None] / 5
+    sr = dome_r * np.sin(phi) * 1.01
+    studs = np.empty((5, 8, 3), dtype=np.float32)
+    studs[..., 0] = sr * cos_a
+    studs[..., 1] = sr * sin_a
+    studs[..., 2] = dome_base + 0.40 + dome_h * np.cos(phi) - 0.02  # prisms stand on their base
+    merged_prisms("DomeLines", 0.015, 0.04, 4, studs, gold)
 
     # Finial
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.06,
-                                          location=(0, 0, dome_base + 0.40 + dome_h + 0.06))
-    bpy.context.active_object.data.materials.append(m['gold'])
-    bpy.ops.object.shade_smooth()
+    uv_sphere("DomeFinial", 0.06, (0, 0, dome_base + 0.40 + dome_h + 0.06), gold, smooth=True)
 
     # === Slender minarets (2) ===
     for dy, lbl in [(-1.5, "L"), (1.5, "R")]:
-        _minaret(f"Min_{lbl}", 0.12, 4.5, (main_w / 2 - 0.10, dy, BZ), m['stone_trim'], m['roof'])
+        _minaret(f"Min_{lbl}", 0.12, 4.5, (main_w / 2 - 0.10, dy, BZ), stone_trim, m['roof'])
 
     # === Reflecting pool ===
     PX, PY = 0, 2.0
     bmesh_box("ReflPool", (2.0, 0.80, 0.08), (PX, PY, BZ + 0.04), m['window'])
-    bmesh_box("PoolBorderF", (2.10, 0.06, 0.10), (PX, PY - 0.43, BZ + 0.05), m['stone_light'])
-    bmesh_box("PoolBorderB", (2.10, 0.06, 0.10), (PX, PY + 0.43, BZ + 0.05), m['stone_light'])
-    bmesh_box("PoolBorderL", (0.06, 0.80, 0.10), (PX - 1.05, PY, BZ + 0.05), m['stone_light'])
-    bmesh_box("PoolBorderR", (0.06, 0.80, 0.10), (PX + 1.05, PY, BZ + 0.05), m['stone_light'])
+    bmesh_box("PoolBorderF", (2.10, 0.06, 0.10), (PX, PY - 0.43, BZ + 0.05), stone_light)
+    bmesh_box("PoolBorderB", (2.10, 0.06, 0.10), (PX, PY + 0.43, BZ + 0.05), stone_light)
+    bmesh_box("PoolBorderL", (0.06, 0.80, 0.10), (PX - 1.05, PY, BZ + 0.05), stone_light)
+    bmesh_box("PoolBorderR", (0.06, 0.80, 0.10), (PX + 1.05, PY, BZ + 0.05), stone_light)
 
     # Door
     bmesh_box("Door", (0.08, 0.60, 1.60), (0, main_d / 2 + 0.71, BZ + 0.80), m['door'])
 
     # Steps
-    for i in range(5):
-        bmesh_box(f"Step_{i}", (0.16, 2.0, 0.05),
-                  (0, main_d / 2 + 0.85 + i * 0.18, BZ - 0.03 - i * 0.04), m['stone'])
+    i = np.arange(5)
+    merged_boxes("Steps", (0.16, 2.0, 0.05),
+                 np.column_stack((np.zeros(5), main_d / 2 + 0.85 + i * 0.18, BZ - 0.03 - i * 0.04)),
+                 m['stone'])
 
 
 # ============================================================
 # ENLIGHTENMENT AGE -- Qajar palace
 # ============================================================
+@planned("Persians_Enlightenment", by_material=True)
 def _build_enlightenment(m):
     Z = 0.0
+    ground, window, stone, gold = m['ground'], m['window'], m['stone'], m['gold']
 
-    bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
+    bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), ground)
 
     # === Foundation ===
     bmesh_box("Plat", (5.2, 5.0, 0.12), (0, 0, Z + 0.06), m['stone_dark'], bevel=0.04)
@@ -887,17 +815,14 @@ def _build_enlightenment(m):
     # Garden beds in the four quarters
     for qx, qy in [(1.2, 1.2), (1.2, -1.2), (-1.2, 1.2), (-1.2, -1.2)]:
         bmesh_box(f"Garden_{qx:.1f}_{qy:.1f}", (1.5, 1.5, 0.03),
-                  (qx, qy, BZ + 0.015), m['ground'])
+                  (qx, qy, BZ + 0.015), ground)
         # Small tree (trunk + sphere canopy)
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.03, depth=0.5,
-                                            location=(qx, qy, BZ + 0.28))
-        bpy.context.active_object.data.materials.append(m['wood'])
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.18, location=(qx, qy, BZ + 0.60))
-        bpy.context.active_object.data.materials.append(m['ground'])
+        bmesh_cylinder(f"Trunk_{qx:.1f}_{qy:.1f}", 0.03, 0.5, 6, (qx, qy, BZ + 0.28), m['wood'])
+        uv_sphere(f"Canopy_{qx:.1f}_{qy:.1f}", 0.18, (qx, qy, BZ + 0.60), ground)
 
     # Central fountain/pool (at axis intersection)
-    bmesh_prism("CenterPool", 0.45, 0.06, 8, (0, 0, BZ + 0.03), m['window'])
-    bmesh_prism("PoolRim", 0.50, 0.10, 8, (0, 0, BZ), m['stone'])
+    bmesh_prism("CenterPool", 0.45, 0.06, 8, (0, 0, BZ + 0.03), window)
+    bmesh_prism("PoolRim", 0.50, 0.10, 8, (0, 0, BZ), stone)
 
     # === Main palace (mirrored hall, ornate) ===
     pal_w, pal_d = 3.0, 2.0
@@ -905,110 +830,108 @@ def _build_enlightenment(m):
     PX = 0
     # Palace body
     bmesh_box("Palace", (pal_w, pal_d, pal_h),
-              (PX, 0, BZ + 0.04 + pal_h / 2), m['stone'])
+              (PX, 0, BZ + 0.04 + pal_h / 2), stone)
 
     # Ornate tile work (horizontal bands)
-    for bz_i in range(4):
-        lz = BZ + 0.04 + 0.50 + bz_i * 0.65
-        bmesh_box(f"TileBand_{bz_i}", (pal_w + 0.04, pal_d + 0.04, 0.04),
-                  (PX, 0, lz), m['stone_trim'])
+    band_z = BZ + 0.04 + 0.50 + 0.65 * np.arange(4)
+    merged_boxes("TileBands", (pal_w + 0.04, pal_d + 0.04, 0.04),
+                 np.column_stack((np.full(4, PX), np.zeros(4), band_z)), m['stone_trim'])
 
     # Mirrored hall windows (tall, ornate, reflective)
     for y in [-0.6, 0.0, 0.6]:
         # Tall window
         bmesh_box(f"MirrorWin_{y:.1f}", (0.05, 0.30, 0.80),
-                  (PX + pal_w / 2 + 0.01, y, BZ + 0.04 + pal_h * 0.45), m['window'])
+                  (PX + pal_w / 2 + 0.01, y, BZ + 0.04 + pal_h * 0.45), window)
         # Ornate frame
         bmesh_box(f"MirrorFrame_{y:.1f}", (0.06, 0.34, 0.04),
-                  (PX + pal_w / 2 + 0.02, y, BZ + 0.04 + pal_h * 0.45 + 0.42), m['gold'])
+                  (PX + pal_w / 2 + 0.02, y, BZ + 0.04 + pal_h * 0.45 + 0.42), gold)
         bmesh_box(f"MirrorFrameB_{y:.1f}", (0.06, 0.34, 0.04),
-                  (PX + pal_w / 2 + 0.02, y, BZ + 0.04 + pal_h * 0.45 - 0.42), m['gold'])
+                  (PX + pal_w / 2 + 0.02, y, BZ + 0.04 + pal_h * 0.45 - 0.42), gold)
 
     # Side windows
     for x in [-0.8, 0, 0.8]:
         bmesh_box(f"SideWin_{x:.1f}", (0.25, 0.05, 0.55),
-                  (PX + x, pal_d / 2 + 0.01, BZ + 0.04 + pal_h * 0.45), m['window'])
+                  (PX + x, pal_d / 2 + 0.01, BZ + 0.04 + pal_h * 0.45), window)
 
     # Door (front, ornate)
     bmesh_box("Door", (0.08, 0.60, 1.50),
               (PX + pal_w / 2 + 0.01, 0, BZ + 0.04 + 0.75), m['door'])
     # Door frame with gold
     bmesh_box("DoorFrameT", (0.10, 0.70, 0.06),
-              (PX + pal_w / 2 + 0.02, 0, BZ + 0.04 + 1.53), m['gold'])
+              (PX + pal_w / 2 + 0.02, 0, BZ + 0.04 + 1.53), gold)
 
     # === Roof with decorative parapet ===
     roof_z = BZ + 0.04 + pal_h
     bmesh_box("PalRoof", (pal_w + 0.20, pal_d + 0.20, 0.10),
               (PX, 0, roof_z + 0.05), m['stone_dark'])
     # Parapet with decorative crenellations
-    for i in range(8):
-        cx = PX - pal_w / 2 + 0.25 + i * (pal_w - 0.50) / 7
-        bmesh_box(f"Parapet_{i}", (0.12, pal_d + 0.22, 0.15),
-                  (cx, 0, roof_z + 0.175), m['stone_trim'])
+    merged_boxes("Parapet", (0.12, pal_d + 0.22, 0.15),
+                 np.column_stack((np.linspace(PX - pal_w / 2 + 0.25, PX + pal_w / 2 - 0.25, 8),
+                                  np.zeros(8), np.full(8, roof_z + 0.175))), m['stone_trim'])
 
     # Small dome accent
     _dome("PalDome", 0.55, 0.65, 12, (PX, 0, roof_z + 0.10), m['roof'])
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.04,
-                                          location=(PX, 0, roof_z + 0.10 + 0.65 + 0.04))
-    bpy.context.active_object.data.materials.append(m['gold'])
-    bpy.ops.object.shade_smooth()
+    uv_sphere("DomeFinial", 0.04, (PX, 0, roof_z + 0.10 + 0.65 + 0.04), gold, smooth=True)
 
     # === Windcatcher towers (two, flanking) ===
     for dx, lbl in [(-1.2, "L"), (1.2, "R")]:
-        _windcatcher(f"Badgir_{lbl}", 0.45, 3.5, (PX + dx, -0.7, BZ), m['stone'], m['wood_dark'])
+        _windcatcher(f"Badgir_{lbl}", 0.45, 3.5, (PX + dx, -0.7, BZ), stone, m['wood_dark'])
 
     # === Steps ===
-    for i in range(5):
-        bmesh_box(f"Step_{i}", (0.16, 1.8, 0.05),
-                  (PX + pal_w / 2 + 0.30 + i * 0.18, 0, BZ - 0.02 - i * 0.03), m['stone'])
+    i = np.arange(5)
+    merged_boxes("Steps", (0.16, 1.8, 0.05),
+                 np.column_stack((PX + pal_w / 2 + 0.30 + i * 0.18, np.zeros(5), BZ - 0.02 - i * 0.03)),
+                 stone)
 
 
 # ============================================================
 # INDUSTRIAL AGE -- Pahlavi-era modernized
 # ============================================================
+@planned("Persians_Industrial", by_material=True)
 def _build_industrial(m):
     Z = 0.0
+    stone_dark, stone, stone_light = m['stone_dark'], m['stone'], m['stone_light']
+    stone_trim, window = m['stone_trim'], m['window']
 
     bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
 
     # === Foundation ===
-    bmesh_box("Found", (5.2, 4.8, 0.15), (0, 0, Z + 0.075), m['stone_dark'], bevel=0.04)
+    bmesh_box("Found", (5.2, 4.8, 0.15), (0, 0, Z + 0.075), stone_dark, bevel=0.04)
 
     BZ = Z + 0.15
 
     # === Wide stone steps (grand entrance, Persepolis-inspired) ===
-    for i in range(8):
-        step_w = 2.8 - i * 0.05
-        bmesh_box(f"Step_{i}", (0.18, step_w, 0.06),
-                  (2.2 + i * 0.20, 0, BZ - 0.04 - i * 0.04), m['stone'])
+    i = np.arange(8)
+    merged_boxes("Steps", np.column_stack((np.full(8, 0.18), 2.8 - i * 0.05, np.full(8, 0.06))),
+                 np.column_stack((2.2 + i * 0.20, np.zeros(8), BZ - 0.04 - i * 0.04)), stone)
 
     # === Main building (Western style with Persian motifs) ===
     main_w, main_d = 3.6, 2.8
     main_h = 3.5
     # Stone base (lower third, heavier)
     bmesh_box("Base", (main_w, main_d, main_h * 0.35),
-              (0, 0, BZ + main_h * 0.175), m['stone'], bevel=0.02)
+              (0, 0, BZ + main_h * 0.175), stone, bevel=0.02)
     # Upper section (lighter plaster)
     bmesh_box("Upper", (main_w, main_d, main_h * 0.65),
-              (0, 0, BZ + main_h * 0.35 + main_h * 0.325), m['stone_light'])
+              (0, 0, BZ + main_h * 0.35 + main_h * 0.325), stone_light)
 
     # Cornice trim between base and upper
     bmesh_box("Cornice", (main_w + 0.08, main_d + 0.08, 0.08),
-              (0, 0, BZ + main_h * 0.35), m['stone_trim'])
+              (0, 0, BZ + main_h * 0.35), stone_trim)
 
     # Persepolis-inspired relief band (decorative strip with figures)
     bmesh_box("ReliefBand", (main_w + 0.02, main_d + 0.02, 0.15),
-              (0, 0, BZ + main_h * 0.35 + 0.20), m['stone_trim'])
+              (0, 0, BZ + main_h * 0.35 + 0.20), stone_trim)
 
     # === Grand columned entrance (Persepolis-inspired columns) ===
     col_h = main_h * 0.8
     for dy in [-0.80, -0.27, 0.27, 0.80]:
         _fluted_column(f"EntCol_{dy:.2f}", 0.10, col_h,
-                       (main_w / 2 + 0.40, dy, BZ), m['stone_light'])
+                       (main_w / 2 + 0.40, dy, BZ), stone_light)
 
     # Entablature above columns
     bmesh_box("Entab", (0.50, 2.0, 0.15),
-              (main_w / 2 + 0.40, 0, BZ + col_h + 0.075), m['stone'])
+              (main_w / 2 + 0.40, 0, BZ + col_h + 0.075), stone)
 
     # Pediment (triangular, classical influence)
     ped_verts = [
@@ -1020,50 +943,46 @@ def _build_industrial(m):
         (main_w / 2 + 0.65, 0, BZ + col_h + 0.70),
     ]
     ped_faces = [(0, 1, 2), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (0, 2, 5, 3)]
-    mesh_from_pydata("Pediment", ped_verts, ped_faces, m['stone'])
+    mesh_from_pydata("Pediment", ped_verts, ped_faces, stone)
 
     # Windows (Western-style with Persian proportions)
     for y in [-0.9, -0.3, 0.3, 0.9]:
         # Lower row
         bmesh_box(f"LowWin_{y:.1f}", (0.06, 0.22, 0.50),
-                  (main_w / 2 + 0.01, y, BZ + 0.55), m['window'])
+                  (main_w / 2 + 0.01, y, BZ + 0.55), window)
         bmesh_box(f"LowWinH_{y:.1f}", (0.07, 0.26, 0.04),
-                  (main_w / 2 + 0.02, y, BZ + 0.82), m['stone_trim'])
+                  (main_w / 2 + 0.02, y, BZ + 0.82), stone_trim)
         # Upper row
         bmesh_box(f"UpWin_{y:.1f}", (0.06, 0.22, 0.60),
-                  (main_w / 2 + 0.01, y, BZ + main_h * 0.35 + 0.65), m['window'])
+                  (main_w / 2 + 0.01, y, BZ + main_h * 0.35 + 0.65), window)
         bmesh_box(f"UpWinH_{y:.1f}", (0.07, 0.26, 0.04),
-                  (main_w / 2 + 0.02, y, BZ + main_h * 0.35 + 0.98), m['stone_trim'])
+                  (main_w / 2 + 0.02, y, BZ + main_h * 0.35 + 0.98), stone_trim)
 
     # Side windows
     for x in [-1.0, -0.2, 0.6]:
         bmesh_box(f"SideWin_{x:.1f}", (0.22, 0.06, 0.50),
-                  (x, -main_d / 2 - 0.01, BZ + main_h * 0.35 + 0.65), m['window'])
+                  (x, -main_d / 2 - 0.01, BZ + main_h * 0.35 + 0.65), window)
 
     # Door
     bmesh_box("Door", (0.08, 0.70, 1.80),
               (main_w / 2 + 0.01, 0, BZ + 0.90), m['door'])
     bmesh_box("DoorFrame", (0.10, 0.80, 0.08),
-              (main_w / 2 + 0.02, 0, BZ + 1.83), m['stone_trim'])
+              (main_w / 2 + 0.02, 0, BZ + 1.83), stone_trim)
 
     # === Flat roof with parapet ===
     roof_z = BZ + main_h
     bmesh_box("Roof", (main_w + 0.15, main_d + 0.15, 0.10),
-              (0, 0, roof_z + 0.05), m['stone_dark'])
+              (0, 0, roof_z + 0.05), stone_dark)
     # Parapet
     for py_s in [-1, 1]:
         py = py_s * (main_d / 2 + 0.10)
         bmesh_box(f"Parapet_{py_s}", (main_w + 0.15, 0.08, 0.30),
-                  (0, py, roof_z + 0.25), m['stone'])
+                  (0, py, roof_z + 0.25), stone)
 
     # Persepolis-style winged disk ornament above entrance
     orn_z = BZ + main_h - 0.20
-    bpy.ops.mesh.primitive_cylinder_add(vertices=16, radius=0.15, depth=0.04,
-                                        location=(main_w / 2 + 0.02, 0, orn_z))
-    disk = bpy.context.active_object
-    disk.name = "WingedDisk"
-    disk.rotation_euler = (0, math.radians(90), 0)
-    disk.data.materials.append(m['gold'])
+    bmesh_cylinder("WingedDisk", 0.15, 0.04, 16, (main_w / 2 + 0.02, 0, orn_z), m['gold'],
+                   rotation=(0, math.radians(90), 0))
     # Wings (flat triangles)
     for dy_s in [-1, 1]:
         wv = [
@@ -1076,23 +995,23 @@ def _build_industrial(m):
     # === Side wing (lower) ===
     wing_w, wing_d, wing_h = 1.6, 1.8, 2.2
     WX = -1.2
-    bmesh_box("Wing", (wing_w, wing_d, wing_h), (WX, -0.5, BZ + wing_h / 2), m['stone_light'])
+    bmesh_box("Wing", (wing_w, wing_d, wing_h), (WX, -0.5, BZ + wing_h / 2), stone_light)
     bmesh_box("WingRoof", (wing_w + 0.10, wing_d + 0.10, 0.08),
-              (WX, -0.5, BZ + wing_h + 0.04), m['stone_dark'])
+              (WX, -0.5, BZ + wing_h + 0.04), stone_dark)
 
     # Iron fence
-    for i in range(10):
-        fy = -1.4 + i * 0.28
-        bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.015, depth=0.50,
-                                            location=(main_w / 2 + 1.0, fy, BZ + 0.25))
-        bpy.context.active_object.data.materials.append(m['iron'])
+    # Cylinders, not merged_prisms: the hexagons start at +y like primitive_cylinder_add
+    for i, fy in enumerate((-1.4 + 0.28 * np.arange(10)).tolist()):
+        bmesh_cylinder(f"FenceBar_{i}", 0.015, 0.50, 6, (main_w / 2 + 1.0, fy, BZ + 0.25), m['iron'])
 
 
 # ============================================================
 # MODERN AGE -- Iranian modernist
 # ============================================================
+@planned("Persians_Modern", by_material=True)
 def _build_modern(m):
     Z = 0.0
+    stone_dark, stone = m['stone_dark'], m['stone']
 
     bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
 
@@ -1100,20 +1019,19 @@ def _build_modern(m):
     metal = m.get('metal', m['iron'])
 
     # === Foundation ===
-    bmesh_box("Found", (5.2, 4.8, 0.08), (0, 0, Z + 0.04), m['stone_dark'])
+    bmesh_box("Found", (5.2, 4.8, 0.08), (0, 0, Z + 0.04), stone_dark)
 
     BZ = Z + 0.08
 
     # === Main building (geometric concrete with muqarnas patterns) ===
     main_w, main_d = 3.0, 2.6
     main_h = 4.0
-    bmesh_box("Main", (main_w, main_d, main_h), (0, 0, BZ + main_h / 2), m['stone'])
+    bmesh_box("Main", (main_w, main_d, main_h), (0, 0, BZ + main_h / 2), stone)
 
     # Concrete horizontal bands (modernist rhythm)
-    for bz_i in range(5):
-        lz = BZ + 0.60 + bz_i * 0.70
-        bmesh_box(f"Band_{bz_i}", (main_w + 0.06, main_d + 0.06, 0.05),
-                  (0, 0, lz), m['stone_trim'])
+    band_z = BZ + 0.60 + 0.70 * np.arange(5)
+    merged_boxes("Bands", (main_w + 0.06, main_d + 0.06, 0.05),
+                 np.column_stack((np.zeros(5), np.zeros(5), band_z)), m['stone_trim'])
 
     # === Large arch entrance (modern Persian arch) ===
     arch_w = 1.4
@@ -1128,14 +1046,12 @@ def _build_modern(m):
         (-arch_w / 2, arch_y + 0.01, BZ + arch_h * 0.7),
     ]
     arch_faces = [(0, 1, 2, 4), (2, 3, 4)]
-    obj = mesh_from_pydata("ModernArch", arch_verts, arch_faces, m['stone_dark'])
-    for p in obj.data.polygons:
-        p.use_smooth = True
+    mesh_from_pydata("ModernArch", arch_verts, arch_faces, stone_dark, smooth=True)
 
     # Arch inset (recessed, different material)
     for dx in [-arch_w / 2 - 0.06, arch_w / 2 + 0.06]:
         bmesh_box(f"ArchPillar_{dx:.2f}", (0.12, 0.20, arch_h),
-                  (dx, arch_y + 0.10, BZ + arch_h / 2), m['stone_dark'])
+                  (dx, arch_y + 0.10, BZ + arch_h / 2), stone_dark)
 
     # Glass infill in arch
     bmesh_box("ArchGlass", (arch_w - 0.20, 0.04, arch_h * 0.6),
@@ -1143,15 +1059,14 @@ def _build_modern(m):
 
     # === Muqarnas-patterned facade panels (geometric concrete screen) ===
     # Simplified as a grid of small recessed boxes on the front facade
-    for row in range(4):
-        for col in range(6):
-            px = -main_w / 2 + 0.35 + col * (main_w - 0.70) / 5
-            pz = BZ + 0.80 + row * 0.70
-            # Skip where the arch is
-            if abs(px) < arch_w / 2 + 0.10 and pz < BZ + arch_h + 0.20:
-                continue
-            bmesh_box(f"MuqPanel_{row}_{col}", (0.18, 0.04, 0.18),
-                      (px, main_d / 2 + 0.02, pz), m['stone_dark'])
+    row, col = np.mgrid[:4, :6]
+    px = -main_w / 2 + 0.35 + col * (main_w - 0.70) / 5
+    pz = BZ + 0.80 + row * 0.70
+    # Skip where the arch is
+    keep = ~((np.abs(px) < arch_w / 2 + 0.10) & (pz < BZ + arch_h + 0.20))
+    merged_boxes("MuqPanels", (0.18, 0.04, 0.18),
+                 np.column_stack((px[keep], np.full(keep.sum(), main_d / 2 + 0.02), pz[keep])),
+                 stone_dark)
 
     # === Glass curtain wall on side ===
     bmesh_box("SideGlass", (0.05, main_d - 0.5, main_h - 0.4),
@@ -1165,31 +1080,29 @@ def _build_modern(m):
     WT_X, WT_Y = -1.0, -0.8
     wt_h = 4.5
     bmesh_box("WindTower", (0.60, 0.60, wt_h),
-              (WT_X, WT_Y, BZ + wt_h / 2), m['stone'])
+              (WT_X, WT_Y, BZ + wt_h / 2), stone)
     # Modern wind scoops (angled panels at top)
-    for rot_i in range(4):
-        a = math.radians(45 + rot_i * 90)
-        sx = WT_X + 0.35 * math.cos(a)
-        sy = WT_Y + 0.35 * math.sin(a)
-        bmesh_box(f"WindScoop_{rot_i}", (0.30, 0.04, 0.60),
-                  (sx, sy, BZ + wt_h - 0.30), m['stone_dark'])
+    a = np.radians(45 + 90 * np.arange(4))
+    merged_boxes("WindScoops", (0.30, 0.04, 0.60),
+                 np.column_stack((WT_X + 0.35 * np.cos(a), WT_Y + 0.35 * np.sin(a),
+                                  np.full(4, BZ + wt_h - 0.30))), stone_dark)
     # Wind tower cap
     bmesh_box("WTCap", (0.70, 0.70, 0.06), (WT_X, WT_Y, BZ + wt_h + 0.03), metal)
 
     # === Flat roof with overhang ===
     roof_z = BZ + main_h
     bmesh_box("RoofSlab", (main_w + 0.40, main_d + 0.40, 0.12),
-              (0, 0, roof_z + 0.06), m['stone_dark'])
+              (0, 0, roof_z + 0.06), stone_dark)
 
     # === Lower wing ===
     wing_w, wing_d, wing_h = 2.2, 1.4, 2.5
     WX = 1.0
     bmesh_box("Wing", (wing_w, wing_d, wing_h),
-              (WX, -0.6, BZ + wing_h / 2), m['stone'])
+              (WX, -0.6, BZ + wing_h / 2), stone)
     bmesh_box("WingGlass", (0.05, wing_d - 0.3, wing_h - 0.4),
               (WX + wing_w / 2 + 0.01, -0.6, BZ + wing_h / 2 + 0.1), glass)
     bmesh_box("WingRoof", (wing_w + 0.20, wing_d + 0.20, 0.08),
-              (WX, -0.6, BZ + wing_h + 0.04), m['stone_dark'])
+              (WX, -0.6, BZ + wing_h + 0.04), stone_dark)
 
     # Connection
     bmesh_box("Connect", (0.6, 0.8, 2.0), (main_w / 2 + 0.10, -0.6, BZ + 1.0), glass)
@@ -1200,23 +1113,25 @@ def _build_modern(m):
     bmesh_box("DoorFrame", (0.10, 0.90, 0.06), (0, main_d / 2 + 0.02, BZ + 2.03), metal)
 
     # Steps
-    for i in range(4):
-        bmesh_box(f"Step_{i}", (0.16, 2.0, 0.05),
-                  (0, main_d / 2 + 0.40 + i * 0.18, BZ - 0.02 - i * 0.02), m['stone'])
+    i = np.arange(4)
+    merged_boxes("Steps", (0.16, 2.0, 0.05),
+                 np.column_stack((np.zeros(4), main_d / 2 + 0.40 + i * 0.18, BZ - 0.02 - i * 0.02)),
+                 stone)
 
     # Concrete planter
-    bmesh_box("Planter", (1.0, 0.40, 0.25), (2.0, 1.5, BZ + 0.125), m['stone'])
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.20, location=(2.0, 1.5, BZ + 0.45))
-    bpy.context.active_object.data.materials.append(m['ground'])
+    bmesh_box("Planter", (1.0, 0.40, 0.25), (2.0, 1.5, BZ + 0.125), stone)
+    uv_sphere("PlanterBush", 0.20, (2.0, 1.5, BZ + 0.45), m['ground'])
 
 
 # ============================================================
 # DIGITAL AGE -- Futuristic Persian
 # ============================================================
+@planned("Persians_Digital", by_material=True)
 def _build_digital(m):
     Z = 0.0
+    ground, gold = m['ground'], m['gold']
 
-    bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), m['ground'])
+    bmesh_box("Ground", (5.5, 5.5, 0.06), (0, 0, Z + 0.03), ground)
 
     glass = m.get('glass', m['window'])
     metal = m.get('metal', m['iron'])
@@ -1239,9 +1154,7 @@ def _build_digital(m):
         (-iwan_w / 2, iwan_y, BZ + iwan_h * 0.75),
     ]
     ivf = [(0, 1, 2, 4), (2, 3, 4)]
-    obj = mesh_from_pydata("GlassIwan", iv, ivf, glass)
-    for p in obj.data.polygons:
-        p.use_smooth = True
+    mesh_from_pydata("GlassIwan", iv, ivf, glass, smooth=True)
 
     # Iwan frame (metal edges)
     for dx in [-iwan_w / 2 - 0.04, iwan_w / 2 + 0.04]:
@@ -1258,10 +1171,8 @@ def _build_digital(m):
               (0, 0, BZ + tower_h / 2), glass)
 
     # Steel frame grid
-    for tz in range(6):
-        hz = BZ + 0.7 + tz * 0.80
-        bmesh_box(f"TFrame_{tz}", (tower_w + 0.02, tower_d + 0.02, 0.04),
-                  (0, 0, hz), metal)
+    merged_boxes("TFrames", (tower_w + 0.02, tower_d + 0.02, 0.04),
+                 np.column_stack((np.zeros(6), np.zeros(6), BZ + 0.7 + 0.80 * np.arange(6))), metal)
     for y in [-0.6, 0, 0.6]:
         bmesh_box(f"TVert_{y:.1f}", (0.03, 0.03, tower_h),
                   (tower_w / 2 + 0.01, y, BZ + tower_h / 2), metal)
@@ -1269,11 +1180,11 @@ def _build_digital(m):
                   (-tower_w / 2 - 0.01, y, BZ + tower_h / 2), metal)
 
     # === Holographic geometric patterns (gold wireframe panels) ===
-    # Floating geometric panels around the tower
-    for i in range(6):
-        a = (2 * math.pi * i) / 6
-        px = 1.8 * math.cos(a)
-        py = 1.8 * math.sin(a)
+    # Floating geometric panels around the tower, visible from both sides
+    gold.use_backface_culling = False
+    for i, (c, s) in enumerate(zip(*ring_table(6))):
+        px = 1.8 * c
+        py = 1.8 * s
         pz = BZ + 1.5 + i * 0.4
         # Small diamond-shaped panel
         dv = [
@@ -1282,8 +1193,7 @@ def _build_digital(m):
             (px, py + 0.10, pz + 0.40),
             (px - 0.20, py + 0.05, pz + 0.20),
         ]
-        panel = mesh_from_pydata(f"HoloPanel_{i}", dv, [(0, 1, 2, 3)], m['gold'])
-        panel.data.materials[0].use_backface_culling = False
+        mesh_from_pydata(f"HoloPanel_{i}", dv, [(0, 1, 2, 3)], gold)
 
     # === Energy dome with muqarnas fractal structure ===
     dome_base = BZ + tower_h
@@ -1293,26 +1203,19 @@ def _build_digital(m):
     _dome("EnergyDome", dome_r, dome_h, 20, (0, 0, dome_base), glass)
 
     # Muqarnas fractal structure inside dome (cascading tiers of small prisms)
+    cells = []
     for tier in range(4):
         n_cells = 6 + tier * 3
         t_r = dome_r * (0.3 + tier * 0.15)
-        t_z = dome_base + dome_h * 0.3 - tier * 0.12
-        for ci in range(n_cells):
-            ca = (2 * math.pi * ci) / n_cells
-            cx = t_r * math.cos(ca)
-            cy = t_r * math.sin(ca)
-            bmesh_prism(f"FracMuq_{tier}_{ci}", 0.06, 0.08, 6,
-                        (cx, cy, t_z), m['gold'])
+        cos_t, sin_t = ring_table(n_cells)
+        cells.append(np.column_stack([t_r * cos_t, t_r * sin_t,
+                                      np.full(n_cells, dome_base + dome_h * 0.3 - tier * 0.12)]))
+    merged_prisms("FracMuq", 0.06, 0.08, 6, np.concatenate(cells), gold)
 
     # Dome finial (energy spire)
-    bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.04, depth=1.0,
-                                        location=(0, 0, dome_base + dome_h + 0.50))
-    bpy.context.active_object.data.materials.append(m['gold'])
+    bmesh_cylinder("Spire", 0.04, 1.0, 8, (0, 0, dome_base + dome_h + 0.50), gold)
     # Spire tip sphere
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.08,
-                                          location=(0, 0, dome_base + dome_h + 1.05))
-    bpy.context.active_object.data.materials.append(m['gold'])
-    bpy.ops.object.shade_smooth()
+    uv_sphere("SpireTip", 0.08, (0, 0, dome_base + dome_h + 1.05), gold, smooth=True)
 
     # === Floating garden platforms ===
     garden_positions = [(-1.5, 1.2, BZ + 1.0), (1.5, -1.2, BZ + 1.5),
@@ -1321,37 +1224,30 @@ def _build_digital(m):
         # Platform
         bmesh_box(f"GardenPlat_{gi}", (0.80, 0.80, 0.06), (gx, gy, gz), metal)
         # Garden surface (green)
-        bmesh_box(f"GardenGreen_{gi}", (0.70, 0.70, 0.03), (gx, gy, gz + 0.045), m['ground'])
+        bmesh_box(f"GardenGreen_{gi}", (0.70, 0.70, 0.03), (gx, gy, gz + 0.045), ground)
         # Thin support pillar
         pillar_h = gz - BZ
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.025, depth=pillar_h,
-                                            location=(gx, gy, BZ + pillar_h / 2))
-        bpy.context.active_object.name = f"GardenPillar_{gi}"
-        bpy.context.active_object.data.materials.append(metal)
+        bmesh_cylinder(f"GardenPillar_{gi}", 0.025, pillar_h, 8, (gx, gy, BZ + pillar_h / 2), metal)
         # Small tree on platform
         if gi < 3:
-            bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.02, depth=0.35,
-                                                location=(gx, gy, gz + 0.22))
-            bpy.context.active_object.data.materials.append(m['wood'])
-            bpy.ops.mesh.primitive_uv_sphere_add(radius=0.12, location=(gx, gy, gz + 0.48))
-            bpy.context.active_object.data.materials.append(m['ground'])
+            bmesh_cylinder(f"GardenTrunk_{gi}", 0.02, 0.35, 6, (gx, gy, gz + 0.22), m['wood'])
+            uv_sphere(f"GardenCanopy_{gi}", 0.12, (gx, gy, gz + 0.48), ground)
 
     # === LED accent strips ===
-    bmesh_box("LED_Base", (5.0, 0.04, 0.04), (0, -2.3, BZ + 0.02), m['gold'])
+    bmesh_box("LED_Base", (5.0, 0.04, 0.04), (0, -2.3, BZ + 0.02), gold)
     bmesh_box("LED_Tower1", (tower_w + 0.04, 0.04, 0.04),
-              (0, -tower_d / 2 - 0.01, BZ + tower_h - 0.10), m['gold'])
+              (0, -tower_d / 2 - 0.01, BZ + tower_h - 0.10), gold)
     bmesh_box("LED_Tower2", (0.04, tower_d + 0.04, 0.04),
-              (tower_w / 2 + 0.01, 0, BZ + tower_h - 0.10), m['gold'])
+              (tower_w / 2 + 0.01, 0, BZ + tower_h - 0.10), gold)
 
     # === Lower connected wing (glass) ===
     wing_w, wing_d, wing_h = 2.0, 1.2, 2.8
     WX = 0.8
     WY = -0.8
     bmesh_box("Wing", (wing_w, wing_d, wing_h), (WX, WY, BZ + wing_h / 2), glass)
-    for wz in range(3):
-        hz = BZ + 0.8 + wz * 0.9
-        bmesh_box(f"WingFrame_{wz}", (wing_w + 0.02, wing_d + 0.02, 0.03),
-                  (WX, WY, hz), metal)
+    merged_boxes("WingFrames", (wing_w + 0.02, wing_d + 0.02, 0.03),
+                 np.column_stack((np.full(3, WX), np.full(3, WY), BZ + 0.8 + 0.9 * np.arange(3))),
+                 metal)
     bmesh_box("WingRoof", (wing_w + 0.15, wing_d + 0.15, 0.06),
               (WX, WY, BZ + wing_h + 0.03), metal)
 
@@ -1361,16 +1257,17 @@ def _build_digital(m):
     bmesh_box("BridgeRail_R", (0.03, 1.5, 0.25), (0.30, tower_d / 2 + 0.75, BZ + 0.55), metal)
 
     # Steps
-    for i in range(3):
-        bmesh_box(f"Step_{i}", (0.60, 0.16, 0.04),
-                  (0, iwan_y + 0.20 + i * 0.18, BZ - 0.02 - i * 0.02), metal)
+    i = np.arange(3)
+    merged_boxes("Steps", (0.60, 0.16, 0.04),
+                 np.column_stack((np.zeros(3), iwan_y + 0.20 + i * 0.18, BZ - 0.02 - i * 0.02)),
+                 metal)
 
     # Solar/tech panels on wing roof
-    for i in range(3):
-        bmesh_box(f"Solar_{i}", (0.55, 0.35, 0.03),
-                  (WX - 0.5 + i * 0.6, WY, BZ + wing_h + 0.09), glass)
-        bmesh_box(f"SolarF_{i}", (0.57, 0.37, 0.02),
-                  (WX - 0.5 + i * 0.6, WY, BZ + wing_h + 0.065), metal)
+    solar_x = WX - 0.5 + 0.6 * np.arange(3)
+    merged_boxes("Solar", (0.55, 0.35, 0.03),
+                 np.column_stack((solar_x, np.full(3, WY), np.full(3, BZ + wing_h + 0.09))), glass)
+    merged_boxes("SolarF", (0.57, 0.37, 0.02),
+                 np.column_stack((solar_x, np.full(3, WY), np.full(3, BZ + wing_h + 0.065))), metal)
 
 
 # ============================================================
@@ -1390,7 +1287,17 @@ AGE_BUILDERS = {
 }
 
 
+# Objects and shared meshes of the last Persian Town Center build
+_SCOPE = new_scope()
+
+
 def build_town_center_persians(materials, age='medieval'):
     """Build a Persian Town Center with geometry appropriate for the given age."""
+    # Hand back the previous build's meshes/objects so a rebuild reuses them
+    release_all(_SCOPE)
     builder = AGE_BUILDERS.get(age, _build_medieval)
-    builder(materials)
+    set_scope(_SCOPE)
+    try:
+        builder(materials)
+    finally:
+        set_scope(None)
@@ -1,133 +1,630 @@
 """
-Geometry builders — bmesh box, prism, cone, pyramid roof, mesh_from_pydata.
+Geometry builders — bmesh box, prism, cone, cylinder, sphere, pyramid roof, mesh_from_pydata.
 Reusable across all building scripts.
+
+While a build plan is recording (see lib.plan) the builders hand their
+arguments to the recorder and return None instead of creating objects.
 """
 
 import bpy
 import bmesh
 import math
+from functools import lru_cache
+import numpy as np
+
+
+# Unit-circle tables for the segment counts the builders use most.
+# Looked up by ring_table(); other counts are computed once and cached.
+_TRIG = {
+    n: (np.cos(2 * np.pi * np.arange(n) / n).astype(np.float32),
+        np.sin(2 * np.pi * np.arange(n) / n).astype(np.float32))
+    for n in (6, 8, 10, 12, 14, 16, 20)
+}
+
+
+# Active build-plan recorder, set by lib.plan; None means build immediately.
+_recorder = None
+
+
+def set_recorder(recorder):
+    """Route builder calls to recorder(kind, name, material, **params); None restores direct building."""
+    global _recorder
+    _recorder = recorder
+
+
+# Datablocks handed back by release(), reused before allocating new ones
+_POOL = {"mesh": [], "object": []}
+# Shared meshes of repeated cylinders/spheres, keyed by shape and material
+_PROTOTYPES = {}
+# Build scope being filled (see new_scope / set_scope); None leaves objects untracked
+_scope = None
+# Single bmesh reused by the helpers that still go through bmesh (see scratch_bmesh)
+_SCRATCH = None
+
+
+def scratch_bmesh():
+    """The module's working bmesh, emptied — callers must be done with it before the next call."""
+    global _SCRATCH
+    if _SCRATCH is None or not _SCRATCH.is_valid:
+        _SCRATCH = bmesh.new()
+    else:
+        _SCRATCH.clear()
+    return _SCRATCH
+
+
+def new_scope():
+    """Empty build scope: the objects and shared meshes of one build, for release_all()."""
+    return {"objects": [], "prototypes": {}}
+
+
+def set_scope(scope):
+    """Track objects acquired from now on in `scope`; None stops tracking."""
+    global _scope
+    _scope = scope
+
+
+def acquire_mesh(name):
+    """Empty mesh datablock — a pooled one if available, otherwise a new one."""
+    pool = _POOL["mesh"]
+    while pool:
+        mesh = pool.pop()
+        try:
+            mesh.name = name
+        except ReferenceError:
+            continue  # freed by clear_scene since it was released
+        return mesh
+    return bpy.data.meshes.new(name)
 
 
-def mesh_from_pydata(name, vertices, faces, material=None):
+def acquire_object(name, mesh):
+    """Object using `mesh`, linked to the active collection — pooled if available."""
+    pool = _POOL["object"]
+    obj = None
+    while pool and obj is None:
+        obj = pool.pop()
+        try:
+            obj.data = mesh
+            obj.name = name
+        except ReferenceError:
+            obj = None
+    if obj is None:
+        obj = bpy.data.objects.new(name, mesh)
+    else:
+        obj.location = (0, 0, 0)
+        obj.rotation_euler = (0, 0, 0)
+        obj.scale = (1, 1, 1)
+        obj.modifiers.clear()
+    bpy.context.collection.objects.link(obj)
+    if _scope is not None:
+        _scope["objects"].append(obj)
+    return obj
+
+
+def release(obj):
+    """Unlink `obj`, empty its mesh and return both to the pool."""
+    mesh = obj.data
+    for coll in list(obj.users_collection):
+        coll.objects.unlink(obj)
+    _POOL["object"].append(obj)
+    if mesh is not None and all(m != mesh for m in _POOL["mesh"]):
+        mesh.clear_geometry()
+        mesh.materials.clear()
+        _POOL["mesh"].append(mesh)
+
+
+def release_all(scope):
+    """Release every object tracked in `scope`, ready for a rebuild of the same thing."""
+    scope["prototypes"].clear()  # their meshes are emptied into the pool below
+    objects = scope["objects"]
+    while objects:
+        obj = objects.pop()
+        try:
+            release(obj)
+        except ReferenceError:
+            pass  # already removed by clear_scene
+
+
+def ring_table(segments):
+    """(cos, sin) arrays for `segments` evenly spaced angles starting at 0."""
+    table = _TRIG.get(segments)
+    if table is None:
+        a = 2 * np.pi * np.arange(segments) / segments
+        table = _TRIG[segments] = (np.cos(a).astype(np.float32), np.sin(a).astype(np.float32))
+    return table
+
+
+def set_smooth(mesh):
+    """Smooth-shade every face of `mesh` in one foreach_set call."""
+    mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=bool))
+
+
+def mesh_from_pydata(name, vertices, faces, material=None, smooth=False):
     """Create a mesh object from raw vertex/face data."""
-    mesh = bpy.data.meshes.new(name)
+    if _recorder is not None:
+        return _recorder('pydata', name, material, vertices=vertices, faces=faces, smooth=smooth)
+    mesh = acquire_mesh(name)
     mesh.from_pydata(vertices, [], faces)
     mesh.update()
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
+    obj = acquire_object(name, mesh)
     if material:
         obj.data.materials.append(material)
+    if smooth:
+        set_smooth(obj.data)
     return obj
 
 
-def bmesh_box(name, size, origin=(0, 0, 0), material=None, bevel=0.0):
-    """Axis-aligned box via bmesh with optional bevel."""
-    bm = bmesh.new()
-    sx, sy, sz = size[0] / 2, size[1] / 2, size[2] / 2
-    ox, oy, oz = origin
-    v = [
-        bm.verts.new((ox - sx, oy - sy, oz - sz)), bm.verts.new((ox + sx, oy - sy, oz - sz)),
-        bm.verts.new((ox + sx, oy + sy, oz - sz)), bm.verts.new((ox - sx, oy + sy, oz - sz)),
-        bm.verts.new((ox - sx, oy - sy, oz + sz)), bm.verts.new((ox + sx, oy - sy, oz + sz)),
-        bm.verts.new((ox + sx, oy + sy, oz + sz)), bm.verts.new((ox - sx, oy + sy, oz + sz)),
-    ]
-    bm.faces.new([v[0], v[3], v[2], v[1]])
-    bm.faces.new([v[4], v[5], v[6], v[7]])
-    bm.faces.new([v[0], v[1], v[5], v[4]])
-    bm.faces.new([v[2], v[3], v[7], v[6]])
-    bm.faces.new([v[0], v[4], v[7], v[3]])
-    bm.faces.new([v[1], v[2], v[6], v[5]])
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    mesh.update()
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
+@lru_cache(maxsize=None)
+def _frustum_topology(segments, rings):
+    """Side quads between consecutive rings plus bottom and top n-gon caps, all facing outward."""
+    ring = np.arange(segments, dtype=np.int32)
+    nxt = np.roll(ring, -1)
+    base = (np.arange(rings - 1, dtype=np.int32) * segments)[:, None]
+    sides = np.stack([base + ring, base + nxt, base + segments + nxt, base + segments + ring],
+                     axis=-1).ravel()
+    loop_verts = np.concatenate([sides, ring[::-1], ring + (rings - 1) * segments])
+    loop_totals = np.full((rings - 1) * segments + 2, 4, dtype=np.int32)
+    loop_totals[-2:] = segments
+    return loop_verts, loop_totals
+
+
+def frustum_arrays(cx, cy, cz, base_r, top_r, height, segments, rings=2):
+    """Capped truncated cone (or cylinder when base_r == top_r) standing on (cx, cy, cz).
+
+    Returns (vertices, loop_verts, loop_totals) for mesh_from_arrays; the
+    vertex math is one broadcast over the cached ring table.
+    """
+    cos_t, sin_t = ring_table(segments)
+    t = np.linspace(0.0, 1.0, rings, dtype=np.float32)[:, None]
+    r = base_r + (top_r - base_r) * t
+    verts = np.empty((rings, segments, 3), dtype=np.float32)
+    verts[..., 0] = cx + r * cos_t
+    verts[..., 1] = cy + r * sin_t
+    verts[..., 2] = cz + height * t
+    return (verts.reshape(-1, 3),) + _frustum_topology(segments, rings)
+
+
+def face_loops(faces):
+    """Flatten a face list into (loop_verts, loop_totals) int32 arrays for mesh_from_arrays."""
+    loop_totals = np.fromiter((len(f) for f in faces), dtype=np.int32, count=len(faces))
+    loop_verts = np.fromiter((i for f in faces for i in f), dtype=np.int32,
+                             count=int(loop_totals.sum()))
+    return loop_verts, loop_totals
+
+
+def join_arrays(*parts):
+    """Several (vertices, loop_verts, loop_totals) triples as the arrays of one mesh."""
+    offsets = np.cumsum([0] + [len(v) for v, _, _ in parts[:-1]])
+    return (np.concatenate([np.asarray(v, dtype=np.float32).reshape(-1, 3) for v, _, _ in parts]),
+            np.concatenate([lv + off for (_, lv, _), off in zip(parts, offsets)]).astype(np.int32),
+            np.concatenate([lt for _, _, lt in parts]).astype(np.int32))
+
+
+# Corners of a unit box and the corner order of its six faces. Every box shares
+# this template -- per-box work is just scaling the corners.
+BOX_CORNERS = np.array([[-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],
+                        [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]], dtype=np.float32)
+BOX_LOOPS = np.array([0, 3, 2, 1, 4, 5, 6, 7, 0, 1, 5, 4,
+                      2, 3, 7, 6, 0, 4, 7, 3, 1, 2, 6, 5], dtype=np.int32)
+_BOX_TOTALS = np.full(6, 4, dtype=np.int32)
+
+
+def box_arrays(size, origin):
+    """Axis-aligned box as (vertices, loop_verts, loop_totals) from the shared face template."""
+    half = np.asarray(size, dtype=np.float32) / 2
+    return np.asarray(origin, dtype=np.float32) + half * BOX_CORNERS, BOX_LOOPS, _BOX_TOTALS
+
+
+def boxes_arrays(sizes, origins):
+    """Several axis-aligned boxes back to back; sizes is one size or one per origin."""
+    half = np.asarray(sizes, dtype=np.float32).reshape(-1, 3) / 2
+    origins = np.asarray(origins, dtype=np.float32).reshape(-1, 3)
+    verts = origins[:, None, :] + half[:, None, :] * BOX_CORNERS
+    loops = BOX_LOOPS + 8 * np.arange(len(origins), dtype=np.int32)[:, None]
+    return verts.reshape(-1, 3), loops.ravel(), np.tile(_BOX_TOTALS, len(origins))
+
+
+@lru_cache(maxsize=None)
+def _cone_topology(segments):
+    """Base n-gon followed by one triangle per segment up to the apex."""
+    ring = np.arange(segments, dtype=np.int32)
+    sides = np.stack([ring, np.roll(ring, -1), np.full(segments, segments, dtype=np.int32)],
+                     axis=-1).ravel()
+    loop_totals = np.full(segments + 1, 3, dtype=np.int32)
+    loop_totals[0] = segments
+    return np.concatenate([ring, sides]), loop_totals
+
+
+def cone_arrays(cx, cy, cz, radius, height, segments):
+    """Cone standing on (cx, cy, cz) as (vertices, loop_verts, loop_totals) — same faces as bmesh_cone."""
+    cos_t, sin_t = ring_table(segments)
+    verts = np.empty((segments + 1, 3), dtype=np.float32)
+    verts[:-1, 0] = cx + radius * cos_t
+    verts[:-1, 1] = cy + radius * sin_t
+    verts[:-1, 2] = cz
+    verts[-1] = (cx, cy, cz + height)
+    return (verts,) + _cone_topology(segments)
+
+
+@lru_cache(maxsize=None)
+def _uv_sphere_topology(segments, rings):
+    """Triangle fans at both poles, quads between the latitude rings."""
+    ring = np.arange(segments, dtype=np.int32)
+    nxt = np.roll(ring, -1)
+    bottom = 1 + (rings - 1) * segments
+    top_fan = np.stack([np.zeros(segments, dtype=np.int32), 1 + ring, 1 + nxt], axis=-1).ravel()
+    upper = (1 + np.arange(rings - 2, dtype=np.int32) * segments)[:, None]
+    quads = np.stack([upper + ring, upper + segments + ring, upper + segments + nxt, upper + nxt],
+                     axis=-1).ravel()
+    last = bottom - segments
+    bottom_fan = np.stack([np.full(segments, bottom, dtype=np.int32), last + nxt, last + ring],
+                          axis=-1).ravel()
+    loop_totals = np.full(segments * rings, 4, dtype=np.int32)
+    loop_totals[:segments] = 3
+    loop_totals[-segments:] = 3
+    return np.concatenate([top_fan, quads, bottom_fan]), loop_totals
+
+
+def uv_sphere_arrays(radius, segments=32, rings=16):
+    """UV sphere centred on the origin as (vertices, loop_verts, loop_totals)."""
+    cos_t, sin_t = ring_table(segments)
+    phi = np.pi * np.arange(1, rings, dtype=np.float32)[:, None] / rings
+    ring_r = radius * np.sin(phi)
+    verts = np.empty((2 + (rings - 1) * segments, 3), dtype=np.float32)
+    body = verts[1:-1].reshape(rings - 1, segments, 3)
+    body[..., 0] = ring_r * cos_t
+    body[..., 1] = ring_r * sin_t
+    body[..., 2] = radius * np.cos(phi)
+    verts[0] = (0, 0, radius)
+    verts[-1] = (0, 0, -radius)
+    return (verts,) + _uv_sphere_topology(segments, rings)
+
+
+def rect_xy(cx, cy, hx, hy):
+    """Counter-clockwise (4, 2) outline of a rectangle with half extents hx, hy."""
+    return np.array([(cx - hx, cy - hy), (cx + hx, cy - hy),
+                     (cx + hx, cy + hy), (cx - hx, cy + hy)], dtype=np.float32)
+
+
+@lru_cache(maxsize=None)
+def _ring_topology(n):
+    """Outer, inner, top and bottom quads of a closed wall ring with n corners."""
+    i = np.arange(n, dtype=np.int32)
+    j = np.roll(i, -1)
+    ob, ot, ib, it = i, i + n, i + 2 * n, i + 3 * n
+    jb, jt, kb, kt = j, j + n, j + 2 * n, j + 3 * n
+    loop_verts = np.concatenate([
+        np.stack([ob, jb, jt, ot], axis=-1).ravel(),   # outer face
+        np.stack([kb, ib, it, kt], axis=-1).ravel(),   # inner face
+        np.stack([ot, jt, kt, it], axis=-1).ravel(),   # top
+        np.stack([jb, ob, ib, kb], axis=-1).ravel(),   # bottom
+    ])
+    return loop_verts, np.full(4 * n, 4, dtype=np.int32)
+
+
+def ring_arrays(outer, inner, z0, z1):
+    """Closed wall between two counter-clockwise outlines as (vertices, loop_verts, loop_totals).
+
+    outer, inner — (N, 2) outlines with matching corners; the wall runs z0..z1.
+    """
+    outer = np.asarray(outer, dtype=np.float32)
+    inner = np.asarray(inner, dtype=np.float32)
+    n = len(outer)
+    verts = np.empty((4, n, 3), dtype=np.float32)
+    verts[0:2, :, :2] = outer
+    verts[2:4, :, :2] = inner
+    verts[0::2, :, 2] = z0
+    verts[1::2, :, 2] = z1
+    return (verts.reshape(-1, 3),) + _ring_topology(n)
+
+
+def bmesh_arrays(bm):
+    """Read a bmesh back as (vertices, loop_verts, loop_totals)."""
+    bm.verts.index_update()
+    verts = np.array([v.co[:] for v in bm.verts], dtype=np.float32).reshape(-1, 3)
+    loop_verts = np.array([v.index for f in bm.faces for v in f.verts], dtype=np.int32)
+    loop_totals = np.array([len(f.verts) for f in bm.faces], dtype=np.int32)
+    return verts, loop_verts, loop_totals
+
+
+def bevel_arrays(vertices, loop_verts, loop_totals, width, segments, angle=math.radians(30)):
+    """Bevel edges sharper than `angle`, as the Bevel modifier's ANGLE limit does, inside a bmesh."""
+    bm = scratch_bmesh()
+    bverts = [bm.verts.new(co) for co in np.asarray(vertices).tolist()]
+    start = 0
+    for n in np.asarray(loop_totals).tolist():
+        bm.faces.new([bverts[i] for i in loop_verts[start:start + n]])
+        start += n
+    edges = [e for e in bm.edges if e.is_manifold and e.calc_face_angle(0.0) > angle]
+    bmesh.ops.bevel(bm, geom=edges, offset=width, segments=segments, profile=0.5,
+                    affect='EDGES', clamp_overlap=True)
+    return bmesh_arrays(bm)
+
+
+def mesh_from_arrays(name, vertices, loop_verts, loop_totals, material=None, smooth=False):
+    """Create a mesh object from flat arrays, filled with foreach_set instead of from_pydata.
+
+    vertices    — (N, 3) coordinates
+    loop_verts  — vertex index of every face corner, faces stored back to back
+    loop_totals — corner count of each face
+    """
+    if _recorder is not None:
+        return _recorder('arrays', name, material, vertices=vertices, loop_verts=loop_verts,
+                         loop_totals=loop_totals, smooth=smooth)
+    mesh = fill_mesh(acquire_mesh(name), vertices, loop_verts, loop_totals)
+    obj = acquire_object(name, mesh)
     if material:
         obj.data.materials.append(material)
-    if bevel > 0:
-        mod = obj.modifiers.new("Bevel", 'BEVEL')
-        mod.width = bevel
-        mod.segments = 2
-        mod.limit_method = 'ANGLE'
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.modifier_apply(modifier="Bevel")
+    if smooth:
+        set_smooth(obj.data)
     return obj
 
 
+def fill_mesh(mesh, vertices, loop_verts, loop_totals):
+    """Load flat arrays (see mesh_from_arrays) into an empty mesh with foreach_set."""
+    verts = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+    loop_verts = np.asarray(loop_verts, dtype=np.int32).ravel()
+    loop_totals = np.asarray(loop_totals, dtype=np.int32).ravel()
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", verts.ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts)
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    if bpy.app.version < (4, 0, 0):
+        # Derived from loop_start (and read-only) from 4.0 on
+        mesh.polygons.foreach_set("loop_total", loop_totals)
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def bmesh_box(name, size, origin=(0, 0, 0), material=None, bevel=0.0):
+    """Axis-aligned box with optional bevel, filled from the shared BOX_LOOPS face template."""
+    if _recorder is not None:
+        return _recorder('box', name, material, size=size, origin=origin, bevel=bevel)
+    arrays = box_arrays(size, origin)
+    if bevel > 0:
+        arrays = bevel_arrays(*arrays, bevel, 2)
+    return mesh_from_arrays(name, *arrays, material)
+
+
+def merged_boxes(name, sizes, origins, material=None, bevel=0.0):
+    """Several boxes of one material as a single mesh object (steps, LED edges, ...)."""
+    arrays = boxes_arrays(sizes, origins)
+    if bevel > 0:
+        arrays = bevel_arrays(*arrays, bevel, 2)
+    return mesh_from_arrays(name, *arrays, material)
+
+
+def _copies(verts, loop_verts, loop_totals, offsets):
+    """One shape repeated at every offset, as the arrays of a single mesh."""
+    offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 3)
+    loops = loop_verts + len(verts) * np.arange(len(offsets), dtype=np.int32)[:, None]
+    return ((offsets[:, None, :] + verts).reshape(-1, 3), loops.ravel(),
+            np.tile(loop_totals, len(offsets)))
+
+
+def merged_spheres(name, radius, centers, material=None, segments=32, rings=16, smooth=False):
+    """Several equal UV spheres as a single mesh object (ornament rows, blossom clusters, ...)."""
+    return mesh_from_arrays(name, *_copies(*uv_sphere_arrays(radius, segments, rings), centers),
+                            material, smooth)
+
+
+def merged_prisms(name, radius, height, segments, origins, material=None):
+    """Several equal upright prisms standing on `origins` as a single mesh object (studs, cell rings)."""
+    return mesh_from_arrays(name, *_copies(*frustum_arrays(0, 0, 0, radius, radius, height, segments),
+                                           origins), material)
+
+
+def box_factory(size, bevel=0.0, material=None):
+    """bmesh_box specialised for one (size, bevel, material): returns build(name, center).
+
+    Built directly, every box of the combination is a new object linked to one
+    shared mesh centred on the origin (beveled once, in the bmesh). While a plan
+    records, each call is a single array add on the pre-scaled corners.
+    Make factories inside the builder that uses them; they hold on to `material`.
+    """
+    corners = BOX_CORNERS * (np.asarray(size, dtype=np.float32) / 2)
+    key = ('box', size, bevel, material)
+
+    def shared_mesh(name):
+        arrays = box_arrays(size, (0, 0, 0))
+        if bevel > 0:
+            arrays = bevel_arrays(*arrays, bevel, 2)
+        mesh = fill_mesh(acquire_mesh(name), *arrays)
+        if material:
+            mesh.materials.append(material)
+        return mesh
+
+    def build(name, center):
+        if _recorder is not None:
+            if bevel > 0:
+                return _recorder('box', name, material, size=size, origin=center, bevel=bevel)
+            verts = corners + np.asarray(center, dtype=np.float32)
+            return _recorder('arrays', name, material, vertices=verts, loop_verts=BOX_LOOPS,
+                             loop_totals=_BOX_TOTALS, smooth=False)
+        return instance_object(name, _prototype(key, lambda: shared_mesh(name)), center)
+    return build
+
+
+def prism_factory(radius, height, segments, material=None):
+    """bmesh_prism specialised for one (radius, height, segments, material): returns build(name, origin).
+
+    Shared like box_factory: one mesh standing on the origin for every prism
+    built directly, a single array add per prism while a plan records. Not
+    cached either, for the same reason.
+    """
+    arrays = frustum_arrays(0, 0, 0, radius, radius, height, segments)
+    key = ('prism', radius, height, segments, material)
+
+    def shared_mesh(name):
+        mesh = fill_mesh(acquire_mesh(name), *arrays)
+        if material:
+            mesh.materials.append(material)
+        return mesh
+
+    def build(name, origin):
+        if _recorder is not None:
+            verts = arrays[0] + np.asarray(origin, dtype=np.float32)
+            return _recorder('arrays', name, material, vertices=verts, loop_verts=arrays[1],
+                             loop_totals=arrays[2], smooth=False)
+        return instance_object(name, _prototype(key, lambda: shared_mesh(name)), origin)
+    return build
+
+
 def bmesh_prism(name, radius, height, segments, origin=(0, 0, 0), material=None, bevel=0.0):
-    """Polygonal prism (octagon, hexagon, etc) via bmesh."""
-    bm = bmesh.new()
-    ox, oy, oz = origin
-    bot, top = [], []
-    for i in range(segments):
-        a = (2 * math.pi * i) / segments
-        x, y = ox + radius * math.cos(a), oy + radius * math.sin(a)
-        bot.append(bm.verts.new((x, y, oz)))
-        top.append(bm.verts.new((x, y, oz + height)))
-    bm.faces.new(bot)
-    bm.faces.new(list(reversed(top)))
-    for i in range(segments):
-        j = (i + 1) % segments
-        bm.faces.new([bot[i], bot[j], top[j], top[i]])
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    mesh.update()
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    if material:
-        obj.data.materials.append(material)
+    """Polygonal prism (octagon, hexagon, etc) from frustum_arrays."""
+    if _recorder is not None:
+        return _recorder('prism', name, material, radius=radius, height=height,
+                         segments=segments, origin=origin, bevel=bevel)
+    arrays = frustum_arrays(*origin, radius, radius, height, segments)
     if bevel > 0:
-        mod = obj.modifiers.new("Bevel", 'BEVEL')
-        mod.width = bevel
-        mod.segments = 1
-        mod.limit_method = 'ANGLE'
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.modifier_apply(modifier="Bevel")
-    return obj
+        arrays = bevel_arrays(*arrays, bevel, 1)
+    return mesh_from_arrays(name, *arrays, material)
 
 
 def bmesh_cone(name, radius, height, segments, origin=(0, 0, 0), material=None, smooth=True):
-    """Cone via bmesh."""
-    bm = bmesh.new()
-    ox, oy, oz = origin
-    base = []
-    for i in range(segments):
-        a = (2 * math.pi * i) / segments
-        base.append(bm.verts.new((ox + radius * math.cos(a), oy + radius * math.sin(a), oz)))
-    apex = bm.verts.new((ox, oy, oz + height))
-    bm.faces.new(base)
-    for i in range(segments):
-        bm.faces.new([base[i], base[(i + 1) % segments], apex])
-    mesh = bpy.data.meshes.new(name)
+    """Cone from cone_arrays."""
+    if _recorder is not None:
+        return _recorder('cone', name, material, radius=radius, height=height,
+                         segments=segments, origin=origin, smooth=smooth)
+    return mesh_from_arrays(name, *cone_arrays(*origin, radius, height, segments), material, smooth)
+
+
+def extrude_ring(name, outer, inner, z0, z1, material=None, bevel=0.0):
+    """One mesh for a whole wall enclosure — the band between `outer` and `inner`
+    outlines (see rect_xy) extruded from z0 to z1, optionally beveled."""
+    if _recorder is not None:
+        return _recorder('ring', name, material, outer=outer, inner=inner, z0=z0, z1=z1,
+                         bevel=bevel)
+    arrays = ring_arrays(outer, inner, z0, z1)
+    if bevel > 0:
+        arrays = bevel_arrays(*arrays, bevel, 2)
+    return mesh_from_arrays(name, *arrays, material)
+
+
+def _prototype(key, build):
+    """Shared mesh for `key`, built on first use (or again if clear_scene freed it).
+
+    Inside a build scope the mesh is shared within that scope only, so
+    releasing the scope never empties a mesh something else still shows.
+    """
+    prototypes = _PROTOTYPES if _scope is None else _scope["prototypes"]
+    mesh = prototypes.get(key)
+    if mesh is not None:
+        try:
+            mesh.name
+            return mesh
+        except ReferenceError:
+            pass
+    mesh = prototypes[key] = build()
+    return mesh
+
+
+def cylinder_mesh(name, radius, depth, segments, material=None, smooth=False):
+    """Capped cylinder mesh centred on the origin — same geometry as primitive_cylinder_add."""
+    bm = scratch_bmesh()
+    bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=segments,
+                          radius1=radius, radius2=radius, depth=depth)
+    mesh = acquire_mesh(name)
     bm.to_mesh(mesh)
-    bm.free()
-    mesh.update()
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
     if material:
-        obj.data.materials.append(material)
+        mesh.materials.append(material)
+    if smooth:
+        set_smooth(mesh)
+    return mesh
+
+
+def uv_sphere_mesh(name, radius, segments=32, rings=16, material=None, smooth=False):
+    """UV sphere mesh centred on the origin — same geometry as primitive_uv_sphere_add."""
+    bm = scratch_bmesh()
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=rings, radius=radius)
+    mesh = acquire_mesh(name)
+    bm.to_mesh(mesh)
+    if material:
+        mesh.materials.append(material)
     if smooth:
-        for p in obj.data.polygons:
-            p.use_smooth = True
+        set_smooth(mesh)
+    return mesh
+
+
+def instance_object(name, mesh, location, rotation=None, scale=None):
+    """Link a new object using an existing mesh, placed like the primitive operators place theirs."""
+    obj = acquire_object(name, mesh)
+    obj.location = location
+    if rotation is not None:
+        obj.rotation_euler = rotation
+    if scale is not None:
+        obj.scale = scale
     return obj
 
 
-def pyramid_roof(name, w, d, h, overhang=0.15, origin=(0, 0, 0), material=None):
-    """Hipped roof with overhang using from_pydata."""
-    ox, oy, oz = origin
+def bmesh_cylinder(name, radius, depth, segments, origin=(0, 0, 0), material=None,
+                   rotation=None, smooth=False):
+    """Capped cylinder centred on origin, without going through bpy.ops.
+
+    Repeated calls with the same shape and material link a new object to one
+    shared mesh, so rows of posts or columns cost one mesh build in total.
+    """
+    if _recorder is not None:
+        return _recorder('cylinder', name, material, radius=radius, depth=depth, segments=segments,
+                         origin=origin, rotation=rotation, smooth=smooth)
+    mesh = _prototype(('cylinder', radius, depth, segments, material, smooth),
+                      lambda: cylinder_mesh(name, radius, depth, segments, material, smooth))
+    return instance_object(name, mesh, origin, rotation)
+
+
+def uv_sphere(name, radius, origin=(0, 0, 0), material=None, scale=None,
+              segments=32, rings=16, smooth=False):
+    """UV sphere centred on origin, without going through bpy.ops (mesh shared like bmesh_cylinder)."""
+    if _recorder is not None:
+        return _recorder('sphere', name, material, radius=radius, origin=origin, scale=scale,
+                         segments=segments, rings=rings, smooth=smooth)
+    mesh = _prototype(('sphere', radius, segments, rings, material, smooth),
+                      lambda: uv_sphere_mesh(name, radius, segments, rings, material, smooth))
+    return instance_object(name, mesh, origin, scale=scale)
+
+
+# Four eaves-to-ridge slopes plus the flat ridge cap of pyramid_roof
+_ROOF_LOOPS, _ROOF_TOTALS = face_loops([(0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),
+                                        (4, 5, 6, 7)])
+
+
+def pyramid_roof_arrays(w, d, h, overhang=0.15):
+    """pyramid_roof geometry centred on the origin as (vertices, loop_verts, loop_totals)."""
     hw, hd = w / 2 + overhang, d / 2 + overhang
     tw, td = 0.12, 0.12  # top ridge size
+    verts = np.array([
+        (-hw, -hd, 0), (hw, -hd, 0), (hw, hd, 0), (-hw, hd, 0),
+        (-tw, -td, h), (tw, -td, h), (tw, td, h), (-tw, td, h),
+    ], dtype=np.float32)
+    return verts, _ROOF_LOOPS, _ROOF_TOTALS
 
-    verts = [
-        (ox - hw, oy - hd, oz), (ox + hw, oy - hd, oz),
-        (ox + hw, oy + hd, oz), (ox - hw, oy + hd, oz),
-        (ox - tw, oy - td, oz + h), (ox + tw, oy - td, oz + h),
-        (ox + tw, oy + td, oz + h), (ox - tw, oy + td, oz + h),
-    ]
-    faces = [(0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7), (4, 5, 6, 7)]
-    obj = mesh_from_pydata(name, verts, faces, material)
-    for p in obj.data.polygons:
-        p.use_smooth = True
-    return obj
+
+def pyramid_roof(name, w, d, h, overhang=0.15, origin=(0, 0, 0), material=None):
+    """Hipped roof with overhang."""
+    verts, loop_verts, loop_totals = pyramid_roof_arrays(w, d, h, overhang)
+    return mesh_from_arrays(name, verts + np.asarray(origin, dtype=np.float32), loop_verts,
+                            loop_totals, material, smooth=True)
+
+
+def mesh_instances(name, vertices, loop_verts, loop_totals, placements, material=None, smooth=False):
+    """Place one mesh several times: one shared mesh, one linked object per placement.
+
+    placements — (label, location, z_rotation) per copy; objects are named f"{name}_{label}".
+    """
+    if _recorder is not None:
+        return _recorder('instances', name, material, vertices=vertices, loop_verts=loop_verts,
+                         loop_totals=loop_totals, placements=placements, smooth=smooth)
+    mesh = None
+    for label, location, rot_z in placements:
+        if mesh is None:
+            obj = mesh_from_arrays(f"{name}_{label}", vertices, loop_verts, loop_totals,
+                                   material, smooth)
+            mesh = obj.data
+        else:
+            obj = acquire_object(f"{name}_{label}", mesh)
+        obj.location = location
+        obj.rotation_euler = (0, 0, rot_z)
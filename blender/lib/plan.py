@@ -0,0 +1,283 @@
+"""
+Build plans — collect a builder's primitives first, create the Blender data afterwards.
+
+While a plan is recording, the lib.geometry builders append a Record instead
+of touching bpy. commit() then groups the records by kind:
+
+  box               unbeveled boxes merged into one mesh per material (foreach_set)
+  everything else   built one by one through lib.geometry (cylinders and
+                    spheres of the same shape share one mesh there)
+
+commit_merged() instead turns every record into flat arrays and uploads the
+whole plan as a single mesh: one material slot per material, a per-face
+material_index, and an int `part_id` face attribute indexing the object's
+"parts" list of record names, so individual pieces can still be selected.
+commit(fuse=...) does the same for chosen materials only, e.g. every gold
+hologram piece of a build as one wireframe mesh, and commit_by_material()
+for all of them: one object per material.
+"""
+
+import functools
+from collections import defaultdict, namedtuple
+
+import numpy as np
+from mathutils import Euler
+
+from lib import geometry
+
+Record = namedtuple("Record", "kind name material params")
+
+
+class BuildPlan:
+    """Ordered list of primitive records for one build."""
+
+    def __init__(self, name):
+        self.name = name
+        self.records = []
+
+    def record(self, kind, name, material, **params):
+        self.records.append(Record(kind, name, material, params))
+
+    def commit(self, fuse=None):
+        """Create every recorded primitive, one batched pass per kind.
+
+        fuse maps a material to a mesh name; every record using that material
+        is merged into that one mesh instead (as commit_merged does).
+        """
+        fuse = fuse or {}
+        groups = defaultdict(list)
+        fused = defaultdict(list)
+        for rec in self.records:
+            if rec.material in fuse:
+                fused[rec.material].append(rec)
+            else:
+                groups[rec.kind].append(rec)
+        for kind, recs in groups.items():
+            _COMMIT.get(kind, _commit_each)(self.name, recs)
+        for material, recs in fused.items():
+            _merge(fuse[material], recs)
+        self.records = []
+
+    def commit_by_material(self, fuse=None):
+        """Create one merged mesh object per material, named f"{plan}_{material}" or by fuse."""
+        fuse = fuse or {}
+        groups = defaultdict(list)
+        for rec in self.records:
+            groups[rec.material].append(rec)
+        for material, recs in groups.items():
+            label = material.name if material else "Plain"
+            _merge(fuse.get(material, f"{self.name}_{label}"), recs)
+        self.records = []
+
+    def commit_merged(self):
+        """Create every recorded primitive as one mesh object named after the plan."""
+        obj = _merge(self.name, self.records)
+        self.records = []
+        return obj
+
+
+def _merge(name, records):
+    """One mesh object holding all `records`: material slots, part_id face attribute."""
+    verts, loops, totals = [], [], []
+    smooth, mat_index, part_id = [], [], []
+    slots = {}  # material -> slot index, each material once in first-use order
+    offset = 0
+    boxes = _box_table(records)
+    for i, rec in enumerate(records):
+        if i in boxes:
+            v, lv, lt, sm = boxes[i], geometry.BOX_LOOPS, _BOX_TOTALS, False
+        else:
+            v, lv, lt, sm = _ARRAYS[rec.kind](rec.params)
+        slot = slots.setdefault(rec.material, len(slots))
+        verts.append(v)
+        loops.append(lv + offset)
+        totals.append(lt)
+        offset += len(v)
+        smooth.append(np.full(len(lt), sm, dtype=bool))
+        mat_index.append(np.full(len(lt), slot, dtype=np.int32))
+        part_id.append(np.full(len(lt), i, dtype=np.int32))
+
+    obj = geometry.mesh_from_arrays(name, np.concatenate(verts), np.concatenate(loops),
+                                    np.concatenate(totals))
+    mesh = obj.data
+    for mat in slots:
+        mesh.materials.append(mat)
+    mesh.polygons.foreach_set("material_index", np.concatenate(mat_index))
+    mesh.polygons.foreach_set("use_smooth", np.concatenate(smooth))
+    mesh.attributes.new("part_id", 'INT', 'FACE').data.foreach_set(
+        "value", np.concatenate(part_id))
+    obj["parts"] = [rec.name for rec in records]
+    return obj
+
+
+# ------------------------------------------------------------
+# record -> (vertices, loop_verts, loop_totals, smooth) for commit_merged
+# ------------------------------------------------------------
+def _placed(verts, origin, rotation=None, scale=None):
+    """Apply scale, then rotation, then translation — the order an object transform uses."""
+    if scale is not None:
+        verts = verts * np.asarray(scale, dtype=np.float32)
+    if rotation is not None:
+        verts = verts @ np.array(Euler(rotation).to_matrix(), dtype=np.float32).T
+    return verts + np.asarray(origin, dtype=np.float32)
+
+
+_BOX_TOTALS = np.full(6, 4, dtype=np.int32)
+
+
+def _box_table(records):
+    """Corners of every unbeveled box record from one (N, 3) size/origin table: {index: (8, 3)}."""
+    index = [i for i, rec in enumerate(records) if rec.kind == 'box' and rec.params['bevel'] <= 0]
+    if not index:
+        return {}
+    verts, _, _ = geometry.boxes_arrays([records[i].params['size'] for i in index],
+                                        [records[i].params['origin'] for i in index])
+    return dict(zip(index, verts.reshape(-1, 8, 3)))
+
+
+def _box_arrays(p):
+    v, lv, lt = geometry.box_arrays(p['size'], p['origin'])
+    if p['bevel'] > 0:
+        v, lv, lt = geometry.bevel_arrays(v, lv, lt, p['bevel'], 2)
+    return v, lv, lt, False
+
+
+def _prism_arrays(p):
+    ox, oy, oz = p['origin']
+    v, lv, lt = geometry.frustum_arrays(ox, oy, oz, p['radius'], p['radius'], p['height'],
+                                        p['segments'])
+    if p['bevel'] > 0:
+        v, lv, lt = geometry.bevel_arrays(v, lv, lt, p['bevel'], 1)
+    return v, lv, lt, False
+
+
+def _cone_arrays(p):
+    return geometry.cone_arrays(*p['origin'], p['radius'], p['height'], p['segments']) + (p['smooth'],)
+
+
+# Quarter turn about z for row vectors: frustum_arrays starts its ring at +x,
+# bmesh.ops.create_cone (and primitive_cylinder_add) at +y
+_QUARTER_TURN = np.array([[0, 1, 0], [-1, 0, 0], [0, 0, 1]], dtype=np.float32)
+
+
+def _cylinder_arrays(p):
+    d = p['depth']
+    v, lv, lt = geometry.frustum_arrays(0, 0, -d / 2, p['radius'], p['radius'], d, p['segments'])
+    return _placed(v @ _QUARTER_TURN, p['origin'], p['rotation']), lv, lt, p['smooth']
+
+
+def _sphere_arrays(p):
+    v, lv, lt = geometry.uv_sphere_arrays(p['radius'], p['segments'], p['rings'])
+    return _placed(v, p['origin'], scale=p['scale']), lv, lt, p['smooth']
+
+
+def _ring_arrays(p):
+    v, lv, lt = geometry.ring_arrays(p['outer'], p['inner'], p['z0'], p['z1'])
+    if p['bevel'] > 0:
+        v, lv, lt = geometry.bevel_arrays(v, lv, lt, p['bevel'], 2)
+    return v, lv, lt, False
+
+
+def _instances_arrays(p):
+    verts = np.asarray(p['vertices'], dtype=np.float32).reshape(-1, 3)
+    loop_verts = np.asarray(p['loop_verts'], dtype=np.int32).ravel()
+    loop_totals = np.asarray(p['loop_totals'], dtype=np.int32).ravel()
+    loc = np.array([pl[1] for pl in p['placements']], dtype=np.float32)[:, None, :]
+    rot = np.array([pl[2] for pl in p['placements']], dtype=np.float32)[:, None]
+    c, s = np.cos(rot), np.sin(rot)
+    placed = np.empty((len(loc), len(verts), 3), dtype=np.float32)
+    placed[..., 0] = c * verts[:, 0] - s * verts[:, 1]
+    placed[..., 1] = s * verts[:, 0] + c * verts[:, 1]
+    placed[..., 2] = verts[:, 2]
+    placed += loc
+    offsets = len(verts) * np.arange(len(loc), dtype=np.int32)[:, None]
+    return (placed.reshape(-1, 3), (loop_verts + offsets).ravel(),
+            np.tile(loop_totals, len(loc)), p['smooth'])
+
+
+def _pydata_arrays(p):
+    verts = np.asarray(p['vertices'], dtype=np.float32).reshape(-1, 3)
+    return (verts,) + geometry.face_loops(p['faces']) + (p['smooth'],)
+
+
+def _raw_arrays(p):
+    return (np.asarray(p['vertices'], dtype=np.float32).reshape(-1, 3),
+            np.asarray(p['loop_verts'], dtype=np.int32).ravel(),
+            np.asarray(p['loop_totals'], dtype=np.int32).ravel(), p['smooth'])
+
+
+_ARRAYS = {
+    'box': _box_arrays,
+    'prism': _prism_arrays,
+    'cone': _cone_arrays,
+    'cylinder': _cylinder_arrays,
+    'sphere': _sphere_arrays,
+    'ring': _ring_arrays,
+    'instances': _instances_arrays,
+    'pydata': _pydata_arrays,
+    'arrays': _raw_arrays,
+}
+
+
+# ------------------------------------------------------------
+# commit() batching
+# ------------------------------------------------------------
+def _commit_boxes(plan_name, records):
+    flat = defaultdict(list)
+    for rec in records:
+        if rec.params['bevel'] > 0:
+            # Beveled boxes keep their own object (and name)
+            geometry.bmesh_box(rec.name, material=rec.material, **rec.params)
+        else:
+            flat[rec.material].append(rec)
+    for material, recs in flat.items():
+        label = material.name if material else "Plain"
+        geometry.merged_boxes(f"{plan_name}_{label}", [r.params['size'] for r in recs],
+                              [r.params['origin'] for r in recs], material)
+
+
+def _commit_each(plan_name, records):
+    builders = {
+        'prism': geometry.bmesh_prism,
+        'cone': geometry.bmesh_cone,
+        'cylinder': geometry.bmesh_cylinder,
+        'sphere': geometry.uv_sphere,
+        'ring': geometry.extrude_ring,
+        'instances': geometry.mesh_instances,
+        'pydata': geometry.mesh_from_pydata,
+        'arrays': geometry.mesh_from_arrays,
+    }
+    for rec in records:
+        builders[rec.kind](rec.name, material=rec.material, **rec.params)
+
+
+_COMMIT = {
+    'box': _commit_boxes,
+}
+
+
+def planned(plan_name, merge=False, by_material=False, fuse=None):
+    """Decorator: run a `_build_<age>(m)` function as a plan — record everything, then commit once.
+
+    merge=True commits the whole build as a single mesh (commit_merged),
+    by_material=True as one mesh per material (commit_by_material).
+    fuse maps material keys of `m` to mesh names, e.g. {'gold': "HoloWireframe"}.
+    """
+    def wrap(build):
+        @functools.wraps(build)
+        def run(m):
+            plan = BuildPlan(plan_name)
+            geometry.set_recorder(plan.record)
+            try:
+                build(m)
+            finally:
+                geometry.set_recorder(None)
+            fused = {m[key]: name for key, name in (fuse or {}).items()}
+            if merge:
+                plan.commit_merged()
+            elif by_material:
+                plan.commit_by_material(fused)
+            else:
+                plan.commit(fused)
+        return run
+    return wrap
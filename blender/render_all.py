@@ -7,12 +7,22 @@ Usage:
   blender --background --python blender/render_all.py -- --ages stone,medieval
   blender --background --python blender/render_all.py -- --with-nations
   blender --background --python blender/render_all.py -- --buildings townCenter --ages medieval --with-nations
+  blender --background --python blender/render_all.py -- --buildings townCenter --nation greeks --jobs 5
+  blender --background --python blender/render_all.py -- --buildings townCenter --nation greeks --jobs 8 \
+      --blend-dir /tmp/tc_blends --no-render
+
+Each render runs in its own Blender process, so --jobs N simply keeps N of
+those processes going at once. With --blend-dir every process also saves its
+built scene as <dir>/<age>/<nation>/<building>.blend; add --no-render to only
+build, e.g. to generate all ages of a town center in parallel and append
+them afterwards with bpy.data.libraries.load.
 """
 
 import sys
 import os
 import argparse
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Project root
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -45,49 +55,66 @@ def parse_args():
     parser.add_argument("--with-nations", action="store_true", help="Also render nation color variants")
     parser.add_argument("--resolution", type=int, default=512, help="Resolution. Default: 512")
     parser.add_argument("--samples", type=int, default=128, help="Cycles samples (lower for batch). Default: 128")
+    parser.add_argument("--nation", default=None, help="Comma-separated nations to render (implies nation variants)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Blender processes to run at once (~5 is a good ceiling on CPU). Default: 1")
+    parser.add_argument("--blend-dir", default=None,
+                        help="Also save each built scene under this directory as .blend files")
+    parser.add_argument("--no-render", action="store_true",
+                        help="Only build (and save with --blend-dir), skip rendering")
     return parser.parse_args(argv)
 
 
+def _render(job, args):
+    """Run one render_building.py process; returns the finished CompletedProcess."""
+    age, building, nation = job
+    cmd = [
+        "blender", "--background", "--python", RENDER_SCRIPT, "--",
+        "--age", age,
+        "--building", building,
+        "--resolution", str(args.resolution),
+        "--samples", str(args.samples),
+    ]
+    if nation:
+        cmd.extend(["--nation", nation])
+    if args.blend_dir:
+        cmd.extend(["--blend", os.path.join(args.blend_dir, age, nation or "default", f"{building}.blend")])
+    if args.no_render:
+        cmd.append("--no-render")
+    return subprocess.run(cmd, capture_output=True, text=True)
+
+
 def main():
     args = parse_args()
 
     ages = args.ages.split(",") if args.ages else ALL_AGES
     buildings = args.buildings.split(",") if args.buildings else AVAILABLE_BUILDINGS
 
-    nations = ALL_NATIONS if args.with_nations else [None]
+    if args.nation:
+        nations = args.nation.split(",")
+    else:
+        nations = ALL_NATIONS if args.with_nations else [None]
 
-    total = len(ages) * len(buildings) * len(nations)
-    count = 0
+    jobs = [(age, building, nation) for age in ages for building in buildings for nation in nations]
+    total = len(jobs)
 
     print(f"=== Batch render: {len(buildings)} buildings × {len(ages)} ages × {len(nations)} nation variants = {total} renders ===")
 
-    for age in ages:
-        for building in buildings:
-            for nation in nations:
-                count += 1
-                nation_str = nation or "default"
-                print(f"\n[{count}/{total}] {building} | age={age} | nation={nation_str}")
-
-                cmd = [
-                    "blender", "--background", "--python", RENDER_SCRIPT, "--",
-                    "--age", age,
-                    "--building", building,
-                    "--resolution", str(args.resolution),
-                    "--samples", str(args.samples),
-                ]
-                if nation:
-                    cmd.extend(["--nation", nation])
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    print(f"  ERROR: {result.stderr[-500:] if result.stderr else 'unknown error'}")
-                else:
-                    # Extract the "Done!" line from output
-                    for line in result.stdout.split("\n"):
-                        if "Done!" in line:
-                            print(f"  {line.strip()}")
-
-    print(f"\n=== Batch complete: {count} renders ===")
+    # Threads only wait on the Blender subprocesses; results are reported in job order
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = pool.map(lambda job: _render(job, args), jobs)
+        for count, ((age, building, nation), result) in enumerate(zip(jobs, results), 1):
+            nation_str = nation or "default"
+            print(f"\n[{count}/{total}] {building} | age={age} | nation={nation_str}")
+            if result.returncode != 0:
+                print(f"  ERROR: {result.stderr[-500:] if result.stderr else 'unknown error'}")
+            else:
+                # Extract the "Done!" line from output
+                for line in result.stdout.split("\n"):
+                    if "Done!" in line:
+                        print(f"  {line.strip()}")
+
+    print(f"\n=== Batch complete: {total} renders ===")
 
 
 if __name__ == "__main__":
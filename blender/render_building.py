@@ -5,6 +5,7 @@ Usage:
   blender --background --python blender/render_building.py -- --age stone --building townCenter
   blender --background --python blender/render_building.py -- --age medieval --building townCenter --nation romans
   blender --background --python blender/render_building.py -- --age medieval --building townCenter --output /tmp/test.png
+  blender --background --python blender/render_building.py -- --age digital --building townCenter --nation greeks --blend /tmp/tc.blend --no-render
 """
 
 import sys
@@ -75,6 +76,10 @@ def parse_args():
                         help="Image resolution (square). Default: 1024")
     parser.add_argument("--samples", type=int, default=512,
                         help="Cycles samples. Default: 512")
+    parser.add_argument("--blend", default=None,
+                        help="Also save the built scene to this .blend file")
+    parser.add_argument("--no-render", action="store_true",
+                        help="Stop after building (and saving with --blend)")
     return parser.parse_args(argv)
 
 
@@ -128,6 +133,14 @@ def main():
     setup_camera()
     setup_compositing()
 
+    if args.blend:
+        os.makedirs(os.path.dirname(os.path.abspath(args.blend)), exist_ok=True)
+        bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.blend), copy=True)
+        print(f"Saved {args.blend}")
+    if args.no_render:
+        print(f"Done! {args.blend or 'built without rendering'}")
+        return
+
     # Render
     scene.render.filepath = output
     print(f"Rendering (Cycles {scene.cycles.samples} samples)...")